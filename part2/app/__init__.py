@@ -1,16 +1,28 @@
 import os
-from flask import Flask
-# from flask_restx import Api
-from .extensions import db, migrate, bcrypt, jwt
-from flask_restx import Api
-from app.api.v1.users import api as users_ns
-from app.api.v1.places import api as places_ns
-from app.api.v1.reviews import api as reviews_ns
-from app.api.v1.amenities import api as amenities_ns
-from app.api.v1.auth import api as auth_ns
-from .api.v1.admin import api as admin_ns
-from .init_db import create_default_admin
-from flask_cors import CORS
+from flask import Flask, g, request
+from .extensions import (db, migrate, bcrypt, jwt, cache, password_hasher,
+                         unit_of_work, token_revocations, response_cache,
+                         json_serializer, request_profiler, metrics,
+                         configure_sqlite_engines, init_engines)
+from .tokens import init_jwt
+from .api.v1.conditional import set_cache_control
+from .schema import check_schema
+
+# Importing the package stays cheap (models, CLI, tests): Flask-RESTx, the
+# API namespaces and the facade are imported by create_app
+
+MIGRATIONS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'migrations')
+
+
+def load_token_user(identity):
+    """User whose claims go into a new token, or None if unknown."""
+    from .services import facade
+    try:
+        return facade.get_user_data(identity)
+    except ValueError:
+        return None
+
 
 def create_app(config_class="config.DevelopmentConfig"):
     """
@@ -22,44 +34,95 @@ def create_app(config_class="config.DevelopmentConfig"):
 
     Returns:
         Flask: Configured Flask application instance.
+
+    Building the application has no side effects on the database: the
+    schema is created by migrations (`flask db upgrade`) and the default
+    admin by `flask create-admin`. Only the schema revision is checked
+    (SCHEMA_CHECK), except for databases created from the models
+    (SCHEMA_AUTO_CREATE, the in-memory test databases).
     """
+    from flask_cors import CORS
+    from flask_restx import Api
+    from .api.v1 import register_namespaces
+    from .cli import register_commands
+    from .services import facade
+
     app = Flask(__name__)
     CORS(app, supports_credentials=True)
     app.config.from_object(config_class)
 
     # Definir ruta absoluta para la base de datos
-    basedir = os.path.abspath(os.path.dirname(__file__))
-    db_path = os.path.join(os.path.dirname(basedir), 'hbnb.db')
-    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    # (los tests usan la base de datos de su propia configuración)
+    if not app.config.get('TESTING'):
+        basedir = os.path.abspath(os.path.dirname(__file__))
+        db_path = os.path.join(os.path.dirname(basedir), 'hbnb.db')
+        app.config['SQLALCHEMY_DATABASE_URI'] = (
+            os.getenv('DATABASE_URL') or f'sqlite:///{db_path}')
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
     # Inicializar todas las extensiones
+    configure_sqlite_engines(app)
     db.init_app(app)
-    migrate.init_app(app, db)
+    init_engines(app)
+    migrate.init_app(app, db, directory=MIGRATIONS_DIR)
     bcrypt.init_app(app)
+    password_hasher.init_app(app)
     jwt.init_app(app)
+    token_revocations.init_app(app)
+    init_jwt(jwt, token_revocations, load_token_user)
+    cache.init_app(app)
+    # Registered first: it times everything, including the cache and the
+    # commit of the unit of work
+    request_profiler.init_app(app)
+    metrics.init_app(app)
+    # Registered next: a cached response skips the other request hooks
+    response_cache.init_app(app)
+    register_commands(app)
+
+    # GET requests read from the read-only pool when one is configured
+    @app.before_request
+    def mark_read_only_session():
+        if request.method in ('GET', 'HEAD', 'OPTIONS'):
+            db.session.info['read_only'] = True
+
+    # Write requests run as one unit of work: a single commit, or a
+    # rollback when the response is an error
+    @app.before_request
+    def begin_unit_of_work():
+        if request.method not in ('GET', 'HEAD', 'OPTIONS'):
+            unit_of_work.begin()
+            g.unit_of_work = True
+
+    @app.after_request
+    def end_unit_of_work(response):
+        if g.pop('unit_of_work', False):
+            unit_of_work.end(success=response.status_code < 400)
+        return response
+
+    app.after_request(set_cache_control)
+
+    @app.teardown_request
+    def clear_read_only_session(exc):
+        if g.pop('unit_of_work', False):
+            unit_of_work.end(success=False)
+        db.session.info.pop('read_only', None)
 
     # Create API instance with Swagger documentation
     api = Api(app, version="1.0", title="HBnB API",
              description="HBnB Application API")
+    # Responses are encoded with orjson when available
+    json_serializer.init_app(app, api)
+
+    # Register the namespaces (API_NAMESPACES restricts them)
+    register_namespaces(api, app.config.get('API_NAMESPACES'))
+
+    # El catálogo de amenities se carga en memoria en el primer uso
+    facade.amenity_catalog.init_app(app)
+
+    if app.config.get('SCHEMA_AUTO_CREATE'):
+        with app.app_context():
+            db.create_all()
+    else:
+        check_schema(app, MIGRATIONS_DIR)
 
-    # Register all namespaces
-    api.add_namespace(users_ns, path="/api/v1/users")
-    api.add_namespace(places_ns, path="/api/v1/places")
-    api.add_namespace(reviews_ns)  # Remove path to allow both root and nested routes
-    api.add_namespace(amenities_ns, path="/api/v1/amenities")
-    api.add_namespace(auth_ns, path="/api/v1/auth")
-    api.add_namespace(admin_ns, path='/api/v1/admin')
-    
-    # Crear tablas y admin por defecto
-    with app.app_context():
-        # Primero crear todas las tablas
-        db.create_all()
-        
-        try:
-            # Luego intentar crear el admin
-            create_default_admin()
-        except Exception as e:
-            print(f"Error creating admin: {e}")
-    
     return app
\ No newline at end of file
@@ -1,23 +1,38 @@
 #!/usr/bin/env python3
-"""Initialize API v1 Blueprint"""
+"""
+API v1
 
-from flask_restx import Api
-from flask import Blueprint
+The namespaces of the API and the path each one is mounted at. Their
+modules are imported by `register_namespaces` when an application is
+built, not when the package is imported.
+"""
 
-# Crear el Blueprint para la API v1
-blueprint = Blueprint('api_v1', __name__)
-api = Api(blueprint, version='1.0', title='HBnB API', description='HolbertonBnB REST API')
+import importlib
 
-# Importar los namespaces
-from app.api.v1.reviews import api as reviews_ns
-from app.api.v1.users import api as users_ns
-from app.api.v1.places import api as places_ns
-from app.api.v1.amenities import api as amenities_ns
-from app.api.v1.auth import api as auth_ns
+# (module, mount path); None keeps the path declared by the namespace
+NAMESPACES = (
+    ('app.api.v1.users', '/api/v1/users'),
+    ('app.api.v1.places', '/api/v1/places'),
+    # Mounted at /api/v1 to serve both root and nested routes
+    ('app.api.v1.reviews', None),
+    ('app.api.v1.amenities', '/api/v1/amenities'),
+    ('app.api.v1.auth', '/api/v1/auth'),
+    ('app.api.v1.admin', '/api/v1/admin'),
+)
 
-# Agregar los namespaces a la API
-api.add_namespace(reviews_ns, path='/api/v1/reviews')
-api.add_namespace(users_ns, path='/api/v1/users')
-api.add_namespace(places_ns, path='/api/v1/places')
-api.add_namespace(amenities_ns, path='/api/v1/amenities')
-api.add_namespace(auth_ns, path='/api/v1/auth')
+
+def register_namespaces(api, names=None):
+    """
+    Import the namespaces and add them to a Flask-RESTx Api.
+
+    Args:
+        api: The Api to register them on.
+        names: Names of the namespaces to register (e.g. ['places',
+            'amenities']), every namespace when None. The modules of the
+            others are not imported.
+    """
+    for module_name, path in NAMESPACES:
+        if names is not None and module_name.rsplit('.', 1)[1] not in names:
+            continue
+        namespace = importlib.import_module(module_name).api
+        api.add_namespace(namespace, path=path)
@@ -6,53 +6,71 @@ Only users with `is_admin=True` can access these routes.
 
 Features:
 - Full CRUD operations for `Users`, `Places`, `Reviews`, and `Amenities`.
-- Restricted access to administrators via `is_admin()`.
+- Restricted access to administrators via `@admin_required()`, which reads
+  the role claims of the token instead of loading the user.
 - Structured exception handling with `werkzeug.exceptions`.
 - Uses `facade` for business logic execution.
 - OpenAPI documentation with `@api.expect` and `@api.response` annotations.
 
-All routes require `jwt_required()`, and a valid `Bearer Token` with admin privileges must be provided.
+All routes require a valid `Bearer Token` whose claims grant the admin role.
 """
 
+import io
 from flask import request
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import get_jwt_identity
 from flask_restx import Namespace, Resource, fields
 from werkzeug.exceptions import BadRequest, NotFound, Forbidden, InternalServerError
 from app.services import facade
+from app.extensions import cache, response_cache
+from app.tokens import admin_required
+from app.services.bulk_import import BATCH_SIZE, FORMATS, detect_format
+from app.models.user import User
+from app.persistence.pagination import MAX_PAGE_SIZE
 
 api = Namespace("admin", description="Admin operations")
 
-def is_admin() -> dict:
-    """
-    Verifies if the current user is an administrator.
-
-    Returns:
-    - `dict`: User data if the user is an admin.
-    
-    Raises:
-    - `Forbidden(403)`: If the user is not an administrator.
-    """
-    user = facade.get_user(get_jwt_identity())
-    if not user or not user.is_admin:
-        raise Forbidden("Admin privileges required")
-    return user
+# USERS CRUD
+@api.route('/users/')
+class AdminUserList(Resource):
+    @api.doc(params={
+        'limit': f'Maximum number of users to return (at most {MAX_PAGE_SIZE})',
+        'cursor': 'Cursor returned as next_cursor by the previous page',
+        'fields': 'Comma-separated keys to return, e.g. id,email '
+                  '(all by default); only those columns are loaded'})
+    @api.response(200, "Users retrieved successfully")
+    @api.response(400, "Invalid cursor or unknown field")
+    @api.response(403, "Permission denied")
+    @admin_required()
+    def get(self) -> dict:
+        """List users ordered by email (Admin only)."""
+        try:
+            fields = User.parse_fields(request.args.get('fields'))
+            page = facade.get_users_page(
+                limit=request.args.get('limit', type=int),
+                cursor=request.args.get('cursor'),
+                fields=fields)
+        except ValueError as e:  # InvalidCursor or unknown fields
+            raise BadRequest(str(e))
+        return {
+            "status": "success",
+            "data": [user.to_dict(fields=fields) for user in page.items],
+            "next_cursor": page.next_cursor
+        }, 200
 
 
-# USERS CRUD
 @api.route('/users/<string:user_id>')
 class AdminUserModify(Resource):
     @api.response(200, "User found")
     @api.response(403, "Permiso denegado")
     @api.response(404, "Usuario no encontrado") 
-    @jwt_required()
+    @admin_required()
     def get(self, user_id: str) -> dict:
         """Obtener un usuario por ID (Solo admin)."""
         try:
-            is_admin()
-            user = facade.get_user(user_id)
+            user = facade.get_user_data(user_id)
             if not user:
                 raise NotFound("Usuario no encontrado")
-            return {"status": "success", "data": user.to_dict()}, 200
+            return {"status": "success", "data": user}, 200
         except NotFound:
             raise NotFound("Usuario no encontrado")
         except Exception as e:
@@ -60,11 +78,10 @@ class AdminUserModify(Resource):
     @api.response(200, "User successfully updated")
     @api.response(403, "Permission denied")
     @api.response(404, "User not found")
-    @jwt_required()
+    @admin_required()
     def put(self, user_id: str) -> dict:
         """Update any user (Admin only)."""
         try:
-            is_admin()
             update_data = request.get_json()
             result = facade.update_user(user_id, update_data, admin_override=True)
             return {"status": "success", "data": result}, 200
@@ -78,7 +95,7 @@ class AdminUserModify(Resource):
     @api.response(200, "User successfully deleted")
     @api.response(403, "Permission denied")
     @api.response(404, "User not found")
-    @jwt_required()
+    @admin_required()
     def delete(self, user_id: str) -> dict:
         """Delete any user (Admin only)."""
         try:
@@ -105,11 +122,10 @@ class AdminPlaceModify(Resource):
     @api.response(200, "Place successfully updated")
     @api.response(403, "Permission denied")
     @api.response(404, "Place not found")
-    @jwt_required()
+    @admin_required()
     def put(self, place_id: str) -> dict:
         """Update any place (Admin only)."""
         try:
-            is_admin()
             update_data = request.get_json()
             result = facade.update_place(place_id, update_data)
             return {"status": "success", "data": result}, 200
@@ -123,11 +139,10 @@ class AdminPlaceModify(Resource):
     @api.response(200, "Place successfully deleted")
     @api.response(403, "Permission denied")
     @api.response(404, "Place not found")
-    @jwt_required()
+    @admin_required()
     def delete(self, place_id: str) -> dict:
         """Delete any place (Admin only)."""
         try:
-            is_admin()
             facade.delete_place(place_id)
             return {"status": "success", "message": "Place deleted"}, 200
         except NotFound:
@@ -142,11 +157,10 @@ class AdminReviewModify(Resource):
     @api.response(200, "Review successfully updated")
     @api.response(403, "Permission denied")
     @api.response(404, "Review not found")
-    @jwt_required()
+    @admin_required()
     def put(self, review_id: str) -> dict:
         """Update any review (Admin only)."""
         try:
-            is_admin()
             update_data = request.get_json()
             result = facade.update_review(review_id, update_data)
             return {"status": "success", "data": result}, 200
@@ -160,11 +174,10 @@ class AdminReviewModify(Resource):
     @api.response(200, "Review successfully deleted")
     @api.response(403, "Permission denied")
     @api.response(404, "Review not found")
-    @jwt_required()
+    @admin_required()
     def delete(self, review_id: str) -> dict:
         """Delete any review (Admin only)."""
         try:
-            is_admin()
             facade.delete_review(review_id)
             return {"status": "success", "message": "Review deleted"}, 200
         except NotFound:
@@ -173,17 +186,63 @@ class AdminReviewModify(Resource):
             raise InternalServerError(str(e))
 
 
+# CACHE STATISTICS
+@api.route('/cache/stats')
+class AdminCacheStats(Resource):
+    @api.response(200, "Cache statistics retrieved successfully")
+    @api.response(403, "Permission denied")
+    @admin_required()
+    def get(self) -> dict:
+        """Get the hit/miss counters of the entity cache (Admin only)."""
+        return {"status": "success", "data": cache.stats()}, 200
+
+
+@api.route('/cache/responses/stats')
+class AdminResponseCacheStats(Resource):
+    @api.response(200, "Response cache statistics retrieved successfully")
+    @api.response(403, "Permission denied")
+    @admin_required()
+    def get(self) -> dict:
+        """Get the hit ratio and bytes saved by the response cache (Admin only)."""
+        return {"status": "success", "data": response_cache.stats()}, 200
+
+
+# BULK IMPORT
+@api.route('/import/<string:kind>')
+@api.param('kind', 'amenities, places or reviews')
+class AdminBulkImport(Resource):
+    @api.doc(params={
+        'format': 'ndjson or csv (guessed from the Content-Type by default)',
+        'batch_size': f'Rows per transaction (default {BATCH_SIZE})'
+    })
+    @api.response(200, "Import finished; rejected rows are listed in the report")
+    @api.response(400, "Invalid kind or format")
+    @api.response(403, "Permission denied")
+    @admin_required()
+    def post(self, kind: str) -> dict:
+        """Stream NDJSON or CSV rows into the database (Admin only)."""
+        fmt = request.args.get('format') or detect_format(None, request.content_type)
+        if fmt not in FORMATS:
+            raise BadRequest(f"Unsupported format: {fmt}")
+        batch_size = request.args.get('batch_size', BATCH_SIZE, type=int)
+        lines = io.TextIOWrapper(request.stream, encoding='utf-8', newline='')
+        try:
+            report = facade.bulk_import(kind, lines, fmt, batch_size)
+        except ValueError as e:
+            raise BadRequest(str(e))
+        return {"status": "success", "data": report.to_dict()}, 200
+
+
 # AMENITIES CRUD
 @api.route('/amenities/<string:amenity_id>')
 class AdminAmenityModify(Resource):
     @api.response(200, "Amenity successfully updated")
     @api.response(403, "Permission denied")
     @api.response(404, "Amenity not found")
-    @jwt_required()
+    @admin_required()
     def put(self, amenity_id: str) -> dict:
         """Update any amenity (Admin only)."""
         try:
-            is_admin()
             update_data = request.get_json()
             result = facade.update_amenity(amenity_id, update_data)
             return {"status": "success", "data": result}, 200
@@ -197,11 +256,10 @@ class AdminAmenityModify(Resource):
     @api.response(200, "Amenity successfully deleted")
     @api.response(403, "Permission denied")
     @api.response(404, "Amenity not found")
-    @jwt_required()
+    @admin_required()
     def delete(self, amenity_id: str) -> dict:
         """Delete any amenity (Admin only)."""
         try:
-            is_admin()
             facade.delete_amenity(amenity_id)
             return {"status": "success", "message": "Amenity deleted"}, 200
         except NotFound:
@@ -12,11 +12,12 @@ Features:
 """
 
 from flask_restx import Namespace, Resource, fields
+from app.api.v1.conditional import conditional_get
 from app.services import facade
 from app.models.amenity import Amenity
-from flask_jwt_extended import jwt_required
+from app.tokens import admin_required
 from flask import request
-from werkzeug.exceptions import BadRequest, NotFound, Forbidden, InternalServerError
+from werkzeug.exceptions import NotFound, Forbidden, InternalServerError
 
 api = Namespace('amenities', description='Amenity operations')
 
@@ -26,6 +27,27 @@ amenity_model = api.model('Amenity', {
 })
 
 
+def list_amenities(args):
+    """
+    Build the amenity listing response from the query string arguments.
+
+    Shared by AmenityList.get and the ASGI handlers in `app.asgi`.
+
+    Returns:
+        tuple: (body, status code).
+    """
+    try:
+        fields = Amenity.parse_fields(args.get('fields'))
+    except ValueError as e:
+        return {"message": str(e)}, 400
+    amenities = facade.get_all_amenities_data()
+    if fields is not None:
+        # Served from the in-memory catalog: only the keys are dropped
+        amenities = [{name: amenity[name] for name in fields}
+                     for amenity in amenities]
+    return {"status": "success", "data": amenities}, 200
+
+
 @api.route('/')
 class AmenityList(Resource):
     @api.expect(amenity_model)
@@ -42,26 +64,23 @@ class AmenityList(Resource):
 
         return amenity.to_dict(), 201
 
+    @api.doc(params={'fields': 'Comma-separated keys to return (all by default)'})
     @api.response(200, "List of amenities retrieved successfully")
+    @api.response(304, 'Not modified since the cached copy (ETag)')
+    @api.response(400, 'Unknown field')
+    @conditional_get(facade.get_amenities_version)
     def get(self):
         """Retrieve all amenities (Public access)."""
         try:
-            amenities = facade.get_all_amenities()
-            return {
-                "status": "success",
-                "data": [amenity.to_dict() for amenity in amenities]
-            }, 200
+            return list_amenities(request.args)
         except Exception as e:
             raise InternalServerError(str(e))
 
 
 class AdminAmenityCreate(Resource):
-    @jwt_required()
+    @admin_required()
     def post(self):
         """Create a new amenity (Admins Only)."""
-        if not is_admin():
-            return {"error": "Admin privileges required"}, 403
-
         amenity_data = request.get_json()
         result = facade.create_amenity(amenity_data)
 
@@ -74,13 +93,15 @@ class AdminAmenityCreate(Resource):
 @api.route('/<amenity_id>')
 class AmenityResource(Resource):
     @api.response(200, 'Amenity details retrieved successfully')
+    @api.response(304, 'Not modified since the cached copy (ETag)')
     @api.response(404, 'Amenity not found')
+    @conditional_get(facade.get_amenity_version)
     def get(self, amenity_id):
         """Get amenity details by ID"""
-        amenity = facade.get_amenity(amenity_id)
-        if not amenity:
+        try:
+            return facade.get_amenity_data(amenity_id), 200
+        except ValueError:
             return {'error': 'Amenity not found'}, 404
-        return amenity.to_dict(), 200
 
     @api.expect(amenity_model)
     @api.response(200, 'Amenity updated successfully')
@@ -95,12 +116,9 @@ class AmenityResource(Resource):
 
 
 class AdminAmenityModify(Resource):
-    @jwt_required()
+    @admin_required()
     def put(self, amenity_id):
         """Modify an amenity (Admins Only)."""
-        if not is_admin():
-            return {"error": "Admin privileges required"}, 403
-
         update_data = request.get_json()
         result = facade.update_amenity(amenity_id, update_data)
 
@@ -1,7 +1,11 @@
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
+from flask_jwt_extended import (create_access_token, create_refresh_token,
+                                jwt_required, get_jwt, get_jwt_identity)
 from app.services import facade
-from werkzeug.exceptions import BadRequest, Unauthorized, InternalServerError
+from app.extensions import token_revocations
+from app.tokens import token_claims
+from werkzeug.exceptions import BadRequest, Unauthorized, InternalServerError, TooManyRequests
+from app.hashing import HashingOverloaded
 
 api = Namespace('auth', description='Authentication operations')
 
@@ -15,6 +19,7 @@ login_model = api.model('Login', {
 @api.route('/login')
 class Login(Resource):
     @api.expect(login_model, validate=True)
+    @api.response(429, 'Too many logins in progress, retry later')
     def post(self):
         """Authenticate user and return a JWT token"""
         try:
@@ -25,19 +30,23 @@ class Login(Resource):
                 raise ValueError(
                     "Both 'email' and 'password' fields are required.")
 
-            # 🔹 Recuperar el usuario
-            user = facade.get_user_by_email(credentials['email'])
-
-            # 🔹 Verificar credenciales
-            if not user or not user.verify_password(credentials['password']):
+            # 🔹 Recuperar el usuario y verificar credenciales
+            user = facade.authenticate(credentials['email'],
+                                       credentials['password'])
+            if not user:
                 raise Unauthorized({
                     "message": {"The provided email or password is incorrect."
                                 }
                 })
 
-            # 🔹 Crear el token si todo es válido
-            access_token = create_access_token(identity=str(user.id))
-            return {"status": "success", "access_token": access_token}, 200
+            # 🔹 Crear los tokens si todo es válido (los roles van en los claims)
+            claims = token_claims(user.to_dict())
+            access_token = create_access_token(identity=str(user.id),
+                                               additional_claims=claims)
+            refresh_token = create_refresh_token(identity=str(user.id),
+                                                 additional_claims=claims)
+            return {"status": "success", "access_token": access_token,
+                    "refresh_token": refresh_token}, 200
 
         except ValueError as e:
             raise BadRequest(
@@ -47,6 +56,11 @@ class Login(Resource):
             raise Unauthorized(
                 {"message": {"status": "error", "message": str(e)}})
 
+        except HashingOverloaded as e:
+            raise TooManyRequests(
+                {"message": {"status": "error", "message": str(e)}},
+                retry_after=1)
+
         except Exception as e:
             raise InternalServerError({
                 "message": {
@@ -57,13 +71,39 @@ class Login(Resource):
             })
 
 
+@api.route('/refresh')
+class Refresh(Resource):
+    @api.response(200, 'New access token issued')
+    @api.response(401, 'Invalid, expired or revoked refresh token')
+    @jwt_required(refresh=True)
+    def post(self):
+        """Issue a new access token with the user's current roles"""
+        try:
+            user = facade.get_user_data(get_jwt_identity())
+        except ValueError:
+            raise Unauthorized("User no longer exists")
+        access_token = create_access_token(identity=user['id'],
+                                           additional_claims=token_claims(user))
+        return {"status": "success", "access_token": access_token}, 200
+
+
+@api.route('/logout')
+class Logout(Resource):
+    @api.response(200, 'Token revoked')
+    @jwt_required(verify_type=False)
+    def post(self):
+        """Revoke the access or refresh token sent with the request"""
+        token_revocations.revoke(get_jwt())
+        return {"status": "success", "message": "Token revoked"}, 200
+
+
 @api.route('/protected')
 class ProtectedResource(Resource):
     @jwt_required()
     def get(self):
         """A protected endpoint that requires a valid JWT token"""
         current_user = get_jwt_identity()  # Retrieve the user's identity from the token
-        user = facade.get_user(current_user)
+        user = facade.get_user_data(current_user)
 
         if not user:
             return {"error": "User not found"}, 404
@@ -71,7 +111,7 @@ class ProtectedResource(Resource):
         return {
             "message": [
                 "Hello, user:",
-                f"Name: {user.first_name} {user.last_name}",
-                f"ID: {user.id}"
+                f"Name: {user['first_name']} {user['last_name']}",
+                f"ID: {user['id']}"
             ]
         }, 200
@@ -0,0 +1,133 @@
+"""
+Conditional GET Module
+
+Lets clients revalidate what they already have instead of downloading it
+again. A GET handler decorated with `conditional_get(version)` first asks
+`version(*args)` for the resource's version, a cheap lookup (the
+`updated_at` of one row, or aggregates such as the count and latest
+`updated_at` of a collection), and derives from it:
+    - a strong ETag, which also covers the query string, since that selects
+      the representation (page, limit...);
+    - Last-Modified, when the version includes a modification date that
+      also changes on deletions.
+When the request's If-None-Match (or, without one, If-Modified-Since)
+matches, the handler is skipped and a 304 with no body is returned, so
+nothing is loaded or serialized. Otherwise the validators are added to the
+handler's 200 response.
+
+`set_cache_control` adds the Cache-Control of the endpoint's namespace to
+GET responses (HTTP_CACHE_CONTROL config key, e.g. `no-cache` to make
+clients revalidate on every use, or `max-age=60`).
+
+The async handlers of `app.asgi` apply the same rules through
+`revalidate` and `cache_control`, which do not need a Flask request.
+"""
+
+import functools
+import hashlib
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from flask import Response, current_app, request
+from werkzeug.http import http_date
+
+# Part of every ETag: bump it when a representation changes shape
+REPRESENTATION_VERSION = 1
+
+
+def make_etag(parts: Tuple[Any, ...], path: str, args) -> str:
+    """Strong ETag of the representation selected by a path and query."""
+    key = repr((REPRESENTATION_VERSION, parts, path,
+                sorted(args.items(multi=True))))
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # Stored dates are naive UTC; HTTP dates have a one-second resolution
+    return moment.replace(tzinfo=timezone.utc, microsecond=0)
+
+
+def is_fresh(etag: str, last_modified: Optional[datetime],
+             if_none_match, if_modified_since: Optional[datetime]) -> bool:
+    """Whether the client's cached copy matches the current version."""
+    if if_none_match:
+        # If-None-Match uses the weak comparison (RFC 7232, 3.2)
+        return if_none_match.contains_weak(etag)
+    if if_modified_since and last_modified:
+        return _as_utc(last_modified) <= if_modified_since
+    return False
+
+
+def revalidate(current: Tuple, path: str, args, if_none_match,
+               if_modified_since: Optional[datetime]) -> Tuple[Dict[str, str], bool]:
+    """
+    Validators of a version of the representation of a request, and whether
+    the client's copy is current.
+
+    Args:
+        current: `(parts, last_modified)`, as returned by a version function
+        path, args: Path and query string arguments of the request
+        if_none_match: Parsed If-None-Match (werkzeug ETags)
+        if_modified_since: Parsed If-Modified-Since, or None
+
+    Returns:
+        tuple: (ETag and Last-Modified headers, fresh)
+    """
+    parts, last_modified = current
+    etag = make_etag(parts, path, args)
+    headers = {'ETag': f'"{etag}"'}
+    if last_modified:
+        headers['Last-Modified'] = http_date(_as_utc(last_modified))
+    return headers, is_fresh(etag, last_modified, if_none_match,
+                             if_modified_since)
+
+
+def conditional_get(version: Callable[..., Optional[Tuple]]):
+    """
+    Answer GETs with 304 Not Modified when the client's copy is current.
+
+    `version` receives the handler's arguments (without the resource) and
+    returns `(parts, last_modified)`: a tuple of values that change with the
+    representation and an optional naive UTC datetime. It returns None when
+    the resource does not exist; the handler then runs normally (and
+    answers 404).
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(resource, *args, **kwargs):
+            current = version(*args, **kwargs)
+            if current is None:
+                return fn(resource, *args, **kwargs)
+            headers, fresh = revalidate(current, request.path, request.args,
+                                        request.if_none_match,
+                                        request.if_modified_since)
+            if fresh:
+                return Response(status=304, headers=headers)
+
+            rv = fn(resource, *args, **kwargs)
+            if isinstance(rv, Response):
+                return rv
+            if not isinstance(rv, tuple):
+                rv = (rv,)
+            body, status, extra = rv + (200, None)[len(rv) - 1:]
+            if status == 200:
+                extra = dict(extra or {}, **headers)
+            return body, status, extra
+        return wrapper
+    return decorator
+
+
+def cache_control(namespace: str) -> Optional[str]:
+    """Cache-Control of the GET responses of a namespace, if configured."""
+    return current_app.config.get('HTTP_CACHE_CONTROL', {}).get(namespace)
+
+
+def set_cache_control(response: Response) -> Response:
+    """after_request hook: Cache-Control of the endpoint's namespace."""
+    if (request.method in ('GET', 'HEAD') and response.status_code in (200, 304)
+            and request.endpoint and 'Cache-Control' not in response.headers):
+        # Flask-RESTx endpoints are named <namespace>_<resource>
+        value = cache_control(request.endpoint.partition('_')[0])
+        if value:
+            response.headers['Cache-Control'] = value
+    return response
@@ -7,10 +7,15 @@ to define the routes and handle HTTP requests, providing a RESTful
 interface for place management.
 """
 
+import math
+
 from flask_restx import Namespace, Resource, fields
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
+from app.api.v1.conditional import conditional_get
 from app.services import facade
 from app.models.place import Place
+from app.models.review import Review
+from app.persistence.pagination import InvalidCursor, MAX_PAGE_SIZE
 from flask import request
 from werkzeug.exceptions import BadRequest, NotFound, Forbidden, InternalServerError
 api = Namespace('places', description='Place operations')
@@ -41,6 +46,86 @@ place_model = api.model('Place', {
 })
 
 
+def _number(args, name, type=float):
+    """
+    Parse an optional numeric query string argument.
+
+    Raises:
+        ValueError: If the argument is present but not a finite number.
+    """
+    value = args.get(name)
+    if value is None:
+        return None
+    try:
+        number = type(value)
+        if math.isfinite(number):
+            return number
+    except ValueError:
+        pass
+    kind = 'an integer' if type is int else 'a number'
+    raise ValueError(f"{name} must be {kind}.")
+
+
+def list_places(args):
+    """
+    Build the place listing response from the query string arguments.
+
+    Shared by PlaceList.get and the ASGI handlers in `app.asgi`.
+
+    Returns:
+        tuple: (body, status code).
+    """
+    amenity_ids = [amenity_id.strip()
+                   for value in args.getlist('amenities')
+                   for amenity_id in value.split(',') if amenity_id.strip()]
+
+    try:
+        filters = dict(
+            min_price=_number(args, 'min_price'),
+            max_price=_number(args, 'max_price'),
+            amenity_ids=amenity_ids,
+            min_lat=_number(args, 'min_lat'),
+            max_lat=_number(args, 'max_lat'),
+            min_lon=_number(args, 'min_lon'),
+            max_lon=_number(args, 'max_lon'),
+            title=args.get('title'),
+            owner_id=args.get('owner_id'),
+            min_rating=_number(args, 'min_rating'))
+        fields = Place.parse_fields(args.get('fields'))
+        if 'near' in args:
+            try:
+                lat, lon = (float(v) for v in args['near'].split(','))
+            except ValueError:
+                raise ValueError(
+                    "near must be a valid 'latitude,longitude' pair.")
+            page = facade.search_places_nearby(
+                lat, lon,
+                radius_km=_number(args, 'radius_km'),
+                nearest=_number(args, 'nearest', type=int),
+                limit=args.get('limit', type=int),
+                cursor=args.get('cursor'),
+                fields=fields,
+                **filters)
+            data = [dict(place.to_dict(fields), distance_km=round(distance, 3))
+                    for place, distance in page.items]
+        else:
+            page = facade.search_places(
+                limit=args.get('limit', type=int),
+                cursor=args.get('cursor'),
+                sort=args.get('sort', 'created_at'),
+                fields=fields,
+                **filters)
+            data = [place.to_dict(fields) for place in page.items]
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}, 400
+
+    return {
+        "status": "success",
+        "data": data,
+        "next_cursor": page.next_cursor
+    }, 200
+
+
 @api.route('/')
 class PlaceList(Resource):
     """Resource for creating and listing places."""
@@ -92,19 +177,80 @@ class PlaceList(Resource):
                 "message": f"Internal server error: {str(e)}"
             }, 500
 
+    @api.doc(params={
+        'limit': f'Maximum number of places to return (at most {MAX_PAGE_SIZE})',
+        'cursor': 'Cursor returned as next_cursor by the previous page',
+        'sort': 'created_at (default), -created_at, price, -price, rating or -rating',
+        'min_rating': 'Minimum average rating',
+        'min_price': 'Minimum price per night',
+        'max_price': 'Maximum price per night',
+        'amenities': "Comma-separated amenity ID's the place must offer (all of them)",
+        'min_lat': 'Southern edge of the bounding box',
+        'max_lat': 'Northern edge of the bounding box',
+        'min_lon': 'Western edge of the bounding box',
+        'max_lon': 'Eastern edge of the bounding box',
+        'title': 'Text the title must contain',
+        'owner_id': 'ID of the owner',
+        'near': "'latitude,longitude' to search around; results are ordered by distance",
+        'radius_km': 'With near: search radius in kilometers (at most 300)',
+        'nearest': 'With near: number of closest places to return',
+        'fields': 'Comma-separated keys to return, e.g. id,title,price '
+                  '(all by default); only those columns are loaded'})
     @api.response(200, 'List of places retrieved successfully')
+    @api.response(400, 'Invalid filter or pagination cursor')
     def get(self):
-        """Retrieve a list of all places (Public access)."""
-        min_price = request.args.get('min_price', type=float)
-        max_price = request.args.get('max_price', type=float)
+        """Retrieve a page of places matching the filters (Public access)."""
+        return list_places(request.args)
 
-        if min_price and max_price:
-            places = facade.get_places_by_price_range(min_price, max_price)
-        else:
-            places = facade.get_all_places()
 
-        return {"status": "success", "data": [
-            place.to_dict() for place in places]}, 200
+def search_places(args):
+    """
+    Build the full-text search response from the query string arguments.
+
+    Shared by PlaceSearch.get and the ASGI handlers in `app.asgi`.
+
+    Returns:
+        tuple: (body, status code).
+    """
+    try:
+        fields = Place.parse_fields(args.get('fields'))
+        page = facade.search_places_text(
+            args.get('q', ''),
+            limit=args.get('limit', type=int),
+            cursor=args.get('cursor'),
+            fields=fields)
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}, 400
+
+    return {
+        "status": "success",
+        "data": [dict(place.to_dict(fields), score=round(-rank, 3),
+                      snippet=snippet)
+                 for place, rank, snippet in page.items],
+        "next_cursor": page.next_cursor,
+        "truncated": page.truncated
+    }, 200
+
+
+@api.route('/search')
+class PlaceSearch(Resource):
+    """Resource for the full-text search of places."""
+
+    @api.doc(params={
+        'q': 'Words the title, description or a review of the place must '
+             'all contain',
+        'limit': f'Maximum number of places to return (at most {MAX_PAGE_SIZE})',
+        'cursor': 'Cursor returned as next_cursor by the previous page',
+        'fields': 'Comma-separated keys to return (all by default); score '
+                  'and snippet are always returned'})
+    @api.response(200, 'Matching places, best match first, with a snippet '
+                       'of the match (HTML, terms in <mark>); truncated is '
+                       'true when SEARCH_CANDIDATES capped the ranked '
+                       'matches to the newest ones')
+    @api.response(400, 'Query without words or invalid pagination cursor')
+    def get(self):
+        """Search places by the words of their text and reviews (Public access)."""
+        return search_places(request.args)
 
 
 @api.route('/<place_id>')
@@ -112,13 +258,15 @@ class PlaceResource(Resource):
     """Resource for retrieving and updating a specific place."""
 
     @api.response(200, 'Place details retrieved successfully')
+    @api.response(304, 'Not modified since the cached copy (ETag)')
     @api.response(404, 'Place not found')
+    @conditional_get(facade.get_place_version)
     def get(self, place_id):
         """Get place details by ID (Public access)."""
-        place = facade.get_place(place_id)
-        if not place:
+        try:
+            return facade.get_place_data(place_id), 200
+        except ValueError:
             return {'error': 'Place not found'}, 404
-        return place.to_dict(), 200
 
     @jwt_required()
     @api.response(200, "Place updated successfully")
@@ -127,16 +275,14 @@ class PlaceResource(Resource):
     def put(self, place_id: str) -> dict:
         """Update place details (Owners and admins can modify places)."""
         try:
-            current_user = facade.get_user(get_jwt_identity())
-            if not current_user:
-                return {"error": "User not found"}, 404
-
-            place = facade.get_place(place_id)
+            place = facade.get_place_data(place_id)
             if not place:
                 return {"error": "Place not found"}, 404
 
             # Permitir modificación si es admin o dueño del lugar
-            if not current_user.is_admin and place.owner_id != current_user.id:
+            # (decidido con los claims del token, sin cargar el usuario)
+            if (not get_jwt().get("is_admin")
+                    and place["owner_id"] != get_jwt_identity()):
                 return {"error": "Unauthorized action"}, 403
 
             update_data = request.get_json()
@@ -146,27 +292,58 @@ class PlaceResource(Resource):
             return {"error": str(e)}, 500
 
 
+def place_reviews(place_id, args):
+    """
+    Build the page of reviews of a place from the query string arguments.
+
+    Returns:
+        tuple: (body, status code), and the X-Next-Cursor header on success.
+    """
+    try:
+        fields = Review.parse_fields(args.get('fields'))
+    except ValueError as e:
+        return {"status": "error", "message": str(e)}, 400
+
+    try:
+        # Verificar que el lugar existe
+        place = facade.get_place(place_id)
+        if not place:
+            return {'error': 'Place not found'}, 404
+
+        # Obtener las reviews
+        page = facade.get_reviews_by_place(
+            place_id,
+            limit=args.get('limit', type=int),
+            cursor=args.get('cursor'),
+            fields=fields)
+        headers = {'X-Next-Cursor': page.next_cursor} if page.next_cursor else {}
+        return {
+            "status": "success",
+            "data": {
+                "reviews": [review.to_dict(fields) for review in page.items],
+                "next_cursor": page.next_cursor
+            }
+        }, 200, headers
+    except InvalidCursor as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }, 400
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }, 500
+
+
 @api.route('/<place_id>/reviews')
 class PlaceReviews(Resource):
-    @api.doc('get_place_reviews')
+    @api.doc('get_place_reviews', params={
+        'limit': 'Maximum number of reviews to return',
+        'cursor': 'Cursor returned as next_cursor (and in X-Next-Cursor) by the previous page',
+        'fields': 'Comma-separated keys to return (all by default)'})
+    @api.response(304, 'Not modified since the cached copy (ETag)')
+    @conditional_get(facade.get_place_reviews_version)
     def get(self, place_id):
-        """Get all reviews for a specific place"""
-        try:
-            # Verificar que el lugar existe
-            place = facade.get_place(place_id)
-            if not place:
-                return {'error': 'Place not found'}, 404
-
-            # Obtener las reviews
-            reviews = facade.get_reviews_by_place(place_id)
-            return {
-                "status": "success",
-                "data": {
-                    "reviews": [review.to_dict() for review in reviews]
-                }
-            }, 200
-        except Exception as e:
-            return {
-                "status": "error",
-                "message": str(e)
-            }, 500
+        """Get a page of reviews for a specific place"""
+        return place_reviews(place_id, request.args)
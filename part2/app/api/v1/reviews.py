@@ -8,6 +8,7 @@ interface for review management.
 """
 
 from flask_restx import Namespace, Resource, fields
+from app.api.v1.conditional import conditional_get
 from app.services import facade
 import uuid
 from flask_jwt_extended import jwt_required, get_jwt_identity
@@ -102,13 +103,15 @@ class ReviewResource(Resource):
     """
 
     @api.response(200, 'Review details retrieved successfully')
+    @api.response(304, 'Not modified since the cached copy (ETag)')
     @api.response(404, 'Review not found')
+    @conditional_get(facade.get_review_version)
     def get(self, review_id):
         """Get review details by ID."""
-        review = facade.get_review(review_id)
-        if not review:
+        try:
+            return facade.get_review_data(review_id), 200
+        except ValueError:
             return {'error': 'Review not found'}, 404
-        return review.to_dict(), 200
 
     @jwt_required()
     @api.expect(review_model, validate=True)
@@ -151,15 +154,6 @@ class ReviewResource(Resource):
 
 @api.route('/places/<place_id>/reviews')
 class PlaceReviews(Resource):
-    @api.doc('get_place_reviews')
-    def get(self, place_id):
-        """Get all reviews for a specific place"""
-        try:
-            reviews = facade.get_reviews_by_place(place_id)
-            return [review.to_dict() for review in reviews], 200
-        except Exception as e:
-            return {"error": str(e)}, 500
-
     @api.doc('create_place_review')
     @api.expect(review_model)
     @jwt_required()
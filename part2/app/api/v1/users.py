@@ -16,7 +16,8 @@ from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from app.services import facade
 from flask import request
-from werkzeug.exceptions import BadRequest, Forbidden, Conflict, InternalServerError, NotFound
+from werkzeug.exceptions import BadRequest, Forbidden, Conflict, InternalServerError, NotFound, TooManyRequests
+from app.hashing import HashingOverloaded
 
 api = Namespace('users', description='User operations')
 
@@ -38,6 +39,7 @@ class UserList(Resource):
     @api.response(400, 'Invalid input data')
     @api.response(409, 'User already exists')
     @api.response(403, 'Permission denied')
+    @api.response(429, 'Too many registrations in progress, retry later')
     def post(self):
         """Register a new user."""
         try:
@@ -69,6 +71,14 @@ class UserList(Resource):
                     "details": str(e)
                 }
             })
+        except HashingOverloaded as e:
+            raise TooManyRequests({
+                "message": {
+                    "status": "error",
+                    "message": "Server busy",
+                    "details": str(e)
+                }
+            }, retry_after=1)
         except Exception as e:
             raise InternalServerError({
                 "message": {
@@ -92,8 +102,8 @@ class UserResource(Resource):
         try:
             if user_id != get_jwt_identity():
                 raise Forbidden("Users can only access their own profile")
-            user = facade.get_user(user_id)
-            return {"status": "success", "data": user.to_dict()}, 200
+            user = facade.get_user_data(user_id)
+            return {"status": "success", "data": user}, 200
         except NotFound:
             raise NotFound("User not found")
         except Exception as e:
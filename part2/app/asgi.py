@@ -0,0 +1,278 @@
+"""
+ASGI entry point for the HBnB API.
+
+The public read endpoints (place listing, search and details, place
+reviews, amenities, reviews) are served by async handlers over an async SQLAlchemy
+engine (aiosqlite for SQLite). They do not reimplement any query: each
+handler runs the same facade and resource helpers as the Flask app through
+`AsyncSession.run_sync`, with the async session's sync facade bound as
+`db.session`, so database I/O waits on the event loop instead of blocking a
+thread. Requests are matched against the Flask URL map, so the URLs are
+the same in both serving modes. Every other route (writes, authentication,
+admin, Swagger UI) and every non-GET request is forwarded to the Flask application in a thread pool. The async handlers
+answer conditional GETs and set Cache-Control like the Flask resources (see
+`app.api.v1.conditional`), and are counted and timed in the request
+metrics like the Flask routes. The async engine runs the same
+SQLITE_PRAGMAS as the Flask engines. It is the only engine the handlers
+use, so their reads go to the primary database rather than the replicas or
+the read-only pool. They also bypass the response cache and the
+Server-Timing profiler, which are hooks of the Flask request.
+
+Run with::
+
+    uvicorn asgi:app
+
+Configuration (Flask config keys):
+    ASYNC_DATABASE_URI (str): Async database URL; by default the
+        SQLALCHEMY_DATABASE_URI with the sqlite+aiosqlite driver.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl
+
+from asgiref.wsgi import WsgiToAsgi
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import parse_date, parse_etags
+
+from app import create_app
+from app.api.v1.conditional import cache_control, revalidate
+from app.api.v1.amenities import list_amenities
+from app.api.v1.places import list_places, place_reviews, search_places
+from app.extensions import db, install_pragmas, json_serializer
+from app.services import facade
+
+
+def async_database_uri(uri: str) -> str:
+    """Return the async driver URL for a synchronous database URL."""
+    url = make_url(uri)
+    if url.drivername in ('sqlite', 'sqlite+pysqlite'):
+        url = url.set(drivername='sqlite+aiosqlite')
+    return url.render_as_string(hide_password=False)
+
+
+# --------------------------------------------
+# HANDLERS
+# --------------------------------------------
+# Each handler runs synchronously inside `run_sync` and returns
+# (body, status) or (body, status, headers); they mirror the Flask-RESTx resources of the same routes.
+
+def _place_list(args):
+    return list_places(args)
+
+
+def _place_search(args):
+    return search_places(args)
+
+
+def _place_detail(args, place_id):
+    try:
+        return facade.get_place_data(place_id), 200
+    except ValueError:
+        return {'error': 'Place not found'}, 404
+
+
+def _place_reviews(args, place_id):
+    return place_reviews(place_id, args)
+
+
+def _amenity_list(args):
+    return list_amenities(args)
+
+
+def _amenity_detail(args, amenity_id):
+    try:
+        return facade.get_amenity_data(amenity_id), 200
+    except ValueError:
+        return {'error': 'Amenity not found'}, 404
+
+
+def _review_detail(args, review_id):
+    try:
+        return facade.get_review_data(review_id), 200
+    except ValueError:
+        return {'error': 'Review not found'}, 404
+
+
+# Versions of the resources answering conditional GETs, as the Flask
+# resources are decorated with `conditional_get`
+VERSIONS = {
+    _place_detail: facade.get_place_version,
+    _place_reviews: facade.get_place_reviews_version,
+    _amenity_list: facade.get_amenities_version,
+    _amenity_detail: facade.get_amenity_version,
+    _review_detail: facade.get_review_version,
+}
+
+
+def _serve(handler, namespace, path, args, conditions, kwargs):
+    """
+    Run a handler like the Flask app runs a GET: 304 when the client's copy
+    is current, else the handler's response with the validators, and the
+    Cache-Control of the namespace.
+
+    Returns:
+        tuple: (body, status, headers); the body is None for a 304.
+    """
+    version = VERSIONS.get(handler)
+    current = version(**kwargs) if version else None
+    headers, fresh = (revalidate(current, path, args, *conditions)
+                      if current is not None else ({}, False))
+    if fresh:
+        body, status = None, 304
+    else:
+        body, status, *extra = handler(args, **kwargs)
+        headers = dict(headers, **extra[0]) if extra else headers
+        if status != 200:
+            headers = {}
+    value = cache_control(namespace)
+    if value and status in (200, 304):
+        headers['Cache-Control'] = value
+    return body, status, headers
+
+
+# Async handlers by Flask endpoint: requests are matched against the Flask
+# URL map itself, so both serving modes expose exactly the same URLs
+HANDLERS = {
+    'places_place_list': _place_list,
+    'places_place_search': _place_search,
+    'places_place_resource': _place_detail,
+    'places_place_reviews': _place_reviews,
+    'amenities_amenity_list': _amenity_list,
+    'amenities_amenity_resource': _amenity_detail,
+    'reviews_review_resource': _review_detail,
+}
+
+
+class HBnBASGI:
+    """ASGI application: async read handlers, Flask for everything else."""
+
+    def __init__(self, flask_app):
+        self.flask_app = flask_app
+        self.wsgi = WsgiToAsgi(flask_app)
+        uri = flask_app.config.get('ASYNC_DATABASE_URI') or async_database_uri(
+            flask_app.config['SQLALCHEMY_DATABASE_URI'])
+        self.engine = create_async_engine(uri)
+        if self.engine.dialect.name == 'sqlite':
+            install_pragmas(self.engine.sync_engine,
+                            flask_app.config.get('SQLITE_PRAGMAS') or {})
+        self.sessionmaker = async_sessionmaker(self.engine,
+                                               expire_on_commit=False)
+        self.routes = flask_app.url_map.bind('localhost')
+        # None when METRICS is off
+        self.metrics = flask_app.extensions.get('metrics')
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+        if scope['type'] == 'http' and scope['method'] == 'GET':
+            try:
+                rule, kwargs = self.routes.match(
+                    scope['path'], method='GET', return_rule=True)
+            except HTTPException:
+                # 404, 405 and slash redirects are left to Flask
+                pass
+            else:
+                if rule.endpoint in HANDLERS:
+                    await self._measure(scope, send, rule, kwargs)
+                    return
+        await self.wsgi(scope, receive, send)
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await self.engine.dispose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Run synchronous facade code against the async engine.
+
+        Inside `fn`, `db.session` (and therefore `Model.query`) is the sync
+        facade of an AsyncSession, so the facade and repositories work
+        unchanged while their I/O is awaited on the event loop.
+        """
+        async with self.sessionmaker() as session:
+            def bound(sync_session):
+                with self.flask_app.app_context():
+                    db.session.registry.set(sync_session)
+                    try:
+                        return fn(*args, **kwargs)
+                    finally:
+                        db.session.registry.clear()
+            return await session.run_sync(bound)
+
+    async def _measure(self, scope, send, rule, kwargs):
+        """Serve a request with its handler, recorded in the metrics."""
+        if self.metrics is None:
+            await self._respond(scope, send, rule, kwargs)
+            return
+        started = time.perf_counter()
+        status = 500
+        self.metrics.add_gauge('hbnb_http_requests_in_flight')
+        try:
+            status = await self._respond(scope, send, rule, kwargs)
+        finally:
+            self.metrics.add_gauge('hbnb_http_requests_in_flight', amount=-1)
+            self.metrics.record_request(
+                _namespace(rule), rule.rule, scope['method'], status,
+                time.perf_counter() - started)
+            self.metrics.flush_if_due()
+
+    async def _respond(self, scope, send, rule, kwargs) -> int:
+        args = MultiDict(parse_qsl(scope.get('query_string', b'').decode('latin-1'),
+                                   keep_blank_values=True))
+        request_headers = dict(scope.get('headers') or [])
+        conditions = (
+            parse_etags(_header(request_headers, b'if-none-match')),
+            parse_date(_header(request_headers, b'if-modified-since')))
+        body, status, extra = await self.run(
+            _serve, HANDLERS[rule.endpoint], _namespace(rule), scope['path'], args,
+            conditions, kwargs)
+        if body is None:
+            payload = b''
+            headers = []
+        else:
+            payload = json_serializer.dumps(body) + b"\n"
+            headers = [(b'content-type', b'application/json'),
+                       (b'content-length', str(len(payload)).encode('ascii'))]
+        headers.extend((name.lower().encode('latin-1'), value.encode('latin-1'))
+                       for name, value in extra.items())
+        headers.extend(_cors_headers(scope))
+        await send({'type': 'http.response.start', 'status': status,
+                    'headers': headers})
+        await send({'type': 'http.response.body', 'body': payload})
+        return status
+
+
+def _namespace(rule) -> str:
+    """Namespace of a route: Flask-RESTx endpoints are <namespace>_<resource>."""
+    return rule.endpoint.partition('_')[0]
+
+
+def _header(headers: Dict[bytes, bytes], name: bytes) -> Optional[str]:
+    value = headers.get(name)
+    return value.decode('latin-1') if value is not None else None
+
+
+def _cors_headers(scope) -> List[Tuple[bytes, bytes]]:
+    """Mirror flask-cors (any origin, with credentials) on async responses."""
+    origin = dict(scope.get('headers') or []).get(b'origin')
+    if not origin:
+        return []
+    return [(b'access-control-allow-origin', origin),
+            (b'access-control-allow-credentials', b'true'),
+            (b'vary', b'Origin')]
+
+
+def create_asgi_app(config_class="config.DevelopmentConfig") -> HBnBASGI:
+    """Build the Flask app and wrap it in the ASGI application."""
+    return HBnBASGI(create_app(config_class))
@@ -0,0 +1,237 @@
+"""
+Cache Module
+
+This module provides the read-through cache used by HBnBFacade to avoid
+hitting the database for entities that are read far more often than they are
+written (users on every authenticated request, places, amenities, reviews).
+
+The cache stores serialized dictionaries (the output of `to_dict()`), never
+ORM objects, so entries are independent of any database session. Values
+returned by the cache are shared and must be treated as read-only.
+
+Backends:
+- LRUCache: in-process, size-bounded LRU with a TTL (default), bounded by
+  number of entries and optionally by the total size of the values.
+- RedisCache: any client exposing the Redis get/set/delete/scan_iter API,
+  so several workers share one cache.
+- NullCache: disables caching.
+
+Configuration (Flask config keys):
+    CACHE_TYPE (str): 'simple' (default), 'redis' or 'null'.
+    CACHE_DEFAULT_TIMEOUT (int): Time-to-live of entries in seconds.
+    CACHE_MAX_ENTRIES (int): Maximum number of entries of the LRU backend.
+    CACHE_REDIS_URL (str): Redis URL for the 'redis' backend.
+    CACHE_KEY_PREFIX (str): Namespace prepended to every Redis key.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+from app.serialization import json_default
+
+
+class LRUCache:
+    """Thread-safe in-process cache with LRU eviction and per-entry TTL."""
+
+    def __init__(self, max_entries: int = 10000, default_timeout: int = 300,
+                 max_bytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None):
+        self.max_entries = max_entries
+        self.default_timeout = default_timeout
+        # Optional bound on the total size of the values, as measured by sizeof
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda value: 0)
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        timeout = self.default_timeout if timeout is None else timeout
+        expires_at = time.monotonic() + timeout if timeout else None
+        size = self.sizeof(value)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.delete(key)
+            return
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (value, expires_at, size)
+            self.total_bytes += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_bytes is not None
+                    and self.total_bytes > self.max_bytes):
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        # Caller holds the lock
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[2]
+
+    def delete(self, key: str) -> None:
+        """Remove a key if present."""
+        with self._lock:
+            self._remove(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        """Remove every key starting with prefix."""
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+
+class RedisCache:
+    """
+    Cache backed by a Redis-compatible client; values are stored as JSON
+    (datetimes come back as ISO 8601 strings).
+    """
+
+    def __init__(self, client, default_timeout: int = 300,
+                 key_prefix: str = 'hbnb:'):
+        self.client = client
+        self.default_timeout = default_timeout
+        self.key_prefix = key_prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.key_prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        timeout = self.default_timeout if timeout is None else timeout
+        self.client.set(self.key_prefix + key,
+                        json.dumps(value, default=json_default),
+                        ex=timeout or None)
+
+    def delete(self, key: str) -> None:
+        self.client.delete(self.key_prefix + key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        keys = list(self.client.scan_iter(match=f"{self.key_prefix}{prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def clear(self) -> None:
+        self.delete_prefix('')
+
+
+class NullCache:
+    """Backend that stores nothing; every lookup is a miss."""
+
+    def get(self, key: str) -> None:
+        return None
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        pass
+
+    def delete(self, key: str) -> None:
+        pass
+
+    def delete_prefix(self, prefix: str) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+class Cache:
+    """
+    Read-through cache front-end with hit/miss counters.
+
+    Follows the Flask extension pattern: instantiated once in
+    app/extensions.py and bound to the application with `init_app`.
+    """
+
+    def __init__(self, app=None):
+        self.backend = LRUCache()
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0}
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, backend=None) -> None:
+        """Configure the backend from the application config."""
+        timeout = app.config.get('CACHE_DEFAULT_TIMEOUT', 300)
+        cache_type = app.config.get('CACHE_TYPE', 'simple')
+
+        if backend is not None:
+            self.backend = backend
+        elif cache_type == 'null':
+            self.backend = NullCache()
+        elif cache_type == 'redis':
+            import redis  # Optional dependency, only needed for this backend
+            client = redis.Redis.from_url(app.config['CACHE_REDIS_URL'])
+            self.backend = RedisCache(
+                client, timeout, app.config.get('CACHE_KEY_PREFIX', 'hbnb:'))
+        else:
+            self.backend = LRUCache(
+                app.config.get('CACHE_MAX_ENTRIES', 10000), timeout)
+
+        self.reset_stats()
+        app.extensions['hbnb_cache'] = self
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader on a miss."""
+        value = self.backend.get(key)
+        if value is not None:
+            self._count("hits")
+            return value
+        self._count("misses")
+        value = loader()
+        self.backend.set(key, value)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        """Drop the given keys."""
+        for key in keys:
+            self.backend.delete(key)
+            self._count("invalidations")
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every key starting with prefix."""
+        self.backend.delete_prefix(prefix)
+        self._count("invalidations")
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the hit/miss counters and the hit ratio."""
+        with self._lock:
+            stats = dict(self._counters)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = stats["hits"] / lookups if lookups else 0.0
+        stats["backend"] = type(self.backend).__name__
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset the counters to zero."""
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
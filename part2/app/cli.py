@@ -0,0 +1,68 @@
+"""
+Flask CLI commands for the HBnB application.
+
+Run them from the part2 directory, e.g.::
+
+    flask --app run recompute-ratings
+    flask --app run import-data places places.ndjson
+    flask --app run rebuild-search-index
+    flask --app run vacuum
+
+A new database is set up with::
+
+    flask --app run db upgrade
+    flask --app run create-admin
+"""
+
+import click
+from app.init_db import create_default_admin
+from app.services import facade
+from app.services.bulk_import import BATCH_SIZE, FORMATS, detect_format
+
+
+def register_commands(app):
+    """Attach the HBnB commands to the application's CLI."""
+
+    @app.cli.command('create-admin')
+    def create_admin():
+        """Create the default admin user if it does not exist."""
+        create_default_admin()
+        click.echo("Default admin user is present.")
+
+    @app.cli.command('recompute-ratings')
+    def recompute_ratings():
+        """Rebuild the rating aggregates of every place from the reviews."""
+        updated = facade.recompute_rating_aggregates()
+        click.echo(f"Recomputed rating aggregates ({updated} places with reviews).")
+
+    @app.cli.command('rebuild-search-index')
+    def rebuild_search_index():
+        """Rebuild the full-text index of the places and reviews."""
+        rows = facade.rebuild_search_index()
+        click.echo("Rebuilt the search index ("
+                   + ", ".join(f"{count} {table}" for table, count in rows.items())
+                   + ").")
+
+    @app.cli.command('vacuum')
+    def vacuum():
+        """Compact the database, then rebuild the search index."""
+        rows = facade.compact_database()
+        click.echo("Vacuumed the database and rebuilt the search index ("
+                   + ", ".join(f"{count} {table}" for table, count in rows.items())
+                   + ").")
+
+    @app.cli.command('import-data')
+    @click.argument('kind', type=click.Choice(['amenities', 'places', 'reviews']))
+    @click.argument('source', type=click.File('r', encoding='utf-8'))
+    @click.option('--format', 'fmt', type=click.Choice(FORMATS),
+                  help='Input format (guessed from the file name by default).')
+    @click.option('--batch-size', default=BATCH_SIZE, show_default=True,
+                  help='Rows per transaction.')
+    def import_data(kind, source, fmt, batch_size):
+        """Bulk import KIND rows from an NDJSON or CSV file ('-' for stdin)."""
+        fmt = fmt or detect_format(source.name)
+        report = facade.bulk_import(kind, source, fmt, batch_size)
+        click.echo(f"Imported {report.imported} of {report.total} {kind} "
+                   f"({report.failed} rejected).")
+        for error in report.errors:
+            click.echo(f"  line {error.line}: {error.error}", err=True)
@@ -1,10 +1,162 @@
+import os
+
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
 from flask_migrate import Migrate
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from app.cache import Cache
+from app.hashing import PasswordHasher
+from app.instrumentation import RequestProfiler
+from app.metrics import Metrics
+from app.persistence.index_advisor import IndexAdvisor
+from app.persistence.replicas import REPLICA_READS, ReplicaRouter
+from app.persistence.unit_of_work import UnitOfWork
+from app.response_cache import ResponseCache
+from app.serialization import JSONSerializer
+from app.tokens import TokenRevocationList
+
+# Key of the read-only SQLite engine in app.extensions
+READONLY_ENGINE = 'sqlite_readonly_engine'
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to the read engines chosen by `replica_router`.
+
+    SELECTs are routed when the whole request is read-only
+    (`session.info['read_only']`, set for GET requests in create_app) or
+    when they run inside a repository method marked `@replica_read`.
+    Flushes and UPDATE/INSERT/DELETE statements always go to the primary,
+    and so do all the reads of a unit of work (every write request).
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and not self._flushing
+                and getattr(clause, 'is_select', False)
+                and (self.info.get('read_only') or self.info.get(REPLICA_READS))):
+            engine = replica_router.read_engine(self)
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind,
+                                **kwargs)
+
+
+@event.listens_for(RoutingSession, 'after_flush')
+def _record_flush(session, flush_context):
+    replica_router.record_write(session)
+
+
+@event.listens_for(RoutingSession, 'after_commit')
+@event.listens_for(RoutingSession, 'after_rollback')
+def _end_write(session):
+    replica_router.end_transaction(session)
+
+
+@event.listens_for(RoutingSession, 'do_orm_execute')
+def _record_statement(orm_execute_state):
+    if orm_execute_state.is_update or orm_execute_state.is_delete or \
+            orm_execute_state.is_insert:
+        replica_router.record_write(orm_execute_state.session)
+
+
+def _sqlite_file(uri):
+    """Return the path of a file-backed SQLite URL, or None."""
+    url = make_url(uri)
+    if (url.get_backend_name() != 'sqlite' or not url.database
+            or url.database == ':memory:' or url.database.startswith('file:')):
+        return None
+    return url.database
+
+
+def _pool_options(app, pool_size):
+    return {
+        'pool_size': pool_size,
+        'max_overflow': app.config.get('SQLALCHEMY_MAX_OVERFLOW', 10),
+        'pool_timeout': app.config.get('SQLALCHEMY_POOL_TIMEOUT', 30),
+    }
+
+
+def install_pragmas(engine, pragmas, read_only=False):
+    """Run the pragmas on every new connection of an engine."""
+    # journal_mode needs write access; the mode is persistent in the file
+    statements = [f"PRAGMA {name}={value}" for name, value in pragmas.items()
+                  if not (read_only and name == 'journal_mode')]
+    if read_only:
+        statements.append("PRAGMA query_only=ON")
+
+    @event.listens_for(engine, 'connect')
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for statement in statements:
+            cursor.execute(statement)
+        cursor.close()
+
+
+def configure_sqlite_engines(app):
+    """
+    Size the connection pool of a file-backed SQLite database (call before
+    `db.init_app`). In-memory databases (the tests) keep Flask-SQLAlchemy's
+    defaults.
+    """
+    if not _sqlite_file(app.config['SQLALCHEMY_DATABASE_URI']):
+        return
+    # Copied so that dicts defined on a config class are never mutated
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = dict(
+        _pool_options(app, app.config.get('SQLALCHEMY_POOL_SIZE', 5)),
+        **app.config.get('SQLALCHEMY_ENGINE_OPTIONS', {}))
+
+
+def init_engines(app):
+    """
+    Install SQLITE_PRAGMAS on the SQLite engines and register the read
+    engines (call after `db.init_app`): the SQLALCHEMY_REPLICA_URIS when
+    set, otherwise the local read-only pool when SQLITE_READONLY_POOL is set.
+    Also installs the index advisor on all of them when INDEX_ADVISOR is set.
+    """
+    pragmas = app.config.get('SQLITE_PRAGMAS') or {}
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        if engine.dialect.name == 'sqlite':
+            install_pragmas(engine, pragmas)
+
+    read_engines = []
+    for uri in app.config.get('SQLALCHEMY_REPLICA_URIS') or []:
+        engine = create_engine(uri)
+        if engine.dialect.name == 'sqlite':
+            install_pragmas(engine, pragmas, read_only=True)
+        read_engines.append(engine)
+
+    path = _sqlite_file(app.config['SQLALCHEMY_DATABASE_URI'])
+    if not read_engines and path and app.config.get('SQLITE_READONLY_POOL'):
+        if not os.path.isabs(path):
+            path = os.path.join(app.instance_path, path)
+        engine = create_engine(
+            f'sqlite:///file:{path}?mode=ro&uri=true',
+            **_pool_options(app, app.config.get('SQLITE_READONLY_POOL_SIZE', 10)))
+        install_pragmas(engine, pragmas, read_only=True)
+        app.extensions[READONLY_ENGINE] = engine
+        read_engines.append(engine)
+
+    replica_router.init_app(app, read_engines)
+    index_advisor.init_app(app, engines + read_engines)
+
 
 # Inicializar todas las extensiones
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 migrate = Migrate()
 bcrypt = Bcrypt()
-jwt = JWTManager()
\ No newline at end of file
+jwt = JWTManager()
+token_revocations = TokenRevocationList()
+cache = Cache()
+response_cache = ResponseCache()
+request_profiler = RequestProfiler()
+metrics = Metrics()
+json_serializer = JSONSerializer()
+replica_router = ReplicaRouter()
+index_advisor = IndexAdvisor()
+unit_of_work = UnitOfWork(db)
+password_hasher = PasswordHasher()
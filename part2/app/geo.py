@@ -0,0 +1,90 @@
+"""
+Geospatial helpers for the HBnB application.
+
+Places are bucketed into a fixed grid of GRID_CELL_DEGREES x GRID_CELL_DEGREES
+cells. The cell number of a place is stored (and indexed) on the places
+table, so a radius search only has to look at the handful of cells covering
+the search circle before computing exact great-circle distances.
+
+Features:
+- Haversine distance between two coordinates.
+- Bounding box of a circle, clipped to valid coordinates; across the
+  antimeridian its longitude range wraps (min_lon > max_lon).
+- Grid cell of a coordinate and the cells covering a bounding box.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+GRID_CELL_DEGREES = 0.5
+GRID_ROWS = int(180 / GRID_CELL_DEGREES)
+GRID_COLUMNS = int(360 / GRID_CELL_DEGREES)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Return the great-circle distance between two points in kilometers."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def bounding_box(lat: float, lon: float,
+                 radius_km: float) -> Tuple[float, float, float, float]:
+    """
+    Return (min_lat, max_lat, min_lon, max_lon) enclosing a circle.
+
+    The box is clipped to valid coordinates. When the circle reaches a pole
+    the longitude span covers the whole globe; when it crosses the
+    antimeridian the span wraps around it: min_lon > max_lon, and the box
+    covers min_lon..180 and -180..max_lon.
+    """
+    delta_lat = math.degrees(radius_km / EARTH_RADIUS_KM)
+    min_lat, max_lat = lat - delta_lat, lat + delta_lat
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90.0), min(max_lat, 90.0), -180.0, 180.0
+
+    delta_lon = math.degrees(
+        radius_km / (EARTH_RADIUS_KM * math.cos(math.radians(lat))))
+    if delta_lon >= 180:
+        return min_lat, max_lat, -180.0, 180.0
+    min_lon, max_lon = lon - delta_lon, lon + delta_lon
+    if min_lon < -180:
+        min_lon += 360
+    elif max_lon > 180:
+        max_lon -= 360
+    return min_lat, max_lat, min_lon, max_lon
+
+
+def _row(lat: float) -> int:
+    return min(int((lat + 90) / GRID_CELL_DEGREES), GRID_ROWS - 1)
+
+
+def _column(lon: float) -> int:
+    return min(int((lon + 180) / GRID_CELL_DEGREES), GRID_COLUMNS - 1)
+
+
+def grid_cell(lat: float, lon: float) -> int:
+    """Return the number of the grid cell containing a coordinate."""
+    return _row(lat) * GRID_COLUMNS + _column(lon)
+
+
+def cells_in_box(min_lat: float, max_lat: float, min_lon: float,
+                 max_lon: float, max_cells: int = 512) -> Optional[List[int]]:
+    """
+    Return the grid cells overlapping a bounding box (wrapping around the
+    antimeridian when min_lon > max_lon).
+
+    Returns None when the box spans more than `max_cells` cells; the caller
+    should then rely on the coordinate range alone.
+    """
+    rows = range(_row(min_lat), _row(max_lat) + 1)
+    if min_lon > max_lon:
+        columns = [*range(_column(min_lon), GRID_COLUMNS),
+                   *range(0, _column(max_lon) + 1)]
+    else:
+        columns = range(_column(min_lon), _column(max_lon) + 1)
+    if len(rows) * len(columns) > max_cells:
+        return None
+    return [row * GRID_COLUMNS + column for row in rows for column in columns]
@@ -0,0 +1,130 @@
+"""
+Password Hashing Module
+
+bcrypt is deliberately slow, so hashing a password inside the request thread
+pins a worker for the whole computation and a login spike starves every
+other endpoint. This module runs bcrypt in a dedicated process pool, sized
+to the number of cores, and refuses new work once too many hashes are
+queued: callers get `HashingOverloaded`, which the API turns into a
+429 Too Many Requests instead of letting requests pile up.
+
+Configuration (Flask config keys):
+    BCRYPT_LOG_ROUNDS (int): bcrypt cost factor for new hashes (default 12).
+    PASSWORD_HASH_WORKERS (int): Pool size; 0 hashes in the calling thread.
+    PASSWORD_HASH_MAX_PENDING (int): Queued + running hashes before
+        new requests are rejected.
+    PASSWORD_HASH_TIMEOUT (float): Seconds to wait for a result.
+"""
+
+import os
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+from app.instrumentation import measure
+
+# bcrypt and the process pool are imported on first use (in the pool's
+# worker processes for bcrypt), so importing the app stays cheap
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+DEFAULT_ROUNDS = 12
+
+
+class HashingOverloaded(Exception):
+    """Raised when too many password hashes are already pending."""
+
+
+def _hash_password(password: str, rounds: int) -> str:
+    import bcrypt
+    return bcrypt.hashpw(password.encode('utf-8'),
+                         bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _check_password(password_hash: str, password: str) -> bool:
+    import bcrypt
+    try:
+        return bcrypt.checkpw(password.encode('utf-8'),
+                              password_hash.encode('utf-8'))
+    except ValueError:
+        # Not a bcrypt hash
+        return False
+
+
+def hash_rounds(password_hash: str) -> Optional[int]:
+    """Return the cost factor of a bcrypt hash ('$2b$12$...'), or None."""
+    parts = (password_hash or '').split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """Bounded bcrypt executor, initialised like a Flask extension."""
+
+    def __init__(self, app=None):
+        self.rounds = DEFAULT_ROUNDS
+        self.workers = 0
+        self.max_pending = 0
+        self.timeout = None
+        self._executor: Optional['ProcessPoolExecutor'] = None
+        self._pending = 0
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        """Read the pool settings from the application config."""
+        self.rounds = int(app.config.get('BCRYPT_LOG_ROUNDS', DEFAULT_ROUNDS))
+        self.workers = int(app.config.get('PASSWORD_HASH_WORKERS',
+                                          os.cpu_count() or 1))
+        self.max_pending = int(app.config.get('PASSWORD_HASH_MAX_PENDING',
+                                              self.workers * 8))
+        self.timeout = app.config.get('PASSWORD_HASH_TIMEOUT')
+        self.shutdown()
+
+    @property
+    def pending(self) -> int:
+        """Hashes queued or running in the pool."""
+        return self._pending
+
+    def _pool(self) -> 'ProcessPoolExecutor':
+        # Created on first use so pre-forking servers start one per worker
+        from concurrent.futures import ProcessPoolExecutor
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+    def _run(self, fn: Callable, *args):
+        if self.workers <= 0:
+            return fn(*args)
+        with self._lock:
+            if self.max_pending and self._pending >= self.max_pending:
+                raise HashingOverloaded("Too many password operations in progress")
+            self._pending += 1
+        try:
+            return self._pool().submit(fn, *args).result(timeout=self.timeout)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured cost factor."""
+        with measure('auth'):
+            return self._run(_hash_password, password, self.rounds)
+
+    def check(self, password_hash: str, password: str) -> bool:
+        """Check a password against a bcrypt hash."""
+        with measure('auth'):
+            return self._run(_check_password, password_hash, password)
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """True when a hash was made with a different cost factor."""
+        return hash_rounds(password_hash) != self.rounds
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a new pool is started on demand)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -1,4 +1,4 @@
-from app.extensions import db
+from app.extensions import db, unit_of_work
 from app.models.user import User
 
 def create_default_admin():
@@ -16,7 +16,7 @@ def create_default_admin():
             is_admin=True  # Este es el campo importante
         )
         db.session.add(admin)
-        db.session.commit()
+        unit_of_work.commit()
 
 if __name__ == "__main__":
     create_default_admin()
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""
+Request Instrumentation Module
+
+Records where the time of each request goes:
+    - db: the SQL statements run on any SQLAlchemy engine (count, total
+      time, and each statement with its duration), from the engine's
+      before/after_cursor_execute events;
+    - serialize: the JSON encoding of the response body;
+    - auth: password hashing and verification;
+    - total: from the first before_request hook to the last after_request
+      hook (so it includes the commit of the unit of work).
+
+Code outside the engine adds its own timings with `measure(name)`, which
+does nothing outside an instrumented request:
+
+    with measure('serialize'):
+        body = encoder.dumps(data)
+
+The timings are sent back as `Server-Timing` and `X-Query-Count` headers,
+in debug and testing mode by default, e.g.:
+
+    Server-Timing: db;dur=3.1;desc="4 queries", serialize;dur=0.4,
+        app;dur=5.2, total;dur=8.7
+    X-Query-Count: 4
+
+Requests slower than SLOW_REQUEST_MS are logged as warnings with their
+timings and SQL statements.
+
+Configuration (Flask config keys):
+    REQUEST_PROFILING (bool): Record the timings (on by default).
+    SERVER_TIMING (bool): Send the headers; None (default) sends them in
+        debug and testing mode only.
+    SLOW_REQUEST_MS (float): Budget of a request; 0 disables the log.
+    SLOW_REQUEST_MAX_STATEMENTS (int): Statements listed in the log.
+"""
+
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
+
+from flask import current_app, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Timings, other than db and total, in the order of the header
+TIMINGS = ('serialize', 'auth')
+
+
+class RequestProfile:
+    """Timings of one request, in milliseconds."""
+
+    __slots__ = ('started', 'queries', 'db_ms', 'timings', 'statements',
+                 '_query_started')
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_ms = 0.0
+        self.timings: Dict[str, float] = {}
+        self.statements: List[Tuple[float, str]] = []
+        self._query_started: Optional[float] = None
+
+    def add(self, name: str, ms: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + ms
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    def server_timing(self, total_ms: float) -> str:
+        """Value of the Server-Timing header."""
+        measured = [(name, self.timings[name]) for name in TIMINGS
+                    if name in self.timings]
+        app_ms = max(0.0, total_ms - self.db_ms - sum(ms for _, ms in measured))
+        queries = 'query' if self.queries == 1 else 'queries'
+        parts = [f'db;dur={self.db_ms:.1f};desc="{self.queries} {queries}"']
+        parts += [f'{name};dur={ms:.1f}' for name, ms in measured]
+        parts += [f'app;dur={app_ms:.1f}', f'total;dur={total_ms:.1f}']
+        return ', '.join(parts)
+
+
+_current: ContextVar[Optional[RequestProfile]] = ContextVar(
+    'request_profile', default=None)
+
+
+def current_profile() -> Optional[RequestProfile]:
+    """Profile of the request being handled, or None."""
+    return _current.get()
+
+
+@contextmanager
+def measure(name: str):
+    """Add the time spent in the block to the current request's `name`."""
+    profile = _current.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(name, (time.perf_counter() - started) * 1000)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context,
+                           executemany):
+    profile = _current.get()
+    if profile is not None:
+        profile._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context,
+                          executemany):
+    profile = _current.get()
+    if profile is None or profile._query_started is None:
+        return
+    ms = (time.perf_counter() - profile._query_started) * 1000
+    profile._query_started = None
+    profile.queries += 1
+    profile.db_ms += ms
+    profile.statements.append((ms, statement))
+
+
+class RequestProfiler:
+    """Flask extension recording the timings of every request."""
+
+    _listening = False
+
+    def __init__(self, app=None):
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        if not app.config.get('REQUEST_PROFILING', True):
+            return
+        headers = app.config.get('SERVER_TIMING')
+        app.extensions['request_profiler'] = {
+            'headers': (app.debug or app.testing) if headers is None else headers,
+            'slow_ms': app.config.get('SLOW_REQUEST_MS', 500),
+            'max_statements': app.config.get('SLOW_REQUEST_MAX_STATEMENTS', 50),
+        }
+        # The listeners are on the Engine class, so they see every engine
+        # (primary, read-only pool, replicas), and only record inside an
+        # instrumented request
+        if not RequestProfiler._listening:
+            event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+            RequestProfiler._listening = True
+        app.before_request(self.start)
+        app.after_request(self.finish)
+        app.teardown_request(self.clear)
+
+    @staticmethod
+    def start() -> None:
+        _current.set(RequestProfile())
+
+    @staticmethod
+    def finish(response):
+        profile = _current.get()
+        if profile is None:
+            return response
+        settings = current_app.extensions['request_profiler']
+        total_ms = profile.elapsed_ms()
+        if settings['headers']:
+            response.headers['Server-Timing'] = profile.server_timing(total_ms)
+            response.headers['X-Query-Count'] = str(profile.queries)
+        if settings['slow_ms'] and total_ms > settings['slow_ms']:
+            _log_slow_request(profile, response, total_ms, settings)
+        return response
+
+    @staticmethod
+    def clear(exc) -> None:
+        _current.set(None)
+
+
+def _log_slow_request(profile, response, total_ms, settings) -> None:
+    statements = profile.statements[:settings['max_statements']]
+    lines = [f"  [{ms:.1f} ms] {' '.join(statement.split())}"
+             for ms, statement in statements]
+    if len(profile.statements) > len(statements):
+        lines.append(f"  ... {len(profile.statements) - len(statements)} more")
+    logger.warning(
+        "Slow request %s %s %s: %.1f ms (budget %s ms), %s\n%s",
+        request.method, request.full_path.rstrip('?'), response.status_code,
+        total_ms, settings['slow_ms'],
+        profile.server_timing(total_ms), '\n'.join(lines))
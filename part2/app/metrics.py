@@ -0,0 +1,422 @@
+"""
+Metrics Module
+
+Exposes the application's metrics at GET /metrics in the Prometheus text
+format (version 0.0.4):
+
+    hbnb_http_requests_total{namespace, route, method, status}   counter
+    hbnb_http_request_duration_seconds{namespace, route, method} histogram
+    hbnb_http_requests_in_flight                                 gauge
+    hbnb_db_statements_total{namespace, route}                   counter
+    hbnb_db_pool_connections{engine, state}                      gauge
+    hbnb_cache_requests_total{cache, result}                     counter
+    hbnb_cache_hit_ratio{cache}                                  gauge
+    hbnb_password_hash_pending                                   gauge
+    hbnb_password_hash_workers                                   gauge
+
+Routes are labelled with their URL rule (`/api/v1/places/<place_id>`),
+not the requested path, so the number of series stays bounded. Requests
+served by the async handlers of `app.asgi` are recorded under the same
+labels, except for hbnb_db_statements_total (Flask requests only).
+
+Counters are lock-free: every thread writes to its own shard, a plain
+dict only that thread mutates, and a scrape adds the shards up (copying a
+dict is atomic in CPython). When a thread exits (the threaded development
+server starts one per request) its shard is folded into the values of
+the exited threads, so the shards stay as many as the live threads. The
+pool, cache and hashing values are read from their owners at scrape time.
+
+Several worker processes (gunicorn, uwsgi...) are aggregated through
+METRICS_DIR: each process writes a snapshot of its values there every
+METRICS_FLUSH_SECONDS and when it exits, and the process answering the
+scrape adds up all the snapshots. Counters of exited processes are kept,
+their gauges are dropped. Empty the directory when the service starts.
+
+Configuration (Flask config keys):
+    METRICS (bool): Collect the metrics and serve /metrics (on by default).
+    METRICS_DIR (str): Shared directory of the per-process snapshots;
+        None (default) reports this process only.
+    METRICS_FLUSH_SECONDS (float): Interval between two snapshots.
+"""
+
+import atexit
+import bisect
+import json
+import os
+import threading
+import time
+import weakref
+from typing import Dict, List, Tuple
+
+from flask import Response, current_app, g, has_app_context, request
+
+from app.instrumentation import current_profile
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Upper bounds of the latency histogram buckets, in seconds
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# name: (type, help, label names)
+FAMILIES = {
+    'hbnb_http_requests_total': (
+        'counter', 'HTTP requests handled.',
+        ('namespace', 'route', 'method', 'status')),
+    'hbnb_http_request_duration_seconds': (
+        'histogram', 'Time to handle an HTTP request.',
+        ('namespace', 'route', 'method')),
+    'hbnb_http_requests_in_flight': (
+        'gauge', 'HTTP requests being handled.', ()),
+    'hbnb_db_statements_total': (
+        'counter', 'SQL statements run by HTTP requests.',
+        ('namespace', 'route')),
+    'hbnb_db_pool_connections': (
+        'gauge', 'Connections of the engine pools, by state.',
+        ('engine', 'state')),
+    'hbnb_cache_requests_total': (
+        'counter', 'Cache lookups, by result.', ('cache', 'result')),
+    'hbnb_cache_hit_ratio': (
+        'gauge', 'Share of the cache lookups that were hits.', ('cache',)),
+    'hbnb_password_hash_pending': (
+        'gauge', 'Password hashes queued or running.', ()),
+    'hbnb_password_hash_workers': (
+        'gauge', 'Processes of the password hashing pool.', ()),
+}
+
+Key = Tuple[str, Tuple[str, ...]]
+
+
+class _Shard:
+    """Values written by one thread."""
+
+    __slots__ = ('counters', 'gauges', 'histograms')
+
+    def __init__(self):
+        self.counters: Dict[Key, float] = {}
+        self.gauges: Dict[Key, float] = {}
+        # Per key: one count per bucket, the +Inf count, then the sum
+        self.histograms: Dict[Key, List[float]] = {}
+
+
+class _ThreadToken:
+    """Held in a thread's locals only: collected when the thread exits."""
+
+    __slots__ = ('__weakref__',)
+
+
+class Values:
+    """Counters, gauges and histograms added up from shards or snapshots."""
+
+    def __init__(self):
+        self.counters: Dict[Key, float] = {}
+        self.gauges: Dict[Key, float] = {}
+        self.histograms: Dict[Key, List[float]] = {}
+
+    def add(self, counters, gauges, histograms) -> None:
+        for key, value in counters:
+            self.counters[key] = self.counters.get(key, 0) + value
+        for key, value in gauges:
+            self.gauges[key] = self.gauges.get(key, 0) + value
+        for key, buckets in histograms:
+            total = self.histograms.setdefault(key, [0] * len(buckets))
+            for i, value in enumerate(buckets):
+                total[i] += value
+
+    def to_json(self) -> dict:
+        return {kind: [[name, list(labels), value]
+                       for (name, labels), value in getattr(self, kind).items()]
+                for kind in ('counters', 'gauges', 'histograms')}
+
+    @staticmethod
+    def from_json(data, kind):
+        return [((name, tuple(labels)), value)
+                for name, labels, value in data.get(kind, [])]
+
+
+def _escape(value) -> str:
+    return (str(value).replace('\\', r'\\').replace('"', r'\"')
+            .replace('\n', r'\n'))
+
+
+def _series(family, labels, suffix='', extra=()) -> str:
+    """A series of a family, e.g. name_bucket{route="/",le="0.5"}."""
+    pairs = list(zip(FAMILIES[family][2], labels)) + list(extra)
+    if not pairs:
+        return family + suffix
+    return family + suffix + '{' + ','.join(
+        f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _number(value) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class Metrics:
+    """Flask extension collecting the request metrics and serving /metrics."""
+
+    def __init__(self, app=None):
+        self._local = threading.local()
+        self._shards: List[_Shard] = []
+        # Values of the shards of exited threads
+        self._retired = Values()
+        self._lock = threading.Lock()
+        self.directory = None
+        self.flush_seconds = 5.0
+        self._next_flush = 0.0
+        self._atexit = False
+        self._collected = ([], [])
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app) -> None:
+        if not app.config.get('METRICS', True):
+            return
+        self.directory = app.config.get('METRICS_DIR')
+        self.flush_seconds = app.config.get('METRICS_FLUSH_SECONDS', 5.0)
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            if not self._atexit:
+                atexit.register(self.flush)
+                self._atexit = True
+        app.extensions['metrics'] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        app.add_url_rule('/metrics', 'metrics', self.serve, methods=['GET'])
+
+    # Recording (lock-free: each thread only writes to its own shard)
+
+    def _shard(self) -> _Shard:
+        shard = getattr(self._local, 'shard', None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._lock:  # Once per thread
+                self._shards.append(shard)
+            # The thread's locals are dropped when it exits
+            self._local.token = _ThreadToken()
+            weakref.finalize(self._local.token, self._retire, shard)
+        return shard
+
+    def _retire(self, shard: _Shard) -> None:
+        """Fold the shard of an exited thread into the retired values."""
+        with self._lock:
+            self._shards.remove(shard)
+            self._retired.add(shard.counters.items(), shard.gauges.items(),
+                              shard.histograms.items())
+
+    def inc(self, name: str, labels: Tuple[str, ...] = (), amount=1) -> None:
+        """Add amount to a counter."""
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + amount
+
+    def add_gauge(self, name: str, labels: Tuple[str, ...] = (), amount=1) -> None:
+        """Add amount (possibly negative) to a gauge."""
+        gauges = self._shard().gauges
+        key = (name, labels)
+        gauges[key] = gauges.get(key, 0) + amount
+
+    def observe(self, name: str, labels: Tuple[str, ...], value: float) -> None:
+        """Record a value in a histogram."""
+        histograms = self._shard().histograms
+        key = (name, labels)
+        buckets = histograms.get(key)
+        if buckets is None:
+            buckets = histograms[key] = [0] * (len(BUCKETS) + 2)
+        buckets[bisect.bisect_left(BUCKETS, value)] += 1
+        buckets[-1] += value
+
+    def reset(self) -> None:
+        """Drop the values of this process (tests)."""
+        with self._lock:
+            self._retired = Values()
+            for shard in self._shards:
+                shard.counters.clear()
+                shard.gauges.clear()
+                shard.histograms.clear()
+
+    # Request hooks
+
+    def _before_request(self) -> None:
+        g.metrics_started = time.perf_counter()
+        g.metrics_in_flight = True
+        self.add_gauge('hbnb_http_requests_in_flight')
+
+    def _after_request(self, response):
+        started = g.pop('metrics_started', None)
+        if started is not None:
+            rule = request.url_rule
+            route = rule.rule if rule is not None else 'unmatched'
+            endpoint = request.endpoint or ''
+            namespace = endpoint.split('_', 1)[0] if rule is not None else ''
+            profile = current_profile()
+            self.record_request(namespace, route, request.method,
+                                response.status_code,
+                                time.perf_counter() - started,
+                                profile.queries if profile is not None else 0)
+        self.flush_if_due()
+        return response
+
+    def _teardown_request(self, exc) -> None:
+        if g.pop('metrics_in_flight', False):
+            self.add_gauge('hbnb_http_requests_in_flight', amount=-1)
+
+    def record_request(self, namespace: str, route: str, method: str,
+                       status: int, seconds: float, statements: int = 0) -> None:
+        """Count and time a handled request (also called by `app.asgi`)."""
+        self.inc('hbnb_http_requests_total',
+                 (namespace, route, method, str(status)))
+        self.observe('hbnb_http_request_duration_seconds',
+                     (namespace, route, method), seconds)
+        if statements:
+            self.inc('hbnb_db_statements_total', (namespace, route), statements)
+
+    def flush_if_due(self) -> None:
+        """Write the snapshot of this process when the interval has passed."""
+        if self.directory and time.monotonic() >= self._next_flush:
+            self.flush()
+
+    # Collection
+
+    def local_values(self) -> Values:
+        """Values of this process: the shards and the collected gauges."""
+        values = Values()
+        # Under the lock, a shard is either live or retired, never both
+        with self._lock:
+            values.add(self._retired.counters.items(),
+                       self._retired.gauges.items(),
+                       self._retired.histograms.items())
+            for shard in self._shards:
+                values.add(shard.counters.copy().items(),
+                           shard.gauges.copy().items(),
+                           [(key, list(buckets)) for key, buckets
+                            in shard.histograms.copy().items()])
+        # At exit, without an application, the last collected values
+        if has_app_context():
+            self._collected = _collect(current_app._get_current_object())
+        values.add(*self._collected, ())
+        return values
+
+    def flush(self) -> None:
+        """Write the snapshot of this process to METRICS_DIR."""
+        if not self.directory:
+            return
+        self._next_flush = time.monotonic() + self.flush_seconds
+        data = self.local_values().to_json()
+        path = os.path.join(self.directory, f'{os.getpid()}.json')
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+
+    def values(self) -> Values:
+        """Values of this process and, with METRICS_DIR, of the others."""
+        values = self.local_values()
+        if not self.directory:
+            return values
+        self.flush()
+        for filename in os.listdir(self.directory):
+            pid, ext = os.path.splitext(filename)
+            if ext != '.json' or not pid.isdigit() or int(pid) == os.getpid():
+                continue
+            try:
+                with open(os.path.join(self.directory, filename)) as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            values.add(Values.from_json(data, 'counters'),
+                       Values.from_json(data, 'gauges')
+                       if _pid_alive(int(pid)) else (),
+                       Values.from_json(data, 'histograms'))
+        return values
+
+    def render(self) -> str:
+        """The metrics in the Prometheus text format."""
+        values = self.values()
+        _add_hit_ratios(values)
+        samples: Dict[str, List[str]] = {name: [] for name in FAMILIES}
+        for (name, labels), value in sorted(values.counters.items()):
+            samples[name].append(f'{_series(name, labels)} {_number(value)}')
+        for (name, labels), value in sorted(values.gauges.items()):
+            samples[name].append(f'{_series(name, labels)} {_number(value)}')
+        for (name, labels), buckets in sorted(values.histograms.items()):
+            cumulative = 0
+            for bound, count in zip(BUCKETS + ('+Inf',), buckets[:-1]):
+                cumulative += count
+                samples[name].append(
+                    f'{_series(name, labels, "_bucket", [("le", bound)])} '
+                    f'{_number(cumulative)}')
+            samples[name].append(
+                f'{_series(name, labels, "_sum")} {_number(buckets[-1])}')
+            samples[name].append(
+                f'{_series(name, labels, "_count")} {_number(cumulative)}')
+        lines = []
+        for name, (kind, help_text, _) in FAMILIES.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            lines.extend(samples[name])
+        return '\n'.join(lines) + '\n'
+
+    def serve(self):
+        return Response(self.render(), mimetype=None, content_type=CONTENT_TYPE)
+
+
+def _collect(app):
+    """Gauges and counters read from the pools, caches and hasher."""
+    counters, gauges = [], []
+    # Imported here: app.extensions imports this module
+    from app.extensions import (READONLY_ENGINE, cache, db, password_hasher,
+                                replica_router, response_cache)
+
+    engines = {'primary': db.engine}
+    for i, engine in enumerate(replica_router.engines()):
+        readonly = engine is app.extensions.get(READONLY_ENGINE)
+        engines['readonly' if readonly else f'replica{i}'] = engine
+    for name, engine in engines.items():
+        pool = engine.pool
+        if not all(hasattr(pool, attr) for attr in ('checkedout', 'checkedin',
+                                                    'overflow')):
+            continue  # SingletonThreadPool, StaticPool...
+        gauges.append((('hbnb_db_pool_connections', (name, 'checked_out')),
+                       pool.checkedout()))
+        gauges.append((('hbnb_db_pool_connections', (name, 'idle')),
+                       pool.checkedin()))
+        gauges.append((('hbnb_db_pool_connections', (name, 'overflow')),
+                       max(0, pool.overflow())))
+
+    for name, extension in (('entity', cache), ('response', response_cache)):
+        stats = extension.stats()
+        hits = stats['hits'] + stats.get('stale_hits', 0)
+        counters.append((('hbnb_cache_requests_total', (name, 'hit')), hits))
+        counters.append((('hbnb_cache_requests_total', (name, 'miss')),
+                         stats['misses']))
+
+    gauges.append((('hbnb_password_hash_pending', ()), password_hasher.pending))
+    gauges.append((('hbnb_password_hash_workers', ()),
+                   max(0, password_hasher.workers)))
+    return counters, gauges
+
+
+def _add_hit_ratios(values: Values) -> None:
+    """Hit ratio of every cache, from the (aggregated) lookup counters."""
+    lookups: Dict[str, List[float]] = {}
+    for (name, labels), value in values.counters.items():
+        if name == 'hbnb_cache_requests_total':
+            cache, result = labels
+            counts = lookups.setdefault(cache, [0, 0])
+            counts[result != 'hit'] += value
+    for cache, (hits, misses) in lookups.items():
+        values.gauges[('hbnb_cache_hit_ratio', (cache,))] = (
+            hits / (hits + misses) if hits + misses else 0.0)
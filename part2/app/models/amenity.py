@@ -30,6 +30,10 @@ class Amenity(BaseModel):
 
     name = db.Column(db.String(100), nullable=False, unique=True)
 
+    # Keys of to_dict() and the attributes they read
+    SERIALIZED_FIELDS = {name: (name,) for name in (
+        "id", "name", "created_at", "updated_at")}
+
     # Establish Many-to-Many relationship with Place
     places = relationship('Place', secondary=place_amenity, back_populates='amenities', lazy=True)
 
@@ -47,11 +51,13 @@ class Amenity(BaseModel):
             raise ValueError("Name must be 100 characters or less")
         return name.strip()
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert instance attributes to a dictionary for serialization."""
+    def to_dict(self, fields=None) -> Dict[str, Any]:
+        """Convert instance attributes (or only `fields`) to a dictionary."""
+        if fields is not None:
+            return self.sparse_dict(fields)
         return {
             "id": self.id,
             "name": self.name,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
             } 
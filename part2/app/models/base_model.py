@@ -4,9 +4,10 @@ BaseModel module for the HBnB application.
 This module defines the BaseModel class as a SQLAlchemy model.
 """
 
-from app.extensions import db  # Importar la instancia de SQLAlchemy
+from app.extensions import db, unit_of_work  # Importar la instancia de SQLAlchemy
 import uuid
 from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
 class BaseModel(db.Model):
@@ -32,38 +33,67 @@ class BaseModel(db.Model):
         onupdate=datetime.utcnow
     )
 
-    def save(self):
-        """Save the instance to the database."""
-        try:
-            db.session.add(self)
-            db.session.commit()
-        except Exception as e:
-            db.session.rollback()
-            raise e
+    # Keys of to_dict() and the attributes each one reads, so that a sparse
+    # fieldset loads only those (see SQLAlchemyRepository._load_fields)
+    SERIALIZED_FIELDS: Dict[str, Tuple[str, ...]] = {
+        name: (name,) for name in ("id", "created_at", "updated_at")}
 
-    def update(self, data):
+    def save(self, commit=True):
+        """Save the instance to the database (commit=False only stages it)."""
+        db.session.add(self)
+        if commit:
+            unit_of_work.commit()
+
+    def update(self, data, commit=True):
         """Update object attributes from a dictionary."""
         for key, value in data.items():
             if hasattr(self, key):
                 setattr(self, key, value)
-        self.save()
+        self.save(commit=commit)
 
-    def delete(self):
+    def delete(self, commit=True):
         """Delete the instance from the database."""
-        try:
-            db.session.delete(self)
-            db.session.commit()
-        except Exception as e:
-            db.session.rollback()
-            raise e
-
-    def to_dict(self):
+        db.session.delete(self)
+        if commit:
+            unit_of_work.commit()
+
+    @classmethod
+    def parse_fields(cls, value: Optional[str]) -> Optional[List[str]]:
+        """
+        Parse a `fields=` query parameter: comma-separated keys of to_dict().
+
+        Returns:
+            The keys in the requested order, or None (every key) when empty.
+
+        Raises:
+            ValueError: If a key is not one of SERIALIZED_FIELDS.
+        """
+        fields = list(dict.fromkeys(
+            name.strip() for name in (value or '').split(',') if name.strip()))
+        unknown = [name for name in fields if name not in cls.SERIALIZED_FIELDS]
+        if unknown:
+            raise ValueError(
+                f"Unknown fields: {', '.join(unknown)}. "
+                f"Use any of: {', '.join(cls.SERIALIZED_FIELDS)}")
+        return fields or None
+
+    def field_value(self, name: str) -> Any:
+        """Value of one key of to_dict(), reading only its own attributes."""
+        return getattr(self, name)
+
+    def sparse_dict(self, fields: Iterable[str]) -> Dict[str, Any]:
+        """to_dict() restricted to some keys (a sparse fieldset)."""
+        return {name: self.field_value(name) for name in fields}
+
+    def to_dict(self, fields=None):
         """Convert instance attributes to
         a dictionary for JSON serialization."""
+        if fields is not None:
+            return self.sparse_dict(fields)
         return {
             "id": self.id,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat()
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
 
     def __str__(self):
@@ -14,6 +14,7 @@ Features:
 - Ability to manage associated amenities and reviews.
 - Supports both database persistence and in-memory usage during runtime.
 - Establishes a relationship with User as the owner of each Place.
+- Indexes the title and description in full text (places_fts).
 
 Attributes:
     title (str): The title of the place (required, max 100 chars).
@@ -22,25 +23,47 @@ Attributes:
     latitude (float): The latitude of the place (required, -90 to 90).
     longitude (float): The longitude of the place (required, -180 to 180).
     owner_id (str): The ID of the owner (required, must be a valid user ID).
+    geo_cell (int): Grid cell of the coordinates, maintained on write.
+    review_count (int): Number of reviews of the place.
+    rating_sum (int): Sum of the ratings of those reviews.
+    rating_average (float): rating_sum / review_count, 0 without reviews.
+    rating_count_1 .. rating_count_5 (int): Histogram of the ratings.
     owner (relationship): SQLAlchemy relationship to link Place to User.
     reviews (relationship): Relationship with Review.
     amenities (relationship): Many-to-Many relationship with Amenity.
 """
 
 from app.models.base_model import BaseModel
+from sqlalchemy import event
 from sqlalchemy.orm import validates, relationship
 from app import db
+from app.geo import grid_cell
+from app.search import index_table
 from typing import Dict, Any
 
 # Association table for Many-to-Many relationship between Place and Amenity
 place_amenity = db.Table('place_amenity',
     db.Column('place_id', db.String(36), db.ForeignKey('places.id'), primary_key=True),
-    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True)
+    db.Column('amenity_id', db.String(36), db.ForeignKey('amenities.id'), primary_key=True),
+    # The primary key serves lookups by place; this one serves them by amenity
+    db.Index('ix_place_amenity_amenity_id', 'amenity_id')
 )
 
 class Place(BaseModel):
     """Place model class for handling place data and its validation."""
     __tablename__ = 'places'
+    __table_args__ = (
+        # Serves the keyset-paginated place listing
+        db.Index('ix_places_created_at_id', 'created_at', 'id'),
+        # Serves the price range filter and the price sort
+        db.Index('ix_places_price_id', 'price', 'id'),
+        # Serves the bounding box filter
+        db.Index('ix_places_latitude_longitude', 'latitude', 'longitude'),
+        # Serves the rating filter and the rating sort
+        db.Index('ix_places_rating_average_id', 'rating_average', 'id'),
+        # Serves the places of an owner
+        db.Index('ix_places_owner_id', 'owner_id'),
+    )
 
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.String(1000), nullable=True)
@@ -48,6 +71,25 @@ class Place(BaseModel):
     latitude = db.Column(db.Float, nullable=False)
     longitude = db.Column(db.Float, nullable=False)
     owner_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
+    geo_cell = db.Column(db.Integer, nullable=True, index=True)
+
+    # Rating aggregates, maintained by the facade on every review write
+    review_count = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_sum = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_average = db.Column(db.Float, nullable=False, default=0.0, server_default='0')
+    rating_count_1 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_count_2 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_count_3 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_count_4 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    rating_count_5 = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+
+    # Keys of to_dict() and the attributes they read
+    SERIALIZED_FIELDS = dict(
+        {name: (name,) for name in (
+            "id", "title", "description", "price", "latitude", "longitude",
+            "owner_id", "created_at", "updated_at", "amenities",
+            "review_count", "rating_average")},
+        rating_histogram=tuple(f"rating_count_{rating}" for rating in range(1, 6)))
 
     # Establish relationships 
     reviews = relationship('Review', backref='place', lazy=True)
@@ -103,8 +145,30 @@ class Place(BaseModel):
             raise ValueError("Owner must be a valid user ID string")
         return owner_id
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert instance attributes to a dictionary for serialization."""
+    def field_value(self, name: str) -> Any:
+        """Value of one key of to_dict(), reading only its own attributes."""
+        if name == "amenities":
+            return [amenity.to_dict() for amenity in self.amenities]
+        if name == "review_count":
+            return self.review_count or 0
+        if name == "rating_average":
+            return round(self.rating_average or 0.0, 2)
+        if name == "rating_histogram":
+            return {str(rating): getattr(self, f"rating_count_{rating}") or 0
+                    for rating in range(1, 6)}
+        return getattr(self, name)
+
+    def to_dict(self, fields=None) -> Dict[str, Any]:
+        """
+        Convert instance attributes to a dictionary for serialization.
+
+        Args:
+            fields: Keys to include (see SERIALIZED_FIELDS); every key when
+                None. The attributes of the other keys are not read, so they
+                may be left unloaded.
+        """
+        if fields is not None:
+            return self.sparse_dict(fields)
         return {
             "id": self.id,
             "title": self.title,
@@ -113,7 +177,21 @@ class Place(BaseModel):
             "latitude": self.latitude,
             "longitude": self.longitude,
             "owner_id": self.owner_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
-            "amenities": [amenity.to_dict() for amenity in self.amenities]
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "amenities": self.field_value("amenities"),
+            "review_count": self.field_value("review_count"),
+            "rating_average": self.field_value("rating_average"),
+            "rating_histogram": self.field_value("rating_histogram")
         }
+
+
+@event.listens_for(Place, 'before_insert')
+@event.listens_for(Place, 'before_update')
+def update_geo_cell(mapper, connection, place):
+    """Keep the grid cell in sync with the coordinates of the place."""
+    place.geo_cell = grid_cell(place.latitude, place.longitude)
+
+
+# Full-text index of the title and description (places_fts)
+index_table(Place.__table__, ('title', 'description'))
@@ -13,6 +13,7 @@ Features:
 - Supports both database persistence and in-memory usage during runtime.
 - Establishes a relationship with User as the author of each review.
 - Establishes a relationship with Place as the target of each review.
+- Indexes the text in full text (reviews_fts).
 
 Attributes:
     text (str): The text content of the review (required, max 1000 chars).
@@ -26,17 +27,30 @@ Attributes:
 from app.models.base_model import BaseModel
 from sqlalchemy.orm import validates, relationship
 from app import db
+from app.search import index_table
 from typing import Dict, Any
 
 class Review(BaseModel):
     """Review model class for handling review data and its validation."""
     __tablename__ = 'reviews'
+    __table_args__ = (
+        # Serves the per-place review listing ordered by creation date
+        db.Index('ix_reviews_place_id_created_at', 'place_id', 'created_at'),
+        # One review per user and place; also serves the reviews of a user
+        db.Index('uq_reviews_user_id_place_id', 'user_id', 'place_id',
+                 unique=True),
+    )
 
     text = db.Column(db.String(1000), nullable=False)
     rating = db.Column(db.Integer, nullable=False)
     user_id = db.Column(db.String(36), db.ForeignKey('users.id'), nullable=False)
     place_id = db.Column(db.String(36), db.ForeignKey('places.id'), nullable=False)
 
+    # Keys of to_dict() and the attributes they read
+    SERIALIZED_FIELDS = {name: (name,) for name in (
+        "id", "text", "rating", "user_id", "place_id", "created_at",
+        "updated_at")}
+
     def __init__(
         self, text: str, rating: int, user_id: str, place_id: str, **kwargs: Any
     ):
@@ -81,14 +95,20 @@ class Review(BaseModel):
             raise ValueError("Place ID must be a valid string")
         return place_id
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert instance attributes to a dictionary for serialization."""
+    def to_dict(self, fields=None) -> Dict[str, Any]:
+        """Convert instance attributes (or only `fields`) to a dictionary."""
+        if fields is not None:
+            return self.sparse_dict(fields)
         return {
             "id": self.id,
             "text": self.text,
             "rating": self.rating,
             "user_id": self.user_id,
             "place_id": self.place_id,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
+
+
+# Full-text index of the text (reviews_fts)
+index_table(Review.__table__, ('text',))
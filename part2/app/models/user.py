@@ -10,7 +10,8 @@ an independent object in Python applications.
 
 Features:
 - Validation for first name, last name, email, and password.
-- Secure password hashing and authentication.
+- Secure password hashing and authentication (bcrypt runs in the bounded
+  pool of `app.hashing`).
 - Relationship handling with places and reviews via SQLAlchemy.
 - Conversion of instance attributes to dictionaries for serialization.
 - Allows temporary local storage for users when not using a database.
@@ -25,7 +26,8 @@ Attributes:
     reviews (relationship): Relationship with Review, linking the reviews written by the user.
 """
 
-from app import db, bcrypt
+from app import db
+from app.extensions import password_hasher
 from sqlalchemy.orm import relationship, validates
 from .base_model import BaseModel
 import re
@@ -41,6 +43,11 @@ class User(BaseModel):
     password = db.Column(db.String(128), nullable=False)
     is_admin = db.Column(db.Boolean, default=False)
 
+    # Keys of to_dict() and the attributes they read (never the password)
+    SERIALIZED_FIELDS = {name: (name,) for name in (
+        "id", "first_name", "last_name", "email", "is_admin", "created_at",
+        "updated_at")}
+
     # SQLAlchemy relationships
     places = relationship('Place', backref='owner', lazy=True)
     reviews = relationship('Review', backref='user', lazy=True)
@@ -66,7 +73,7 @@ class User(BaseModel):
 
         if password:
             self.password = self.validate_password("password", password)
-            self.password = bcrypt.generate_password_hash(password).decode('utf-8')
+            self.password = password_hasher.hash(password)
 
         super().__init__(**kwargs)
 
@@ -111,20 +118,24 @@ class User(BaseModel):
         """
         Verify if a given password matches the stored hashed password.
         """
-        return bcrypt.check_password_hash(self.password, password)
+        return password_hasher.check(self.password, password)
 
-    def to_dict(self, exclude_password: bool = True) -> Dict[str, Any]:
+    def to_dict(self, exclude_password: bool = True,
+                fields=None) -> Dict[str, Any]:
         """
-        Convert the User object into a dictionary representation.
+        Convert the User object into a dictionary representation
+        (restricted to `fields` when given).
         """
+        if fields is not None:
+            return self.sparse_dict(fields)
         user_dict = {
             "id": self.id,
             "first_name": self.first_name,
             "last_name": self.last_name,
             "email": self.email,
             "is_admin": self.is_admin,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
         }
 
         if not exclude_password:
@@ -1,16 +1,19 @@
 from app.models.amenity import Amenity
 from app import db
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.replicas import replica_read
 
 class AmenityRepository(SQLAlchemyRepository):
     def __init__(self):
         """Initialize AmenityRepository with the Amenity model."""
         super().__init__(Amenity)
 
+    @replica_read
     def get_amenity_by_name(self, name):
         """Get amenity by name."""
         return self.model.query.filter_by(name=name).first()
 
+    @replica_read
     def get_amenities_by_place(self, place_id):
         """Get all amenities for a specific place."""
         return self.model.query\
@@ -0,0 +1,100 @@
+"""
+Index Advisor Module
+
+Development aid that reports repository queries SQLite answers with a full
+table scan. Every distinct SELECT issued from `app.persistence` is run once
+through `EXPLAIN QUERY PLAN`; when the plan contains a `SCAN <table>` step
+that uses no index, a warning with the query, the caller and the plan is
+logged, e.g.:
+
+    Full table scan of reviews in ReviewRepository.get_reviews_by_user
+    (app/persistence/review_repository.py:36)
+    SELECT ... FROM reviews WHERE reviews.user_id = ?
+    QUERY PLAN: SCAN reviews
+
+It explains each statement on the connection that ran it, so it doubles
+the cost of the first execution of every query: enable it in development
+only.
+
+Configuration (Flask config keys):
+    INDEX_ADVISOR (bool): Install the advisor on the SQLite engines
+        (enabled by DevelopmentConfig).
+"""
+
+import logging
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+from sqlalchemy import event
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE = 'app.persistence'
+
+
+def full_scans(plan: List[Tuple]) -> List[str]:
+    """Tables of an EXPLAIN QUERY PLAN result read without an index."""
+    tables = []
+    for row in plan:
+        detail = row[-1]
+        # Virtual tables (full-text indexes) are searched by their module
+        if (detail.startswith('SCAN ') and 'USING' not in detail
+                and 'VIRTUAL TABLE' not in detail
+                and not detail.startswith(('SCAN CONSTANT', 'SCAN ('))):
+            tables.append(detail.split()[1])
+    return tables
+
+
+def _repository_caller() -> Optional[str]:
+    """Innermost frame of `app.persistence` on the stack, as text."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith(_PACKAGE) and module != __name__:
+            code = frame.f_code
+            owner = frame.f_locals.get('self')
+            name = (f"{type(owner).__name__}.{code.co_name}" if owner is not None
+                    else code.co_name)
+            return f"{name} ({code.co_filename}:{frame.f_lineno})"
+        frame = frame.f_back
+    return None
+
+
+class IndexAdvisor:
+    """Explains repository queries and logs the ones doing full scans."""
+
+    def __init__(self):
+        self._seen = set()
+        self._lock = threading.Lock()
+
+    def init_app(self, app, engines) -> None:
+        """Install the advisor on the SQLite `engines` if INDEX_ADVISOR is set."""
+        if not app.config.get('INDEX_ADVISOR'):
+            return
+        for engine in engines:
+            if engine.dialect.name == 'sqlite':
+                event.listen(engine, 'after_cursor_execute',
+                             self._after_cursor_execute)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters,
+                              context, executemany):
+        if executemany or not statement.lstrip().upper().startswith('SELECT'):
+            return
+        caller = _repository_caller()
+        if caller is None:
+            return
+        with self._lock:
+            if statement in self._seen:
+                return
+            self._seen.add(statement)
+        explain = conn.connection.cursor()
+        try:
+            plan = explain.execute(
+                f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        finally:
+            explain.close()
+        for table in full_scans(plan):
+            logger.warning(
+                "Full table scan of %s in %s\n%s\nQUERY PLAN: %s", table,
+                caller, statement, '; '.join(row[-1] for row in plan))
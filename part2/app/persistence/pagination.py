@@ -0,0 +1,127 @@
+"""
+Pagination helpers for the HBnB repositories.
+
+This module implements keyset (a.k.a. "seek") pagination: instead of
+skipping rows with OFFSET, each page remembers the sort key of its last row
+in an opaque cursor and the next page starts strictly after it. With a
+matching index the cost of a page is independent of how deep the client has
+scrolled and of how large the table is.
+
+Features:
+- Opaque, URL-safe cursors encoding the sort key of the last row.
+- Hard upper bound on page size.
+- Works with any ordered tuple of columns whose last column is unique.
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import and_, or_
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class Page(NamedTuple):
+    """A page of results and the cursor pointing at the next one."""
+    items: List[Any]
+    next_cursor: Optional[str]
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """Return a page size between 1 and MAX_PAGE_SIZE."""
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of a row into an opaque cursor string."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, columns: Sequence[Any]) -> List[Any]:
+    """Decode a cursor back into values typed like the given columns."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor("Invalid pagination cursor") from e
+
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursor("Invalid pagination cursor")
+
+    return [_typed(column, value) for column, value in zip(columns, values)]
+
+
+def _typed(column: Any, value: Any) -> Any:
+    """Check a decoded cursor value against the type of its column."""
+    if value is None:
+        return value
+    python_type = column.type.python_type
+    if python_type is datetime:
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError) as e:
+            raise InvalidCursor("Invalid pagination cursor") from e
+    # JSON numbers decode as int or float; bool is an int but not a number
+    expected = (int, float) if python_type is float else python_type
+    if not isinstance(value, expected) or isinstance(value, bool):
+        raise InvalidCursor("Invalid pagination cursor")
+    return value
+
+
+def _after(columns: Sequence[Any], values: Sequence[Any], descending: bool):
+    """Build the "row comes after (values)" predicate for the sort key.
+
+    The condition is expanded into nested OR/AND terms rather than a row
+    value comparison so every term binds with its own column type and the
+    leading column stays usable as an index range.
+    """
+    column, value = columns[0], values[0]
+    beyond = column < value if descending else column > value
+    if len(columns) == 1:
+        return beyond
+    return or_(beyond, and_(column == value,
+                            _after(columns[1:], values[1:], descending)))
+
+
+def keyset_paginate(query, columns: Sequence[Any], limit: Optional[int] = None,
+                    cursor: Optional[str] = None,
+                    descending: bool = False) -> Page:
+    """
+    Fetch one page of a query ordered by the given columns.
+
+    Args:
+        query: SQLAlchemy query to paginate (already filtered).
+        columns: Columns forming the sort key; the last one must be unique.
+        limit: Requested page size, clamped to MAX_PAGE_SIZE.
+        cursor: Cursor returned with the previous page, if any.
+        descending: Sort from the greatest key to the smallest.
+
+    Returns:
+        Page with the rows and the cursor of the following page (None when
+        this is the last page).
+    """
+    limit = clamp_limit(limit)
+    if cursor:
+        query = query.filter(
+            _after(columns, decode_cursor(cursor, columns), descending))
+
+    order = [c.desc() if descending else c.asc() for c in columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in columns])
+    return Page(rows, next_cursor)
@@ -1,19 +1,427 @@
-from app.models.place import Place
-from app import db
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.extensions import db
+from app.geo import bounding_box, cells_in_box, haversine_km
+from app.search import match_query, snippet, words
+from sqlalchemy import (
+    Float, String, case, cast, column, func, or_, text, update)
+from sqlalchemy.orm import selectinload
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.replicas import replica_read
+from app.persistence.pagination import (
+    Page, clamp_limit, decode_cursor, encode_cursor, keyset_paginate)
+from datetime import datetime
+from flask import current_app
+from typing import Any, List, NamedTuple, Optional
+
+# Radius of the first ring searched for the nearest places
+NEAREST_START_RADIUS_KM = 10.0
+# Largest radius of a search around a point: every candidate within it is
+# loaded and sorted for each page, and up to about 75 degrees of latitude
+# its bounding box stays within the grid cells a search may read
+MAX_SEARCH_RADIUS_KM = 300.0
+SEARCH_AREA_TOO_LARGE = ("The search area is too large for this location; "
+                         "use a smaller radius_km.")
+# Sort key of the distance-ordered results, as typed for cursors
+DISTANCE_KEY = [column('distance_km', Float), column('id', String)]
+# Sort key of the full-text results (BM25, lower is better)
+RANK_KEY = [column('rank', Float), column('id', String)]
+# BM25 weights of the title and description columns
+TITLE_WEIGHT, DESCRIPTION_WEIGHT = 4.0, 1.0
+# Factor of the rank of a match in a review: weaker than in the place itself
+REVIEW_WEIGHT = 0.5
+
+# Best match of every matching place, in its own text or in one of its
+# reviews (the bare rowids come from the row holding MIN(rank)), with the
+# text of the match
+_TEXT_SEARCH = """
+WITH place_hits AS (
+    SELECT rowid, bm25(places_fts, :title_weight, :description_weight) AS rank
+    FROM places_fts WHERE places_fts MATCH :query
+    {newest}
+), review_hits AS (
+    SELECT rowid, bm25(reviews_fts) * :review_weight AS rank
+    FROM reviews_fts WHERE reviews_fts MATCH :query
+    {newest}
+), hits AS (
+    SELECT places.id AS place_id, place_hits.rank,
+           place_hits.rowid AS place_rowid, NULL AS review_rowid
+    FROM place_hits JOIN places ON places.rowid = place_hits.rowid
+    UNION ALL
+    SELECT reviews.place_id, review_hits.rank, NULL, review_hits.rowid
+    FROM review_hits JOIN reviews ON reviews.rowid = review_hits.rowid
+), best AS (
+    SELECT MIN(rank) AS rank, place_id, place_rowid, review_rowid
+    FROM hits GROUP BY place_id
+), page AS (
+    SELECT * FROM best
+    {after}
+    ORDER BY rank, place_id
+    LIMIT :limit
+)
+SELECT page.rank, page.place_id, places.title, places.description, reviews.text
+FROM page
+LEFT JOIN places ON places.rowid = page.place_rowid
+LEFT JOIN reviews ON reviews.rowid = page.review_rowid
+ORDER BY page.rank, page.place_id
+"""
+_AFTER = "WHERE rank > :rank OR (rank = :rank AND place_id > :id)"
+# Fallback cap of the matches ranked per table (SEARCH_CANDIDATES)
+_NEWEST = "ORDER BY rowid DESC LIMIT :candidates"
+# Whether either full-text table has a match older than the ranked ones
+_UNRANKED_MATCHES = """
+SELECT EXISTS (SELECT 1 FROM places_fts WHERE places_fts MATCH :query
+               ORDER BY rowid DESC LIMIT 1 OFFSET :candidates)
+    OR EXISTS (SELECT 1 FROM reviews_fts WHERE reviews_fts MATCH :query
+               ORDER BY rowid DESC LIMIT 1 OFFSET :candidates)
+"""
+
+
+class SearchPage(NamedTuple):
+    """A page of full-text results, flagged when matches were left unranked."""
+    items: List[Any]
+    next_cursor: Optional[str]
+    truncated: bool
+
 
 class PlaceRepository(SQLAlchemyRepository):
     def __init__(self):
         """Initialize PlaceRepository with the Place model."""
         super().__init__(Place)
 
+    def _with_amenities(self, query, fields=None, required=()):
+        """
+        Eagerly load the amenities of every place returned by the query.
+
+        Place.to_dict serializes amenities; without this, a list of N places
+        issues one extra query per place. selectinload fetches the amenities
+        of the whole result with a single IN query instead.
+
+        With a sparse fieldset, only its columns are loaded, and the
+        amenities only if requested.
+        """
+        if fields is not None:
+            return self._load_fields(query, fields, required)
+        return query.options(selectinload(self.model.amenities))
+
+    @replica_read
+    def get_all(self):
+        """Get all places with their amenities."""
+        return self._with_amenities(self.model.query).all()
+
+    def _sort_columns(self, sort):
+        """Return the keyset columns and direction for a sort option."""
+        sorts = {
+            'created_at': ([self.model.created_at, self.model.id], False),
+            '-created_at': ([self.model.created_at, self.model.id], True),
+            'price': ([self.model.price, self.model.id], False),
+            '-price': ([self.model.price, self.model.id], True),
+            'rating': ([self.model.rating_average, self.model.id], False),
+            '-rating': ([self.model.rating_average, self.model.id], True),
+        }
+        if sort not in sorts:
+            raise ValueError(
+                f"Invalid sort option. Use one of: {', '.join(sorts)}")
+        return sorts[sort]
+
+    def _filter(self, query, min_price=None, max_price=None, amenity_ids=None,
+                min_lat=None, max_lat=None, min_lon=None, max_lon=None,
+                title=None, owner_id=None, min_rating=None):
+        """Apply the place search filters to a query; None means no filter."""
+        if min_rating is not None:
+            query = query.filter(self.model.rating_average >= min_rating)
+        if min_price is not None:
+            query = query.filter(self.model.price >= min_price)
+        if max_price is not None:
+            query = query.filter(self.model.price <= max_price)
+        if min_lat is not None:
+            query = query.filter(self.model.latitude >= min_lat)
+        if max_lat is not None:
+            query = query.filter(self.model.latitude <= max_lat)
+        if min_lon is not None:
+            query = query.filter(self.model.longitude >= min_lon)
+        if max_lon is not None:
+            query = query.filter(self.model.longitude <= max_lon)
+        if title:
+            # Case-insensitive substring: % and _ in the title are literal
+            query = query.filter(
+                self.model.title.icontains(title, autoescape=True))
+        if owner_id:
+            query = query.filter(self.model.owner_id == owner_id)
+        if amenity_ids:
+            amenity_ids = set(amenity_ids)
+            with_all_amenities = db.select(place_amenity.c.place_id)\
+                .where(place_amenity.c.amenity_id.in_(amenity_ids))\
+                .group_by(place_amenity.c.place_id)\
+                .having(func.count(place_amenity.c.amenity_id) == len(amenity_ids))
+            query = query.filter(self.model.id.in_(with_all_amenities))
+        return query
+
+    @replica_read
+    def search_places(self, sort='created_at', limit=None, cursor=None,
+                      fields=None, **filters):
+        """
+        Get a page of places matching every given filter.
+
+        All filters are compiled into a single SQL statement; filters left
+        as None are not applied.
+
+        Args:
+            sort: created_at, -created_at, price, -price, rating or -rating
+            limit: Maximum number of places to return
+            cursor: Cursor returned with the previous page
+            fields: Keys of to_dict() to load (sparse fieldset), or None
+            **filters: Any of min_price, max_price (inclusive price range),
+                min_rating (minimum average rating),
+                amenity_ids (amenities the place must offer, all of them),
+                min_lat, max_lat, min_lon, max_lon (inclusive bounding box),
+                title (case-insensitive substring) and owner_id
+
+        Returns:
+            Page of Place objects and the cursor of the next page
+        """
+        columns, descending = self._sort_columns(sort)
+        query = self._with_amenities(
+            self.model.query, fields, [column.key for column in columns])
+        query = self._filter(query, **filters)
+        return keyset_paginate(query, columns, limit, cursor, descending)
+
+    def _distances_within(self, lat, lon, radius_km, **filters):
+        """
+        Return (distance_km, place_id) of the places within a radius.
+
+        Only the grid cells covering the circle are read, and only the id and
+        coordinates of the candidates are loaded. The result is sorted by
+        distance. Returns None, without querying, when the bounding box of
+        the circle spans more cells than `cells_in_box` allows (near the
+        poles), since it would be read as a whole.
+        """
+        min_lat, max_lat, min_lon, max_lon = bounding_box(lat, lon, radius_km)
+        cells = cells_in_box(min_lat, max_lat, min_lon, max_lon)
+        if cells is None:
+            return None
+
+        query = db.session.query(
+            self.model.id, self.model.latitude, self.model.longitude)
+        if min_lon > max_lon:
+            # Across the antimeridian
+            longitude = or_(self.model.longitude >= min_lon,
+                            self.model.longitude <= max_lon)
+        else:
+            longitude = self.model.longitude.between(min_lon, max_lon)
+        query = self._filter(query, **filters).filter(
+            self.model.latitude.between(min_lat, max_lat), longitude,
+            self.model.geo_cell.in_(cells))
+
+        hits = []
+        for place_id, place_lat, place_lon in query:
+            distance = haversine_km(lat, lon, place_lat, place_lon)
+            if distance <= radius_km:
+                hits.append((distance, place_id))
+        hits.sort()
+        return hits
+
+    def _load_with_keys(self, hits, fields=None):
+        """Load the places of (key, place_id) pairs, keeping their order."""
+        ids = [place_id for _, place_id in hits]
+        places = {place.id: place for place in self._with_amenities(
+            self.model.query, fields).filter(self.model.id.in_(ids))}
+        return [(places[place_id], distance) for distance, place_id in hits
+                if place_id in places]
+
+    @replica_read
+    def search_nearby(self, lat, lon, radius_km=None, nearest=None,
+                      limit=None, cursor=None, fields=None, **filters):
+        """
+        Get places around a point, closest first.
+
+        With `nearest`, returns the k closest places no farther than
+        `radius_km` (MAX_SEARCH_RADIUS_KM by default) by searching a growing
+        radius until enough places are found. Otherwise returns a page of
+        every place within `radius_km`.
+
+        Args:
+            lat, lon: Center of the search
+            radius_km: Search radius in kilometers
+            nearest: Number of closest places to return
+            limit: Maximum number of places per page (radius search)
+            cursor: Cursor returned with the previous page (radius search)
+            fields: Keys of to_dict() to load (sparse fieldset), or None
+            **filters: Same filters as search_places
+
+        Returns:
+            Page of (Place, distance_km) pairs and the cursor of the next page
+
+        Raises:
+            ValueError: If the search area is too large to be read by cells
+        """
+        if nearest:
+            nearest = clamp_limit(nearest)
+            max_radius = radius_km or MAX_SEARCH_RADIUS_KM
+            radius = min(NEAREST_START_RADIUS_KM, max_radius)
+            hits = None
+            while True:
+                ring = self._distances_within(lat, lon, radius, **filters)
+                if ring is None:
+                    # Wider rings would read too many cells: keep the last one
+                    break
+                hits = ring
+                if len(hits) >= nearest or radius >= max_radius:
+                    break
+                radius = min(radius * 4, max_radius)
+            if hits is None:
+                raise ValueError(SEARCH_AREA_TOO_LARGE)
+            return Page(self._load_with_keys(hits[:nearest], fields), None)
+
+        hits = self._distances_within(lat, lon, radius_km, **filters)
+        if hits is None:
+            raise ValueError(SEARCH_AREA_TOO_LARGE)
+        if cursor:
+            after = tuple(decode_cursor(cursor, DISTANCE_KEY))
+            hits = [hit for hit in hits if hit > after]
+
+        limit = clamp_limit(limit)
+        next_cursor = None
+        if len(hits) > limit:
+            hits = hits[:limit]
+            next_cursor = encode_cursor(hits[-1])
+        return Page(self._load_with_keys(hits, fields), next_cursor)
+
+    @replica_read
+    def search_text(self, query, limit=None, cursor=None, fields=None):
+        """
+        Get a page of the places matching a full-text query, best first.
+
+        A place matches when its title or description, or the text of one
+        of its reviews, contains every word of the query; it is ranked by
+        its best match (BM25, the title weighing more than the
+        description and a review less than the place itself).
+
+        Every match is ranked, and the pages follow (rank, place id) over
+        the whole match set. BM25 costs microseconds per match, so a word
+        found in a million rows takes seconds to rank: as a fallback for
+        such tables, the SEARCH_CANDIDATES config key caps the ranked
+        matches to the newest ones of each table (the rowids follow the
+        insertion order; when VACUUM renumbers them it keeps that order,
+        see app.search). Pages then end there, and are flagged as
+        truncated.
+
+        Args:
+            query: Free text
+            limit: Maximum number of places to return
+            cursor: Cursor returned with the previous page
+            fields: Keys of to_dict() to load (sparse fieldset), or None
+
+        Returns:
+            SearchPage of (Place, rank, snippet) triples, the cursor of the
+            next page and the truncation flag; the snippet is HTML with the
+            matches in <mark>
+
+        Raises:
+            ValueError: If the query has no word or the cursor is invalid
+        """
+        query_words = words(query)
+        limit = clamp_limit(limit)
+        params = dict(query=match_query(query_words),
+                      title_weight=TITLE_WEIGHT,
+                      description_weight=DESCRIPTION_WEIGHT,
+                      review_weight=REVIEW_WEIGHT,
+                      candidates=current_app.config.get('SEARCH_CANDIDATES'),
+                      limit=limit + 1)
+        after = ''
+        if cursor:
+            params['rank'], params['id'] = decode_cursor(cursor, RANK_KEY)
+            after = _AFTER
+        newest = _NEWEST if params['candidates'] else ''
+        rows = db.session.execute(text(_TEXT_SEARCH.format(
+            after=after, newest=newest)), params).all()
+        truncated = bool(newest) and bool(db.session.execute(
+            text(_UNRANKED_MATCHES), params).scalar())
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][:2])
+        snippets = {}
+        for _, place_id, title, description, review in rows:
+            # The place's column with the most matches, or the review
+            texts = [review] if review is not None else [
+                value for value in (title, description) if value]
+            snippets[place_id] = max(
+                (snippet(value, query_words) for value in texts),
+                key=lambda fragment: fragment.count('<mark>'))
+        return SearchPage([(place, rank, snippets[place.id])
+                           for place, rank in self._load_with_keys(
+                               [tuple(row[:2]) for row in rows], fields)],
+                          next_cursor, truncated)
+
+    @replica_read
     def get_places_by_owner(self, owner_id):
         """Get all places for a specific owner."""
-        return self.model.query.filter_by(owner_id=owner_id).all()
-
-    def get_places_by_price_range(self, min_price, max_price):
-        """Get places within a price range."""
-        return self.model.query.filter(
-            self.model.price >= min_price,
-            self.model.price <= max_price
-        ).all() 
\ No newline at end of file
+        return self._with_amenities(self.model.query)\
+            .filter_by(owner_id=owner_id).all()
+
+    def apply_review_rating(self, place_id, rating, delta=1):
+        """
+        Add (delta=1) or remove (delta=-1) a rating from a place's aggregates.
+
+        Runs a single UPDATE relative to the stored values, so concurrent
+        writers cannot lose increments. Does not commit: the caller commits
+        it together with the review change.
+        """
+        count = self.model.review_count + delta
+        total = self.model.rating_sum + delta * rating
+        bucket = getattr(self.model, f"rating_count_{rating}")
+        db.session.execute(
+            update(self.model).where(self.model.id == place_id).values({
+                self.model.review_count: count,
+                self.model.rating_sum: total,
+                bucket: bucket + delta,
+                self.model.rating_average: case(
+                    (count > 0, cast(total, Float) / count), else_=0.0),
+            }))
+
+    def touch_places_with_amenity(self, amenity_id):
+        """
+        Bump updated_at of the places offering an amenity, whose
+        representation embeds it. Does not commit.
+        """
+        db.session.execute(update(self.model).where(self.model.id.in_(
+            db.select(place_amenity.c.place_id)
+            .where(place_amenity.c.amenity_id == amenity_id)
+        )).values(updated_at=datetime.utcnow()))
+
+    def recompute_rating_aggregates(self):
+        """
+        Rebuild the rating aggregates of every place from the reviews table.
+
+        Uses one grouped pass over the reviews and two UPDATE statements,
+        whatever the number of places. Returns the number of places that
+        have reviews. Does not commit, and the UPDATEs bypass the places
+        already loaded in the session: the caller expires them.
+        """
+        places = self.model.__table__
+        histogram = [func.sum(case((Review.rating == rating, 1), else_=0))
+                     .label(f"rating_count_{rating}") for rating in range(1, 6)]
+        stats = db.select(
+            Review.place_id,
+            func.count().label('review_count'),
+            func.sum(Review.rating).label('rating_sum'),
+            *histogram
+        ).group_by(Review.place_id).subquery()
+
+        zeros = {name: 0 for name in (
+            'review_count', 'rating_sum', 'rating_average',
+            *(f"rating_count_{rating}" for rating in range(1, 6)))}
+        db.session.execute(update(places).where(
+            places.c.id.not_in(db.select(Review.place_id))).values(zeros))
+
+        result = db.session.execute(
+            update(places).where(places.c.id == stats.c.place_id).values(
+                review_count=stats.c.review_count,
+                rating_sum=stats.c.rating_sum,
+                rating_average=cast(stats.c.rating_sum, Float)
+                / stats.c.review_count,
+                **{f"rating_count_{rating}": stats.c[f"rating_count_{rating}"]
+                   for rating in range(1, 6)}))
+        return result.rowcount
@@ -0,0 +1,140 @@
+"""
+Read Replica Routing Module
+
+Repositories mark their read-only methods with `@replica_read`; while such a
+method runs, the SELECTs of `db.session` are sent to one of the read engines
+(round-robin) instead of the primary. Writes, and every query that is not
+inside a replica read, keep going to the primary.
+
+Replicas lag behind the primary, so a user who has just written is "sticky":
+for REPLICA_STICKY_SECONDS after their last write all their reads go to the
+primary and they always see their own changes. A transaction that has
+written also reads from the primary until it commits or rolls back, since
+its changes are not visible anywhere else, and so does a unit of work
+(every write request runs in one, see `app.persistence.unit_of_work`): its
+writes may be computed from what it reads, e.g. rating aggregates adjusted
+by the old rating of a review, which must not come from a lagging replica.
+
+The read engines are the SQLALCHEMY_REPLICA_URIS when configured, otherwise
+the local read-only SQLite pool (see `app.extensions`), otherwise none (all
+reads go to the primary).
+
+Configuration (Flask config keys):
+    SQLALCHEMY_REPLICA_URIS (list[str]): Database URLs of the read replicas.
+    REPLICA_STICKY_SECONDS (float): Read-your-writes window after a write.
+"""
+
+import functools
+import itertools
+import threading
+from typing import Any, List, Optional
+
+from flask import current_app, has_app_context, has_request_context, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+
+from app.cache import LRUCache
+from app.persistence.unit_of_work import UOW_DEPTH
+
+# Session.info keys
+REPLICA_READS = 'replica_reads'
+WROTE = 'wrote'
+
+_EXTENSION_KEY = 'db_replicas'
+_USER_KEY = 'hbnb.replica_user_key'
+
+
+class _ReadEngines:
+    """Read engines and sticky users of one application."""
+
+    def __init__(self, engines, sticky_seconds, store):
+        self.engines = engines
+        self.sticky_seconds = sticky_seconds
+        self.store = store
+        self._next = itertools.count()
+        self._lock = threading.Lock()
+
+    def next(self):
+        with self._lock:
+            return self.engines[next(self._next) % len(self.engines)]
+
+
+def _user_key() -> Optional[str]:
+    """Identify the requester: JWT identity, else client address."""
+    if not has_request_context():
+        return None
+    # Cached on the request (g outlives it when an app context is reused)
+    if _USER_KEY not in request.environ:
+        try:
+            verify_jwt_in_request(optional=True)
+            identity = get_jwt_identity()
+        except Exception:
+            identity = None
+        request.environ[_USER_KEY] = (f"user:{identity}" if identity
+                                      else f"addr:{request.remote_addr}")
+    return request.environ[_USER_KEY]
+
+
+class ReplicaRouter:
+    """Chooses the engine of replica reads, initialised like an extension."""
+
+    def init_app(self, app, engines: List[Any], store=None) -> None:
+        """
+        Register the read engines of an application.
+
+        Args:
+            engines: Engines serving replica reads (may be empty).
+            store: Cache backend recording recent writers; an in-process
+                LRUCache by default (pass a RedisCache to share it).
+        """
+        sticky_seconds = float(app.config.get('REPLICA_STICKY_SECONDS', 5))
+        app.extensions[_EXTENSION_KEY] = _ReadEngines(
+            engines, sticky_seconds,
+            store or LRUCache(max_entries=100000,
+                              default_timeout=max(1, int(sticky_seconds))))
+
+    def _state(self) -> Optional[_ReadEngines]:
+        if not has_app_context():
+            return None
+        return current_app.extensions.get(_EXTENSION_KEY)
+
+    def engines(self) -> List[Any]:
+        """Read engines of the current application."""
+        state = self._state()
+        return state.engines if state else []
+
+    def read_engine(self, session) -> Optional[Any]:
+        """Engine for a read of `session`, or None to use the primary."""
+        state = self._state()
+        if (not state or not state.engines or session.info.get(WROTE)
+                or session.info.get(UOW_DEPTH)):
+            return None
+        key = _user_key()
+        if key and state.store.get(f"sticky:{key}"):
+            return None
+        return state.next()
+
+    def end_transaction(self, session) -> None:
+        """Release the session pin once its writes are committed or discarded."""
+        session.info.pop(WROTE, None)
+
+    def record_write(self, session) -> None:
+        """Pin the transaction and its user to the primary after a write."""
+        session.info[WROTE] = True
+        state = self._state()
+        key = _user_key()
+        if state and key:
+            state.store.set(f"sticky:{key}", True,
+                            timeout=max(1, int(state.sticky_seconds)))
+
+
+def replica_read(method):
+    """Run a repository method with its queries routed to a read replica."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        info = self.db.session.info
+        info[REPLICA_READS] = info.get(REPLICA_READS, 0) + 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            info[REPLICA_READS] -= 1
+    return wrapper
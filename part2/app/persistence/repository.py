@@ -2,7 +2,10 @@
 
 from app import db  # Assuming you have set up SQLAlchemy in your Flask app
 from app.models import User, Place, Review, Amenity  # Import your models
-from app.extensions import db
+from app.extensions import db, unit_of_work
+from app.persistence.replicas import replica_read
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import load_only, selectinload
 
 class Repository:
     """Base repository class"""
@@ -30,33 +33,60 @@ class SQLAlchemyRepository(Repository):
     def __init__(self,model=None):
         super().__init__(model)
 
-    def add(self, entity):
-        try:
-            self.db.session.add(entity)
-            self.db.session.commit()
-            return entity
-        except Exception as e:
-            self.db.session.rollback()
-            raise e
+    def add(self, entity, commit=True):
+        """Add an entity; with commit=False it is only staged in the session."""
+        self.db.session.add(entity)
+        if commit:
+            unit_of_work.commit()
+        return entity
 
+    @replica_read
     def get(self, obj_id):
         return self.model.query.get(obj_id)
 
+    @replica_read
     def get_all(self):
         return self.model.query.all()
 
-    def update(self, obj_id, data):
+    def update(self, obj_id, data, commit=True):
         obj = self.get(obj_id)
         if obj:
             for key, value in data.items():
                 setattr(obj, key, value)
-            db.session.commit()
+            if commit:
+                unit_of_work.commit()
 
-    def delete(self, obj_id):
+    def delete(self, obj_id, commit=True):
         obj = self.get(obj_id)
         if obj:
             db.session.delete(obj)
-            db.session.commit()
+            if commit:
+                unit_of_work.commit()
 
+    @replica_read
     def get_by_attribute(self, attr_name, attr_value):
-        return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
\ No newline at end of file
+        return self.model.query.filter(getattr(self.model, attr_name) == attr_value).first()
+
+    @replica_read
+    def get_updated_at(self, obj_id):
+        """Last modification date of an entity (primary key lookup), or None."""
+        return self.db.session.query(self.model.updated_at)\
+            .filter(self.model.id == obj_id).scalar()
+
+    def _load_fields(self, query, fields, required=()):
+        """
+        Load only what the to_dict() keys in `fields` read.
+
+        Columns outside the fieldset are not selected (load_only) and
+        relationships are eagerly loaded only when requested; `required`
+        names extra columns the caller reads, such as the sort key of a page.
+        """
+        mapper = sa_inspect(self.model)
+        names = {'id', *required}
+        for name in fields:
+            names.update(self.model.SERIALIZED_FIELDS[name])
+        columns = [getattr(self.model, name) for name in sorted(names)
+                   if name in mapper.column_attrs]
+        relationships = [selectinload(getattr(self.model, name))
+                         for name in sorted(names) if name in mapper.relationships]
+        return query.options(load_only(*columns), *relationships)
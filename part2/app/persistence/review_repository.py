@@ -1,26 +1,69 @@
 from app.models.review import Review
+from app.models.place import Place
 from app import db
+from sqlalchemy import func
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.replicas import replica_read
+from app.persistence.pagination import keyset_paginate
 
 class ReviewRepository(SQLAlchemyRepository):
     def __init__(self):
         """Initialize ReviewRepository with the Review model."""
         super().__init__(Review)
 
-    def get_reviews_by_place(self, place_id):
-        """Get all reviews for a specific place."""
-        return self.model.query.filter_by(place_id=place_id).all()
+    @replica_read
+    def get_place_reviews_version(self, place_id):
+        """
+        Version of the reviews of a place, or None if the place does not exist.
+
+        Returns:
+            tuple: (place updated_at, review count, latest review updated_at).
+            The place is touched by every review creation and deletion (its
+            rating aggregates change), the reviews by every edit.
+        """
+        return db.session.query(
+            Place.updated_at, func.count(Review.id), func.max(Review.updated_at)
+        ).outerjoin(Review, Review.place_id == Place.id)\
+            .filter(Place.id == place_id).group_by(Place.id).first()
+
+    @replica_read
+    def get_reviews_by_place(self, place_id, limit=None, cursor=None,
+                             fields=None):
+        """
+        Get a page of reviews for a specific place, oldest first.
+
+        Uses the (place_id, created_at) index, so the cost of a page does not
+        depend on the total number of reviews.
+
+        Args:
+            place_id: The ID of the place
+            limit: Maximum number of reviews to return
+            cursor: Cursor returned with the previous page
+            fields: Keys of to_dict() to load (sparse fieldset), or None
+
+        Returns:
+            Page of Review objects and the cursor of the next page
+        """
+        columns = [self.model.created_at, self.model.id]
+        query = self.model.query.filter_by(place_id=place_id)
+        if fields is not None:
+            query = self._load_fields(
+                query, fields, [column.key for column in columns])
+        return keyset_paginate(query, columns, limit, cursor)
 
+    @replica_read
     def get_reviews_by_user(self, user_id):
         """Get all reviews by a specific user."""
         return self.model.query.filter_by(user_id=user_id).all()
 
+    @replica_read
     def get_average_rating(self, place_id):
-        """Get average rating for a place."""
-        result = db.session.query(db.func.avg(self.model.rating))\
-            .filter_by(place_id=place_id).scalar()
+        """Get average rating for a place from its stored aggregates."""
+        result = db.session.query(Place.rating_average)\
+            .filter_by(id=place_id).scalar()
         return float(result) if result else 0.0
 
+    @replica_read
     def get_by_user_and_place(self, user_id: str, place_id: str) -> Review:
         """
         Get a review by user and place IDs.
@@ -0,0 +1,103 @@
+"""
+Unit of Work Module
+
+Groups the writes of a business operation into a single transaction so they
+are committed, and synced to disk, once instead of once per entity.
+
+Facade operations run inside `with unit_of_work():`. Scopes nest: an inner
+scope only flushes when it exits (so constraint errors still surface where
+the write happened) and the outermost scope commits. create_app opens a
+scope around every write request (POST/PUT/PATCH/DELETE), so a whole HTTP
+request commits at most once; it is rolled back when the response is an
+error (status >= 400) or an exception escapes.
+
+Repository and model writes take a `commit` flag: `commit=False` only stages
+the change in the session; `commit=True` (the default) calls
+`unit_of_work.commit()`, which flushes when a scope is open and commits
+otherwise.
+
+Side effects that must only happen once the data is committed (cache
+invalidation, catalog reloads) are registered with `unit_of_work.on_commit`.
+"""
+
+from contextlib import contextmanager
+from typing import Callable
+
+# Session.info keys
+UOW_DEPTH = 'uow_depth'
+UOW_ON_COMMIT = 'uow_on_commit'
+
+
+class UnitOfWork:
+    """Nestable transaction scope over the Flask-SQLAlchemy session."""
+
+    def __init__(self, db):
+        self.db = db
+
+    @property
+    def active(self) -> bool:
+        """Whether a unit of work is open on the current session."""
+        return self.db.session.info.get(UOW_DEPTH, 0) > 0
+
+    def begin(self) -> None:
+        """Open a scope (nested in the current one, if any)."""
+        info = self.db.session.info
+        info[UOW_DEPTH] = info.get(UOW_DEPTH, 0) + 1
+
+    def end(self, success: bool = True) -> None:
+        """
+        Close the innermost scope: flush it when nested, otherwise commit
+        (`success`) or roll back the whole transaction.
+        """
+        session = self.db.session
+        depth = session.info.get(UOW_DEPTH, 0) - 1
+        if depth > 0:
+            session.info[UOW_DEPTH] = depth
+            if success:
+                session.flush()
+            return
+        session.info.pop(UOW_DEPTH, None)
+        if success:
+            self._commit()
+        else:
+            self._rollback()
+
+    @contextmanager
+    def __call__(self):
+        """Run a block as a unit of work."""
+        self.begin()
+        try:
+            yield self.db.session
+        except BaseException:
+            self.end(success=False)
+            raise
+        self.end()
+
+    def commit(self) -> None:
+        """Commit now, or just flush when a unit of work will commit later."""
+        if self.active:
+            self.db.session.flush()
+        else:
+            self._commit()
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """Run `callback` after the current transaction commits."""
+        if self.active:
+            self.db.session.info.setdefault(UOW_ON_COMMIT, []).append(callback)
+        else:
+            callback()
+
+    def _commit(self) -> None:
+        session = self.db.session
+        try:
+            session.commit()
+        except Exception:
+            self._rollback()
+            raise
+        for callback in session.info.pop(UOW_ON_COMMIT, []):
+            callback()
+
+    def _rollback(self) -> None:
+        session = self.db.session
+        session.info.pop(UOW_ON_COMMIT, None)
+        session.rollback()
@@ -1,12 +1,15 @@
 from app.models.user import User
-from app import db
+from app.extensions import db, unit_of_work
 from app.persistence.repository import SQLAlchemyRepository
+from app.persistence.replicas import replica_read
+from app.persistence.pagination import keyset_paginate
 
 class UserRepository(SQLAlchemyRepository):
     def __init__(self):
         """Initialize UserRepository with the User model."""
         super().__init__(User)
 
+    @replica_read
     def get_user_by_email(self, email):
         """
         Retrieve a user by their email.
@@ -16,6 +19,7 @@ class UserRepository(SQLAlchemyRepository):
         """
         return self.model.query.filter_by(email=email).first()
 
+    @replica_read
     def is_email_registered(self, email):
         """
         Check if an email is already registered.
@@ -24,3 +28,36 @@ class UserRepository(SQLAlchemyRepository):
         :return: True if email exists, False otherwise.
         """
         return db.session.query(self.model.query.filter_by(email=email).exists()).scalar()
+
+    @replica_read
+    def get_page(self, limit=None, cursor=None, fields=None):
+        """
+        Get a page of users ordered by email (served by its unique index).
+
+        Args:
+            limit: Maximum number of users to return
+            cursor: Cursor returned with the previous page
+            fields: Keys of to_dict() to load (sparse fieldset), or None
+
+        Returns:
+            Page of User objects and the cursor of the next page
+        """
+        columns = [self.model.email]
+        query = self.model.query
+        if fields is not None:
+            query = self._load_fields(query, fields, ['email'])
+        return keyset_paginate(query, columns, limit, cursor)
+
+    def update_password_hash(self, user_id, password_hash):
+        """
+        Replace the stored password hash of a user.
+
+        Written with a bulk UPDATE because the model's password validator
+        expects a raw password, not a hash.
+
+        :param user_id: ID of the user.
+        :param password_hash: New bcrypt hash.
+        """
+        self.model.query.filter_by(id=user_id).update(
+            {"password": password_hash}, synchronize_session=False)
+        unit_of_work.commit()
@@ -0,0 +1,284 @@
+"""
+Response Cache Module
+
+Caches whole JSON responses of the public read endpoints (the places
+listing, a place, its reviews, the amenities...) for anonymous GET
+requests, so a hit skips the handler: no query, no serialization. Requests
+carrying an Authorization header are never served from or stored in the
+cache.
+
+Entries are keyed on the path and the normalized query string (parameters
+sorted), so `?limit=5&sort=price` and `?sort=price&limit=5` share one entry.
+Only 200 responses that are neither private nor no-store are stored.
+Validators are kept, so a hit still answers 304 to a matching
+If-None-Match.
+
+Freshness:
+    - an entry younger than RESPONSE_CACHE_TTL is served as is (HIT);
+    - for RESPONSE_CACHE_STALE_TTL seconds more it is served stale (STALE)
+      while a background thread re-runs the request and replaces it
+      (stale-while-revalidate), one refresh per entry at a time;
+    - after that it is gone and the next request computes it (MISS).
+The X-Cache header tells which case applied and Age how old the entry is.
+
+HBnBFacade drops the affected entries once its writes commit
+(`invalidate_places`, `invalidate_reviews`, `invalidate_amenities`,
+`clear`). Writes that bypass the facade are picked up after the TTL.
+
+Backends: the in-process LRUCache, bounded by the total size of the cached
+bodies, or a RedisCache shared by every worker.
+
+Configuration (Flask config keys):
+    RESPONSE_CACHE (bool): Enable the cache (off by default).
+    RESPONSE_CACHE_TYPE (str): 'simple' (default) or 'redis' (uses
+        CACHE_REDIS_URL and CACHE_KEY_PREFIX).
+    RESPONSE_CACHE_MAX_BYTES (int): Size bound of the 'simple' backend.
+    RESPONSE_CACHE_TTL (int): Seconds an entry is fresh.
+    RESPONSE_CACHE_STALE_TTL (int): Seconds a stale entry may still be served.
+    RESPONSE_CACHE_ENDPOINTS (iterable): Endpoints whose responses are cached.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+from flask import Response, current_app, request
+
+from app.cache import LRUCache, NullCache, RedisCache
+
+logger = logging.getLogger(__name__)
+
+API_PREFIX = '/api/v1'
+
+# request.environ keys: the cache key of a request to store, the
+# invalidation generation it started at, and the marker of refreshes
+_KEY = 'hbnb.response_cache.key'
+_GENERATION = 'hbnb.response_cache.generation'
+_REVALIDATE = 'hbnb.response_cache.revalidate'
+
+# Recomputed by Response, or specific to one client
+_SKIPPED_HEADERS = {'content-length', 'set-cookie', 'age', 'x-cache',
+                    'server-timing', 'x-query-count'}
+
+
+def _entry_size(entry: Dict[str, Any]) -> int:
+    return len(entry['body']) + sum(len(k) + len(v) for k, v in entry['headers'])
+
+
+def cache_key(path: str, args) -> str:
+    """Key of a path and its query arguments, in a normalized order."""
+    return f"{path}?{urlencode(sorted(args.items(multi=True)))}"
+
+
+class ResponseCache:
+    """Response cache of anonymous GETs, initialised like an extension."""
+
+    def __init__(self):
+        self.enabled = False
+        self.backend = NullCache()
+        self.ttl = 30
+        self.stale_ttl = 300
+        self.endpoints = frozenset()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Dict[str, Any] = {}
+        self._generation = 0
+        self._counters = {"hits": 0, "stale_hits": 0, "misses": 0,
+                          "stores": 0, "revalidations": 0,
+                          "invalidations": 0, "bytes_saved": 0}
+        self._lock = threading.Lock()
+
+    def init_app(self, app, backend=None) -> None:
+        """Configure the backend and register the request hooks."""
+        self.enabled = bool(app.config.get('RESPONSE_CACHE'))
+        self.ttl = app.config.get('RESPONSE_CACHE_TTL', 30)
+        self.stale_ttl = app.config.get('RESPONSE_CACHE_STALE_TTL', 300)
+        self.endpoints = frozenset(app.config.get('RESPONSE_CACHE_ENDPOINTS', ()))
+        timeout = self.ttl + self.stale_ttl
+        if backend is not None:
+            self.backend = backend
+        elif not self.enabled:
+            self.backend = NullCache()
+        elif app.config.get('RESPONSE_CACHE_TYPE') == 'redis':
+            import redis  # Optional dependency, only needed for this backend
+            client = redis.Redis.from_url(app.config['CACHE_REDIS_URL'])
+            self.backend = RedisCache(
+                client, timeout,
+                app.config.get('CACHE_KEY_PREFIX', 'hbnb:') + 'response:')
+        else:
+            self.backend = LRUCache(
+                max_entries=app.config.get('CACHE_MAX_ENTRIES', 10000),
+                default_timeout=timeout,
+                max_bytes=app.config.get('RESPONSE_CACHE_MAX_BYTES',
+                                         32 * 1024 * 1024),
+                sizeof=_entry_size)
+        self.reset_stats()
+
+        if self.enabled:
+            app.before_request(self.serve_cached)
+            app.after_request(self.store_response)
+        app.extensions['hbnb_response_cache'] = self
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    def _is_cacheable(self) -> bool:
+        return (request.method == 'GET' and request.endpoint in self.endpoints
+                and 'Authorization' not in request.headers)
+
+    # --------------------------------------------
+    # REQUEST HOOKS
+    # --------------------------------------------
+
+    def serve_cached(self) -> Optional[Response]:
+        """before_request hook: answer from the cache when possible."""
+        if not self._is_cacheable():
+            return None
+        key = cache_key(request.path, request.args)
+        request.environ[_GENERATION] = self._generation
+        if request.environ.get(_REVALIDATE):
+            request.environ[_KEY] = key
+            return None
+
+        entry = self.backend.get(key)
+        age = time.time() - entry['stored_at'] if entry else None
+        if entry is None or age >= self.ttl + self.stale_ttl:
+            self._count("misses")
+            request.environ[_KEY] = key
+            return None
+
+        if age < self.ttl:
+            self._count("hits")
+            state = 'HIT'
+        else:
+            self._count("stale_hits")
+            state = 'STALE'
+            self._revalidate(key)
+        self._count("bytes_saved", len(entry['body']))
+
+        response = Response(entry['body'], status=entry['status'],
+                            headers=entry['headers'])
+        response.headers['Age'] = str(int(age))
+        response.headers['X-Cache'] = state
+        return response.make_conditional(request)
+
+    def store_response(self, response: Response) -> Response:
+        """after_request hook: store the response computed on a miss."""
+        key = request.environ.get(_KEY)
+        if key is None:
+            return response
+        response.headers.setdefault('X-Cache', 'MISS')
+        cache_control = response.cache_control
+        if (response.status_code != 200 or response.direct_passthrough
+                or cache_control.private or cache_control.no_store
+                or 'Set-Cookie' in response.headers
+                # A write committed since the response was computed
+                or request.environ[_GENERATION] != self._generation):
+            return response
+
+        entry = {
+            'body': response.get_data(as_text=True),
+            'status': response.status_code,
+            'headers': [[name, value] for name, value in response.headers
+                        if name.lower() not in _SKIPPED_HEADERS],
+            'stored_at': time.time(),
+        }
+        self.backend.set(key, entry)
+        self._count("stores")
+        return response
+
+    # --------------------------------------------
+    # STALE-WHILE-REVALIDATE
+    # --------------------------------------------
+
+    def _revalidate(self, key: str) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix='response-cache')
+            app = current_app._get_current_object()
+            self._refreshing[key] = self._executor.submit(
+                self._refresh, app, key, request.path,
+                request.query_string.decode('latin-1'))
+        self._count("revalidations")
+
+    def _refresh(self, app, key: str, path: str, query_string: str) -> None:
+        """Re-run an anonymous GET, whose response replaces the entry."""
+        try:
+            with app.test_request_context(
+                    path, query_string=query_string,
+                    environ_base={_REVALIDATE: True}):
+                app.full_dispatch_request()
+        except Exception:
+            logger.exception("Could not refresh the cached response of %s", key)
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait for the refreshes in progress (at shutdown, or in tests)."""
+        with self._lock:
+            futures = list(self._refreshing.values())
+        wait(futures, timeout=timeout)
+
+    # --------------------------------------------
+    # INVALIDATION
+    # --------------------------------------------
+
+    def _invalidate(self, *prefixes: str) -> None:
+        with self._lock:
+            self._generation += 1
+        for prefix in prefixes:
+            self.backend.delete_prefix(prefix)
+        self._count("invalidations")
+
+    def invalidate_places(self, *place_ids: str) -> None:
+        """Drop the places listing and the given places (all when none)."""
+        if not place_ids:
+            self._invalidate(f'{API_PREFIX}/places/')
+            return
+        # A place's prefix also covers its reviews listing
+        self._invalidate(f'{API_PREFIX}/places/?',
+                         f'{API_PREFIX}/places/search?',
+                         *(f'{API_PREFIX}/places/{place_id}'
+                           for place_id in place_ids))
+
+    def invalidate_reviews(self, review_id: str, *place_ids: str) -> None:
+        """Drop a review, and its places with their aggregates and listings."""
+        self._invalidate(f'{API_PREFIX}/{review_id}?')
+        self.invalidate_places(*place_ids)
+
+    def invalidate_amenities(self) -> None:
+        """Drop the amenity listing and every amenity."""
+        self._invalidate(f'{API_PREFIX}/amenities/')
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._invalidate('')
+
+    # --------------------------------------------
+    # METRICS
+    # --------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the counters, the hit ratio and the bytes saved."""
+        with self._lock:
+            stats = dict(self._counters)
+        served = stats["hits"] + stats["stale_hits"]
+        lookups = served + stats["misses"]
+        stats["hit_ratio"] = served / lookups if lookups else 0.0
+        stats["backend"] = type(self.backend).__name__
+        stats["size_bytes"] = getattr(self.backend, 'total_bytes', None)
+        stats["enabled"] = self.enabled
+        return stats
+
+    def reset_stats(self) -> None:
+        """Reset the counters to zero."""
+        with self._lock:
+            for name in self._counters:
+                self._counters[name] = 0
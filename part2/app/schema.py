@@ -0,0 +1,59 @@
+"""
+Schema revision check.
+
+The schema is created and upgraded by the Alembic migrations
+(`flask db upgrade`), not by the application. At startup `check_schema`
+compares the revision stamped in the database with the head of the
+migration scripts: one query on alembic_version, and the scripts' headers
+read from disk, without connecting to anything else.
+
+Configuration (Flask config keys):
+    SCHEMA_CHECK (str): 'warn' (default) logs a warning when the database is
+        not at the head revision, 'error' refuses to start, 'off' skips the
+        check.
+"""
+
+import logging
+
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+
+from app.extensions import db
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaOutOfDate(RuntimeError):
+    """Raised when the database is not at the head migration revision."""
+
+
+def head_revisions(directory):
+    """Head revisions of the migration scripts in directory."""
+    config = Config()
+    config.set_main_option('script_location', directory)
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def current_revisions(engine):
+    """Revisions stamped in the database (empty if it was never migrated)."""
+    with engine.connect() as connection:
+        return set(MigrationContext.configure(connection).get_current_heads())
+
+
+def check_schema(app, directory):
+    """Compare the database revision with the migrations' head."""
+    mode = app.config.get('SCHEMA_CHECK', 'warn')
+    if mode == 'off':
+        return
+    with app.app_context():
+        current = current_revisions(db.engine)
+    expected = head_revisions(directory)
+    if current == expected:
+        return
+    message = (f"Database schema is at revision "
+               f"{', '.join(sorted(current)) or 'none'}, expected "
+               f"{', '.join(sorted(expected))}: run `flask db upgrade`")
+    if mode == 'error':
+        raise SchemaOutOfDate(message)
+    logger.warning(message)
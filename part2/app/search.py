@@ -0,0 +1,182 @@
+"""
+Full-text search helpers for the HBnB application.
+
+Place titles and descriptions and review texts are indexed in SQLite FTS5
+tables, `places_fts` and `reviews_fts`. They are external-content tables:
+they only hold the index, keyed by the rowid of the indexed row, and read
+the text back from `places` and `reviews` when needed. Triggers on the
+indexed tables keep them in sync with every write, including the ones
+that bypass the ORM (bulk imports, the benchmark dataset).
+
+The tables and triggers are created with the schema (`db.create_all()` or
+`flask db upgrade`); `flask --app run rebuild-search-index` rebuilds them
+from the indexed tables.
+
+The index is keyed by the rowid of the indexed rows. `places` and `reviews`
+have string primary keys, so that rowid is implicit, and VACUUM may
+renumber implicit rowids, which would silently point the index at other
+rows. Compact the database with `flask --app run vacuum`, which rebuilds
+the index afterwards, never with a bare VACUUM.
+
+Features:
+- DDL of the index of a table, run when the table is created or dropped.
+- Names of the index tables, which Alembic autogenerate must leave alone.
+- Conversion of free text into a safe FTS5 query.
+- HTML snippets of the matched text, with the query words in <mark>.
+"""
+
+import bisect
+import html
+import re
+import unicodedata
+from typing import Dict, List, Sequence, Set
+
+from sqlalchemy import DDL, event, text
+
+TOKENIZER = 'unicode61 remove_diacritics 2'
+# Words of a query beyond this are ignored
+MAX_TERMS = 16
+# Words of text in a snippet
+SNIPPET_TOKENS = 16
+
+# Tables FTS5 creates next to each index table (<index>_<suffix>)
+SHADOW_TABLES = ('data', 'idx', 'content', 'docsize', 'config')
+
+# Letters and digits, as split by the unicode61 tokenizer
+_WORD = re.compile(r'[^\W_]+')
+
+# Indexed tables: {table name: indexed columns}
+INDEXES: Dict[str, Sequence[str]] = {}
+
+
+def fts_table(table: str) -> str:
+    """Name of the FTS5 table indexing a table."""
+    return f'{table}_fts'
+
+
+def index_tables() -> Set[str]:
+    """
+    Names of the FTS5 tables and their shadow tables. They are created by
+    `index_ddl`, not by the models' metadata, so autogenerate would drop
+    them (see migrations/env.py).
+    """
+    names = set()
+    for table in INDEXES:
+        fts = fts_table(table)
+        names.add(fts)
+        names.update(f'{fts}_{suffix}' for suffix in SHADOW_TABLES)
+    return names
+
+
+def index_ddl(table: str, columns: Sequence[str]) -> List[str]:
+    """Statements creating the FTS5 index of columns of a table."""
+    fts = fts_table(table)
+    names = ', '.join(columns)
+    new = ', '.join(f'new.{name}' for name in columns)
+    old = ', '.join(f'old.{name}' for name in columns)
+    delete = (f"INSERT INTO {fts}({fts}, rowid, {names}) "
+              f"VALUES ('delete', old.rowid, {old});")
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+    return [
+        f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', "
+        f"content_rowid='rowid', tokenize='{TOKENIZER}')",
+        f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} "
+        f"BEGIN {insert} END",
+        f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} "
+        f"BEGIN {delete} END",
+        f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+def index_table(table, columns: Sequence[str]) -> None:
+    """
+    Index columns of a Table in full text.
+
+    The index is created after the table and dropped before it (its
+    triggers are dropped with the table), on SQLite only.
+    """
+    INDEXES[table.name] = tuple(columns)
+    for statement in index_ddl(table.name, columns):
+        event.listen(table, 'after_create',
+                     DDL(statement).execute_if(dialect='sqlite'))
+    event.listen(table, 'before_drop', DDL(
+        f"DROP TABLE IF EXISTS {fts_table(table.name)}"
+    ).execute_if(dialect='sqlite'))
+
+
+def rebuild(session) -> Dict[str, int]:
+    """
+    Rebuild every index from its table, then merge its segments.
+
+    Does not commit. Returns the number of indexed rows of each table.
+    """
+    rows = {}
+    for table in INDEXES:
+        fts = fts_table(table)
+        session.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')"))
+        session.execute(text(f"INSERT INTO {fts}({fts}) VALUES ('optimize')"))
+        rows[table] = session.execute(
+            text(f"SELECT COUNT(*) FROM {table}")).scalar()
+    return rows
+
+
+def words(query: str) -> List[str]:
+    """
+    Words of free text, at most MAX_TERMS.
+
+    Raises:
+        ValueError: If the text has no word.
+    """
+    found = _WORD.findall(query or '')[:MAX_TERMS]
+    if not found:
+        raise ValueError("q must contain at least one word.")
+    return found
+
+
+def match_query(query_words: Sequence[str]) -> str:
+    """
+    FTS5 query matching the rows containing every word.
+
+    Each word is quoted, so operators in the input are searched as plain
+    text instead of being FTS5 syntax.
+    """
+    return ' '.join(f'"{word}"' for word in query_words)
+
+
+def _fold(word: str) -> str:
+    """A word as the tokenizer indexes it: without case or diacritics."""
+    return ''.join(char for char in unicodedata.normalize('NFKD', word)
+                   if not unicodedata.combining(char)).casefold()
+
+
+def snippet(value: str, query_words: Sequence[str],
+            tokens: int = SNIPPET_TOKENS) -> str:
+    """
+    HTML snippet of a text: the `tokens` words holding the most matches of
+    the query words, escaped, with the matches in <mark> and '…' where the
+    text is cut.
+    """
+    found = list(_WORD.finditer(value))
+    if not found:
+        return html.escape(value, quote=False)
+    wanted = {_fold(word) for word in query_words}
+    hits = [i for i, match in enumerate(found) if _fold(match.group()) in wanted]
+    start = 0
+    if len(found) > tokens and hits:
+        # Start a little before the hit opening the densest window
+        start = max(hits, key=lambda i: bisect.bisect_left(hits, i + tokens)
+                    - bisect.bisect_left(hits, i))
+        start = max(0, min(start - 2, len(found) - tokens))
+    end = min(len(found), start + tokens)
+
+    parts = ['…' if start else '']
+    position = found[start].start() if start else 0
+    for i in (hit for hit in hits if start <= hit < end):
+        parts.append(html.escape(value[position:found[i].start()], quote=False))
+        parts.append(f'<mark>{html.escape(found[i].group(), quote=False)}</mark>')
+        position = found[i].end()
+    stop = found[end - 1].end() if end < len(found) else len(value)
+    parts.append(html.escape(value[position:stop], quote=False))
+    parts.append('…' if end < len(found) else '')
+    return ''.join(parts)
@@ -0,0 +1,127 @@
+"""
+Serialization Module
+
+JSON encoding of API responses. Handlers return plain dictionaries (the
+output of `to_dict()`) whose values may be datetimes, dates or UUIDs: the
+encoder writes them as ISO 8601 strings, the format of `isoformat()`, so
+models no longer format them field by field.
+
+Encoders (same output, interchangeable):
+- OrjsonEncoder: orjson, a C extension, several times faster than the
+  standard library; used by default when installed.
+- StdlibEncoder: the standard library `json`, the fallback.
+
+`JSONSerializer` follows the Flask extension pattern: instantiated once in
+app/extensions.py, `init_app` picks the encoder and replaces the
+application/json representation of the Flask-RESTx Api, which otherwise
+encodes with the standard library.
+
+Configuration (Flask config keys):
+    JSON_ENCODER (str): 'auto' (default: orjson when installed), 'orjson'
+        or 'json'.
+"""
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from flask import current_app, make_response
+
+from app.instrumentation import measure
+
+
+def json_default(obj: Any) -> Any:
+    """Encode the values the JSON encoders do not handle natively."""
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibEncoder:
+    """Encoder based on the standard library."""
+
+    name = 'json'
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            text = json.dumps(obj, default=json_default, indent=2,
+                              ensure_ascii=False)
+        else:
+            text = json.dumps(obj, default=json_default, separators=(',', ':'),
+                              ensure_ascii=False)
+        return text.encode('utf-8')
+
+    def loads(self, data) -> Any:
+        return json.loads(data)
+
+
+class OrjsonEncoder:
+    """Encoder based on orjson, which handles datetimes and UUIDs in C."""
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson  # Optional dependency, only needed for this encoder
+        self._orjson = orjson
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        option = self._orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= self._orjson.OPT_INDENT_2
+        return self._orjson.dumps(obj, default=json_default, option=option)
+
+    def loads(self, data) -> Any:
+        return self._orjson.loads(data)
+
+
+def get_encoder(name: str = 'auto'):
+    """Return the encoder called name, or the fastest available for 'auto'."""
+    if name == 'json':
+        return StdlibEncoder()
+    if name == 'orjson':
+        return OrjsonEncoder()
+    if name != 'auto':
+        raise ValueError(f"Unknown JSON encoder: {name}")
+    try:
+        return OrjsonEncoder()
+    except ImportError:
+        return StdlibEncoder()
+
+
+class JSONSerializer:
+    """JSON encoding of the API responses, initialised like an extension."""
+
+    def __init__(self):
+        self.encoder = get_encoder()
+
+    def init_app(self, app, api=None) -> None:
+        """Choose the encoder and use it for the Api's JSON responses."""
+        self.encoder = get_encoder(app.config.get('JSON_ENCODER', 'auto'))
+        if api is not None:
+            api.representations['application/json'] = self.output_json
+        app.extensions['hbnb_json'] = self
+
+    def dumps(self, obj: Any, indent: bool = False) -> bytes:
+        """Encode obj as UTF-8 JSON."""
+        return self.encoder.dumps(obj, indent)
+
+    def loads(self, data) -> Any:
+        """Decode JSON text or bytes."""
+        return self.encoder.loads(data)
+
+    def output_json(self, data, code, headers=None):
+        """Flask-RESTx representation: a response with a JSON body."""
+        # Readable output in debug mode, like Flask-RESTx's own encoder
+        with measure('serialize'):
+            body = self.dumps(data, indent=current_app.debug) + b"\n"
+        response = make_response(body, code)
+        response.headers.extend(headers or {})
+        return response
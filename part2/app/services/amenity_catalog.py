@@ -0,0 +1,139 @@
+"""
+Amenity Catalog Module
+
+Amenities are a small, read-mostly table, so the whole table is kept in
+memory as an immutable snapshot indexed by id and by name. Place validation
+and the amenity listing read the snapshot instead of querying the database.
+
+Every amenity write goes through HBnBFacade, which bumps the catalog version;
+the next read notices that its snapshot is older than the current version and
+reloads it. Snapshots also expire after AMENITY_CATALOG_TTL seconds, which
+bounds how long a worker can miss writes made by another worker. An id that
+is not in the snapshot is looked up by primary key before it is reported
+missing, and the snapshot is reloaded when the amenity exists, so an
+amenity created by another worker can be used right away.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy.orm import make_transient_to_detached
+
+from app.extensions import db
+from app.models.amenity import Amenity
+
+
+class CatalogSnapshot(NamedTuple):
+    """Immutable view of the amenities table at a given version."""
+    version: int
+    loaded_at: float
+    records: Dict[str, Dict[str, Any]]
+    by_id: Dict[str, Dict[str, Any]]
+    by_name: Dict[str, Dict[str, Any]]
+    ordered: List[Dict[str, Any]]
+
+
+class AmenityCatalog:
+    """In-process, versioned catalog of every amenity."""
+
+    def __init__(self, ttl: Optional[float] = 60):
+        self.ttl = ttl
+        self._version = 0
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app) -> None:
+        """Configure the catalog; it is loaded on first use."""
+        self.ttl = app.config.get('AMENITY_CATALOG_TTL', self.ttl)
+        self._snapshot = None
+
+    @property
+    def version(self) -> int:
+        """Current version; bumped on every amenity write."""
+        return self._version
+
+    def bump(self) -> None:
+        """Mark the loaded snapshot as stale after an amenity write."""
+        with self._lock:
+            self._version += 1
+
+    def load(self) -> CatalogSnapshot:
+        """Read the amenities table into a new snapshot."""
+        version = self._version
+        amenities = Amenity.query.order_by(Amenity.created_at, Amenity.id).all()
+        records = {a.id: {"id": a.id, "name": a.name,
+                          "created_at": a.created_at,
+                          "updated_at": a.updated_at} for a in amenities}
+        ordered = [a.to_dict() for a in amenities]
+        by_id = {a["id"]: a for a in ordered}
+        self._snapshot = CatalogSnapshot(
+            version=version, loaded_at=time.monotonic(), records=records,
+            by_id=by_id, by_name={a["name"]: a for a in ordered},
+            ordered=ordered)
+        return self._snapshot
+
+    def snapshot(self) -> CatalogSnapshot:
+        """Return an up-to-date snapshot, reloading it only when stale."""
+        snapshot = self._snapshot
+        if (snapshot is None or snapshot.version != self._version
+                or (self.ttl and time.monotonic() - snapshot.loaded_at > self.ttl)):
+            snapshot = self.load()
+        return snapshot
+
+    def covering(self, amenity_ids: Iterable[str]) -> CatalogSnapshot:
+        """
+        Return a snapshot holding every existing amenity of `amenity_ids`.
+
+        The ids absent from the current snapshot are looked up by primary
+        key; when one of them exists the snapshot was stale and is reloaded.
+        """
+        snapshot = self.snapshot()
+        unknown = {amenity_id for amenity_id in amenity_ids
+                   if amenity_id not in snapshot.records}
+        if unknown and db.session.query(Amenity.id).filter(
+                Amenity.id.in_(unknown)).first() is not None:
+            snapshot = self.load()
+        return snapshot
+
+    def all(self) -> List[Dict[str, Any]]:
+        """Return every amenity as a dictionary."""
+        return self.snapshot().ordered
+
+    def get(self, amenity_id: str) -> Optional[Dict[str, Any]]:
+        """Return an amenity by id, or None."""
+        return self.covering([amenity_id]).by_id.get(amenity_id)
+
+    def get_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return an amenity by name, or None."""
+        return self.snapshot().by_name.get(name)
+
+    def missing(self, amenity_ids: Iterable[str]) -> List[str]:
+        """Return the ids that do not belong to any amenity."""
+        amenity_ids = list(amenity_ids)
+        by_id = self.covering(amenity_ids).by_id
+        return [amenity_id for amenity_id in amenity_ids
+                if amenity_id not in by_id]
+
+    def instances(self, amenity_ids: Iterable[str]) -> List[Amenity]:
+        """
+        Return session-bound Amenity objects built from the snapshot.
+
+        The objects are attached with merge(load=False), so associating them
+        with a place does not issue any SELECT (unless an id is missing from
+        the snapshot, see `covering`).
+
+        Raises:
+            ValueError: If an id does not belong to any amenity.
+        """
+        amenity_ids = list(amenity_ids)
+        records = self.covering(amenity_ids).records
+        result = []
+        for amenity_id in amenity_ids:
+            record = records.get(amenity_id)
+            if record is None:
+                raise ValueError("Amenity not found.")
+            amenity = Amenity(**record)
+            make_transient_to_detached(amenity)
+            result.append(db.session.merge(amenity, load=False))
+        return result
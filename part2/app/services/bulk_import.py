@@ -0,0 +1,355 @@
+"""
+Bulk Import Module
+
+Streams amenities, places or reviews from NDJSON or CSV into the database.
+Rows are validated with the same `@validates` rules as the API, then
+written in batches of one `executemany` INSERT per table. Each batch is
+committed with `unit_of_work.commit()`: on its own when no unit of work is
+open (CLI), otherwise together with the enclosing one (the admin request),
+and the `on_commit` callback of the importer runs once the batch is
+committed. A row that fails validation, or that references a
+user/place/amenity that does not exist, is reported with its line number
+and skipped; the rest of the batch is still imported.
+
+Features:
+- NDJSON and CSV readers that never hold the whole input in memory.
+- One reference-check query per referenced table and batch instead of one
+  per row (amenities: one lookup by id, one by name, only for the
+  references missing from the catalog snapshot).
+- Per-row errors without aborting the batch, capped in the report.
+"""
+
+import csv
+import json
+import uuid
+from datetime import datetime
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Tuple)
+
+from sqlalchemy import Float, Integer, inspect as sa_inspect, select
+from sqlalchemy.exc import IntegrityError
+
+from app.extensions import db, unit_of_work
+from app.geo import grid_cell
+from app.models.amenity import Amenity
+from app.models.place import Place, place_amenity
+from app.models.review import Review
+from app.models.user import User
+
+BATCH_SIZE = 5000
+MAX_REPORTED_ERRORS = 1000
+FORMATS = ('ndjson', 'csv')
+
+
+class RowError(NamedTuple):
+    """A rejected input row."""
+    line: int
+    error: str
+
+
+class ImportReport:
+    """Outcome of a bulk import."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.total = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[RowError] = []
+
+    def reject(self, line: int, error: str) -> None:
+        """Record a row that was not imported."""
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(line, error))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a dictionary for serialization."""
+        return {
+            "kind": self.kind,
+            "total": self.total,
+            "imported": self.imported,
+            "failed": self.failed,
+            "errors": [e._asdict() for e in self.errors],
+            "errors_truncated": self.failed > len(self.errors)
+        }
+
+
+# --------------------------------------------
+# READERS
+# --------------------------------------------
+
+def read_ndjson(lines: Iterable[str]) -> Iterator[Tuple[int, Any]]:
+    """Yield (line number, object or error message) for every JSON line."""
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError as e:
+            yield number, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(row, dict):
+            yield number, "Each line must be a JSON object"
+            continue
+        yield number, row
+
+
+def read_csv(lines: Iterable[str]) -> Iterator[Tuple[int, Any]]:
+    """Yield (line number, row) for every CSV record; empty cells are dropped."""
+    reader = csv.DictReader(lines)
+    for row in reader:
+        yield reader.line_num, {k: v for k, v in row.items()
+                                if k and v not in (None, '')}
+
+
+def read_rows(lines: Iterable[str], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """Dispatch to the reader of the given format."""
+    if fmt == 'ndjson':
+        return read_ndjson(lines)
+    if fmt == 'csv':
+        return read_csv(lines)
+    raise ValueError(f"Unsupported format: {fmt}. Use one of {', '.join(FORMATS)}")
+
+
+# --------------------------------------------
+# IMPORTER
+# --------------------------------------------
+
+class BulkImporter:
+    """
+    Validate and insert rows of one kind in batches.
+
+    Args:
+        kind: 'amenities', 'places' or 'reviews'.
+        catalog: AmenityCatalog used to resolve place amenities by id or name.
+        batch_size: Rows per transaction.
+        coerce: Convert text cells to the column types (used for CSV input).
+        on_commit: Called after each batch that imported rows is committed
+            (cache invalidation).
+    """
+
+    KINDS = ('amenities', 'places', 'reviews')
+
+    def __init__(self, kind: str, catalog, batch_size: int = BATCH_SIZE,
+                 coerce: bool = False,
+                 on_commit: Optional[Callable[[], None]] = None):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unsupported kind: {kind}. Use one of {', '.join(self.KINDS)}")
+        self.kind = kind
+        self.catalog = catalog
+        self.batch_size = max(1, int(batch_size))
+        self.coerce = coerce
+        self.on_commit = on_commit
+        self.report = ImportReport(kind)
+        self._amenity_names = set()
+
+    def run(self, rows: Iterable[Tuple[int, Any]]) -> ImportReport:
+        """Import every row and return the report."""
+        batch = []
+        for line, row in rows:
+            self.report.total += 1
+            if isinstance(row, str):
+                self.report.reject(line, row)
+                continue
+            batch.append((line, row))
+            if len(batch) >= self.batch_size:
+                self._flush(batch)
+                batch = []
+        if batch:
+            self._flush(batch)
+        return self.report
+
+    # Row validation --------------------------------------------------
+
+    def _common(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Id and timestamps, taken from the row when present."""
+        now = datetime.utcnow()
+        values = {"id": str(row.get('id') or uuid.uuid4())}
+        for key in ('created_at', 'updated_at'):
+            value = row.get(key)
+            values[key] = datetime.fromisoformat(value) if value else now
+        return values
+
+    def _validated(self, model, row: Dict[str, Any], fields,
+                   required) -> Dict[str, Any]:
+        """
+        Pick the model fields of a row and run the model's `@validates` rules.
+
+        The validators are taken from the mapper and called directly: they
+        only look at the value, and skipping the instrumented constructor
+        more than halves the cost of a row. CSV text is first converted to
+        the column type.
+        """
+        validators = sa_inspect(model).validators
+        values = {}
+        for field in fields:
+            if field not in row:
+                if field in required:
+                    raise ValueError(f"Missing required field: {field}")
+                values[field] = None
+                continue
+            value = row[field]
+            if self.coerce and isinstance(value, str):
+                column_type = model.__table__.c[field].type
+                if isinstance(column_type, Integer):
+                    value = int(value)
+                elif isinstance(column_type, Float):
+                    value = float(value)
+            if field in validators:
+                value = validators[field][0](None, field, value)
+            values[field] = value
+        return values
+
+    def _validate_amenity(self, row):
+        values = self._validated(Amenity, row, ('name',), ('name',))
+        if (values['name'] in self._amenity_names
+                or self.catalog.get_by_name(values['name'])):
+            raise ValueError("Amenity already exists.")
+        self._amenity_names.add(values['name'])
+        return dict(self._common(row), **values), []
+
+    def _validate_place(self, row):
+        values = self._validated(
+            Place, row,
+            ('title', 'description', 'price', 'latitude', 'longitude', 'owner_id'),
+            ('title', 'price', 'latitude', 'longitude', 'owner_id'))
+        values['geo_cell'] = grid_cell(values['latitude'], values['longitude'])
+        return dict(self._common(row), **values), _references(
+            row.get('amenities'))
+
+    def _resolve_amenities(self, valid):
+        """
+        Replace the amenity references (ids or names) of a batch of places
+        by ids, rejecting the rows with an unknown one.
+
+        The references are resolved together: from the catalog snapshot,
+        then with one query by id (`covering`, which reloads a stale
+        snapshot) and one by name for those the snapshot does not know.
+        """
+        references = {reference for _, _, refs in valid for reference in refs}
+        snapshot = self.catalog.snapshot()
+        unknown = [reference for reference in references
+                   if reference not in snapshot.by_id
+                   and reference not in snapshot.by_name]
+        if unknown:
+            snapshot = self.catalog.covering(unknown)
+        ids = {}
+        for reference in references:
+            amenity = (snapshot.by_id.get(reference)
+                       or snapshot.by_name.get(reference))
+            if amenity:
+                ids[reference] = amenity['id']
+        names = references - ids.keys()
+        if names:
+            ids.update((name, amenity_id) for amenity_id, name in
+                       db.session.execute(select(Amenity.id, Amenity.name)
+                                          .where(Amenity.name.in_(names))))
+
+        resolved = []
+        for line, values, refs in valid:
+            missing = [reference for reference in refs if reference not in ids]
+            if missing:
+                self.report.reject(line, f"Amenity not found: {missing[0]}")
+                continue
+            resolved.append((line, values,
+                             list(dict.fromkeys(ids[r] for r in refs))))
+        return resolved
+
+    def _validate_review(self, row):
+        fields = ('text', 'rating', 'user_id', 'place_id')
+        values = self._validated(Review, row, fields, fields)
+        return dict(self._common(row), **values), []
+
+    # Batches ---------------------------------------------------------
+
+    def _flush(self, batch: List[Tuple[int, Dict[str, Any]]]) -> None:
+        """Validate, check references and insert one batch."""
+        validate = {'amenities': self._validate_amenity,
+                    'places': self._validate_place,
+                    'reviews': self._validate_review}[self.kind]
+        valid = []
+        for line, row in batch:
+            try:
+                values, amenity_ids = validate(row)
+            except (ValueError, TypeError) as e:
+                self.report.reject(line, str(e))
+                continue
+            valid.append((line, values, amenity_ids))
+
+        if self.kind == 'places':
+            valid = self._resolve_amenities(valid)
+        valid = self._check_references(valid)
+        if not valid:
+            return
+        imported = self.report.imported
+        try:
+            # A savepoint, so a failure does not undo an enclosing unit of work
+            with db.session.begin_nested():
+                self._insert(valid)
+            self.report.imported += len(valid)
+        except IntegrityError:
+            self._insert_one_by_one(valid)
+        unit_of_work.commit()
+        if self.on_commit and self.report.imported > imported:
+            unit_of_work.on_commit(self.on_commit)
+
+    def _check_references(self, valid):
+        """Drop the rows pointing at users or places that do not exist."""
+        references = {'places': (('owner_id', User),),
+                      'reviews': (('user_id', User), ('place_id', Place))}
+        for field, model in references.get(self.kind, ()):
+            wanted = {values[field] for _, values, _ in valid}
+            if not wanted:
+                continue
+            found = set(db.session.execute(
+                select(model.id).where(model.id.in_(wanted))).scalars())
+            kept = []
+            for line, values, amenity_ids in valid:
+                if values[field] in found:
+                    kept.append((line, values, amenity_ids))
+                else:
+                    self.report.reject(
+                        line, f"{model.__name__} not found: {values[field]}")
+            valid = kept
+        return valid
+
+    def _insert(self, valid) -> None:
+        """Insert validated rows with one executemany per table."""
+        table = {'amenities': Amenity, 'places': Place,
+                 'reviews': Review}[self.kind].__table__
+        db.session.execute(table.insert(), [values for _, values, _ in valid])
+        links = [{"place_id": values["id"], "amenity_id": amenity_id}
+                 for _, values, amenity_ids in valid
+                 for amenity_id in amenity_ids]
+        if links:
+            db.session.execute(place_amenity.insert(), links)
+
+    def _insert_one_by_one(self, valid) -> None:
+        """Retry a batch that hit a constraint, isolating the failing rows."""
+        for row in valid:
+            try:
+                with db.session.begin_nested():
+                    self._insert([row])
+                self.report.imported += 1
+            except IntegrityError as e:
+                self.report.reject(row[0], f"Constraint violation: {e.orig}")
+
+
+def _references(amenities) -> List[str]:
+    """Amenity references of a row: a list, or comma-separated text."""
+    if not amenities:
+        return []
+    if isinstance(amenities, str):
+        return [a.strip() for a in amenities.split(',') if a.strip()]
+    if not all(isinstance(a, str) for a in amenities):
+        raise ValueError("amenities must be a list of amenity ids or names")
+    return list(amenities)
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str] = None) -> str:
+    """Guess the input format from a file name or a content type."""
+    hint = (content_type or '') + ' ' + (filename or '')
+    if 'csv' in hint.lower():
+        return 'csv'
+    return 'ndjson'
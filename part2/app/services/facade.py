@@ -1,15 +1,23 @@
 #!/usr/bin/env python3
 
+from datetime import datetime
 from app.models.user import User
 from app.models.place import Place
 from app.models.review import Review
 from app.models.amenity import Amenity
 from app.persistence.user_repository import UserRepository
-from app.persistence.place_repository import PlaceRepository
+from app.persistence.place_repository import (
+    MAX_SEARCH_RADIUS_KM, PlaceRepository)
 from app.persistence.amenity_repository import AmenityRepository
 from app.persistence.review_repository import ReviewRepository
+from app.services.amenity_catalog import AmenityCatalog
+from app.services.bulk_import import BATCH_SIZE, BulkImporter, read_rows
 from flask_sqlalchemy import SQLAlchemy
-from app.extensions import db
+from sqlalchemy.exc import IntegrityError
+from app.extensions import (db, cache, password_hasher, unit_of_work,
+                            token_revocations, response_cache)
+from app.tokens import token_claims
+from app import search
 from werkzeug.exceptions import NotFound, BadRequest, Forbidden
 
 # --------------------------------------------
@@ -26,6 +34,7 @@ class HBnBFacade:
         self.place_repo = PlaceRepository()
         self.amenity_repo = AmenityRepository()
         self.review_repo = ReviewRepository()
+        self.amenity_catalog = AmenityCatalog()
 
     # --------------------------------------------
     # USER MANAGEMENT
@@ -36,9 +45,8 @@ class HBnBFacade:
         if self.user_repo.is_email_registered(data["email"]):
             raise ValueError("Email already registered.")
 
-        user = User(**data)
-        db.session.add(user)
-        db.session.commit()
+        with unit_of_work():
+            user = self.user_repo.add(User(**data))
         return user.to_dict()
 
     def get_user(self, user_id):
@@ -48,16 +56,31 @@ class HBnBFacade:
             raise ValueError("User not found.")
         return user
 
+    def get_user_data(self, user_id):
+        """Retrieve a user as a dictionary, served from the cache when possible."""
+        return cache.get_or_load(
+            f"user:{user_id}", lambda: self.get_user(user_id).to_dict())
+
     def update_user(self, user_id, update_data, admin_override=False):
         """Update user details."""
-        user = self.get_user(user_id)
         if not admin_override and (
                 "email" in update_data or "password" in update_data):
             raise PermissionError("Only admins can modify email or password.")
 
-        for key, value in update_data.items():
-            setattr(user, key, value)
-
+        with unit_of_work():
+            user = self.get_user(user_id)
+            was_admin = user.is_admin
+            for key, value in update_data.items():
+                setattr(user, key, value)
+            unit_of_work.on_commit(lambda: cache.invalidate(f"user:{user_id}"))
+            # Tokens carry the roles: reject the ones issued before the change
+            if "password" in update_data:
+                unit_of_work.on_commit(
+                    lambda: token_revocations.revoke_user(user_id))
+            elif bool(user.is_admin) != bool(was_admin):
+                claims = token_claims({"is_admin": user.is_admin})
+                unit_of_work.on_commit(
+                    lambda: token_revocations.update_claims(user_id, claims))
         return user.to_dict()
 
     def get_user_by_email(self, email):
@@ -67,33 +90,60 @@ class HBnBFacade:
             raise ValueError("User not found.")
         return user
 
+    def authenticate(self, email, password):
+        """
+        Return the user owning these credentials, or None if the password
+        does not match. Hashes made with an outdated bcrypt cost factor are
+        replaced with a fresh hash while the plain password is at hand.
+        """
+        user = self.get_user_by_email(email)
+        if not user.verify_password(password):
+            return None
+        if password_hasher.needs_rehash(user.password):
+            with unit_of_work():
+                self.user_repo.update_password_hash(
+                    user.id, password_hasher.hash(password))
+        return user
+
     def get_all_users(self):
         """Retrieve all users."""
         return self.user_repo.get_all()
+
+    def get_users_page(self, limit=None, cursor=None, fields=None):
+        """Retrieve a page of users ordered by email."""
+        return self.user_repo.get_page(limit=limit, cursor=cursor,
+                                       fields=fields)
     
     def delete_user(self, user_id: str, current_user_id: str) -> bool:
         """Delete a user by ID."""
-        # Obtener el usuario actual y el usuario a eliminar
-        current_user = self.get_user(current_user_id)
-        user_to_delete = self.get_user(user_id)
-
-        if not user_to_delete:
-            raise ValueError("User not found")
-
-        # Permitir que los usuarios se borren a sí mismos O que un admin borre a cualquiera
-        if current_user_id != user_id and (not current_user or not current_user.is_admin):
-            raise PermissionError("Users can only delete their own account or must be admin")
-
-        # Prevenir borrar el último admin
-        if user_to_delete.is_admin and self.count_admins() <= 1:
-            raise ValueError("Cannot delete the last admin user")
-
         try:
-            db.session.delete(user_to_delete)
-            db.session.commit()
+            with unit_of_work():
+                # Obtener el usuario actual y el usuario a eliminar
+                current_user = self.get_user(current_user_id)
+                user_to_delete = self.get_user(user_id)
+
+                if not user_to_delete:
+                    raise ValueError("User not found")
+
+                # Permitir que los usuarios se borren a sí mismos O que un admin borre a cualquiera
+                if current_user_id != user_id and (not current_user or not current_user.is_admin):
+                    raise PermissionError("Users can only delete their own account or must be admin")
+
+                # Prevenir borrar el último admin
+                if user_to_delete.is_admin and self.count_admins() <= 1:
+                    raise ValueError("Cannot delete the last admin user")
+
+                db.session.delete(user_to_delete)
+                unit_of_work.on_commit(
+                    lambda: cache.invalidate(f"user:{user_id}"))
+                unit_of_work.on_commit(
+                    lambda: token_revocations.revoke_user(user_id))
+                # Their places and reviews may be gone with them
+                unit_of_work.on_commit(response_cache.clear)
             return True
+        except (ValueError, PermissionError):
+            raise
         except Exception as e:
-            db.session.rollback()
             raise Exception(f"Error deleting user: {str(e)}")
 
     # --------------------------------------------
@@ -103,7 +153,12 @@ class HBnBFacade:
     def create_amenity(self, amenity_data):
         """Create a new amenity."""
         amenity = Amenity(**amenity_data)
-        self.amenity_repo.add(amenity)
+        if self.amenity_catalog.get_by_name(amenity.name):
+            raise ValueError("Amenity already exists.")
+        with unit_of_work():
+            self.amenity_repo.add(amenity)
+            unit_of_work.on_commit(self.amenity_catalog.bump)
+            unit_of_work.on_commit(response_cache.invalidate_amenities)
         return amenity
 
     def get_amenity(self, amenity_id):
@@ -113,15 +168,48 @@ class HBnBFacade:
             raise ValueError("Amenity not found.")
         return amenity
 
+    def get_amenity_version(self, amenity_id):
+        """Version of an amenity for conditional GETs, from the catalog."""
+        amenity = self.amenity_catalog.snapshot().records.get(amenity_id)
+        if not amenity:
+            return None
+        return (amenity["updated_at"],), amenity["updated_at"]
+
+    def get_amenities_version(self):
+        """Version of the amenity listing for conditional GETs."""
+        records = self.amenity_catalog.snapshot().records.values()
+        return (len(records),
+                max((a["updated_at"] for a in records), default=None)), None
+
+    def get_amenity_data(self, amenity_id):
+        """Retrieve an amenity as a dictionary from the in-memory catalog."""
+        amenity = self.amenity_catalog.get(amenity_id)
+        if not amenity:
+            raise ValueError("Amenity not found.")
+        return amenity
+
     def get_all_amenities(self):
         """Retrieve all amenities."""
         return self.amenity_repo.get_all()
 
+    def get_all_amenities_data(self):
+        """Retrieve all amenities as dictionaries from the in-memory catalog."""
+        return self.amenity_catalog.all()
+
     def update_amenity(self, amenity_id, amenity_data):
         """Update an existing amenity."""
         amenity = self.get_amenity(amenity_id)  # Now raises error if not found
-        for key, value in amenity_data.items():
-            setattr(amenity, key, value)
+        with unit_of_work():
+            for key, value in amenity_data.items():
+                setattr(amenity, key, value)
+            # Places embed their amenities: their versions change too
+            self.place_repo.touch_places_with_amenity(amenity_id)
+            # The catalog is reloaded from committed data
+            unit_of_work.on_commit(self.amenity_catalog.bump)
+            # Places embed their amenities, so cached places may be stale too
+            unit_of_work.on_commit(lambda: cache.invalidate_prefix("place:"))
+            unit_of_work.on_commit(response_cache.invalidate_amenities)
+            unit_of_work.on_commit(response_cache.invalidate_places)
         return amenity
 
     # --------------------------------------------
@@ -141,12 +229,16 @@ class HBnBFacade:
             raise ValueError("Missing required fields.")
 
         owner = self.get_user(data['owner_id'])
-        for amenity_id in data['amenities']:
-            # This raises an error if the amenity is missing
-            self.get_amenity(amenity_id)
+        # Validated against the in-memory catalog: no query per amenity
+        if self.amenity_catalog.missing(data['amenities']):
+            raise ValueError("Amenity not found.")
 
-        place = Place(**data)
-        self.place_repo.add(place)
+        data = dict(data, amenities=self.amenity_catalog.instances(
+            data['amenities']))
+        with unit_of_work():
+            place = self.place_repo.add(Place(**data))
+            unit_of_work.on_commit(
+                lambda: response_cache.invalidate_places(place.id))
         return place.to_dict()
 
     def get_place(self, place_id):
@@ -156,29 +248,75 @@ class HBnBFacade:
             raise ValueError("Place not found.")
         return place
 
+    def get_place_version(self, place_id):
+        """Version of a place for conditional GETs, or None if it does not exist."""
+        updated_at = self.place_repo.get_updated_at(place_id)
+        return ((updated_at,), updated_at) if updated_at else None
+
+    def get_place_data(self, place_id):
+        """Retrieve a place as a dictionary, served from the cache when possible."""
+        return cache.get_or_load(
+            f"place:{place_id}", lambda: self.get_place(place_id).to_dict())
+
     def get_all_places(self):
         """Retrieve all places."""
         return self.place_repo.get_all()
 
+    def search_places(self, limit=None, cursor=None, sort='created_at',
+                      fields=None, **filters):
+        """
+        Retrieve a page of places matching the given filters, loading only
+        the keys of `fields` when given.
+        """
+        for low, high in (('min_price', 'max_price'), ('min_lat', 'max_lat'),
+                          ('min_lon', 'max_lon')):
+            if (filters.get(low) is not None and filters.get(high) is not None
+                    and filters[low] > filters[high]):
+                raise ValueError(f"{low} cannot be greater than {high}.")
+        return self.place_repo.search_places(
+            sort=sort, limit=limit, cursor=cursor, fields=fields, **filters)
+
+    def search_places_nearby(self, lat, lon, radius_km=None, nearest=None,
+                             limit=None, cursor=None, fields=None, **filters):
+        """Retrieve places around a point, ordered by distance."""
+        if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+            raise ValueError("near must be a valid 'latitude,longitude' pair.")
+        if radius_km is None and not nearest:
+            raise ValueError("near requires radius_km or nearest.")
+        if radius_km is not None and not 0 < radius_km <= MAX_SEARCH_RADIUS_KM:
+            raise ValueError(
+                f"radius_km must be a positive number up to {MAX_SEARCH_RADIUS_KM:g}.")
+        if nearest is not None and nearest <= 0:
+            raise ValueError("nearest must be a positive integer.")
+        return self.place_repo.search_nearby(
+            lat, lon, radius_km=radius_km, nearest=nearest,
+            limit=limit, cursor=cursor, fields=fields, **filters)
+
+    def search_places_text(self, q, limit=None, cursor=None, fields=None):
+        """
+        Retrieve the places whose text or reviews contain every word of q,
+        best match first.
+        """
+        return self.place_repo.search_text(
+            q, limit=limit, cursor=cursor, fields=fields)
+
     def update_place(self, place_id, place_data):
         """Update an existing place."""
-        place = self.get_place(place_id)  # Now raises error if not found
-        
-        # Manejar amenities separadamente
-        if 'amenities' in place_data:
-            amenity_ids = place_data.pop('amenities')  # Remover amenities del dict
-            amenities = []
-            for amenity_id in amenity_ids:
-                amenity = self.get_amenity(amenity_id)
-                if amenity:
-                    amenities.append(amenity)
-            place.amenities = amenities
-
-        # Actualizar otros campos
-        for key, value in place_data.items():
-            setattr(place, key, value)
-        
-        db.session.commit()
+        with unit_of_work():
+            place = self.get_place(place_id)  # Now raises error if not found
+            # Manejar amenities separadamente
+            if 'amenities' in place_data:
+                amenity_ids = place_data.pop('amenities')  # Remover amenities del dict
+                place.amenities = self.amenity_catalog.instances(amenity_ids)
+                # La tabla de asociación no actualiza la fila del lugar
+                place.updated_at = datetime.utcnow()
+
+            # Actualizar otros campos
+            for key, value in place_data.items():
+                setattr(place, key, value)
+            unit_of_work.on_commit(lambda: cache.invalidate(f"place:{place_id}"))
+            unit_of_work.on_commit(
+                lambda: response_cache.invalidate_places(place_id))
         return place.to_dict()
 
     # --------------------------------------------
@@ -219,15 +357,24 @@ class HBnBFacade:
                 rating=review_data['rating']
             )
 
-            db.session.add(review)
-            db.session.commit()
+            try:
+                with unit_of_work():
+                    self.review_repo.add(review, commit=False)
+                    self.place_repo.apply_review_rating(
+                        review.place_id, review.rating)
+                    unit_of_work.on_commit(
+                        lambda: cache.invalidate(f"place:{review.place_id}"))
+                    unit_of_work.on_commit(
+                        lambda: response_cache.invalidate_reviews(
+                            review.id, review.place_id))
+            except IntegrityError:
+                # uq_reviews_user_id_place_id
+                raise ValueError("User has already reviewed this place")
             return review
 
         except ValueError as e:
-            db.session.rollback()
             raise ValueError(f"Validation error: {str(e)}")
         except Exception as e:
-            db.session.rollback()
             raise Exception(f"Internal server error: {str(e)}")
 
     def get_review(self, review_id):
@@ -237,31 +384,132 @@ class HBnBFacade:
             raise ValueError("Review not found.")
         return review
 
+    def get_review_version(self, review_id):
+        """Version of a review for conditional GETs, or None if it does not exist."""
+        updated_at = self.review_repo.get_updated_at(review_id)
+        return ((updated_at,), updated_at) if updated_at else None
+
+    def get_place_reviews_version(self, place_id):
+        """
+        Version of the reviews of a place for conditional GETs, or None if
+        the place does not exist.
+        """
+        version = self.review_repo.get_place_reviews_version(place_id)
+        if version is None:
+            return None
+        place_updated_at, _, review_updated_at = version
+        return tuple(version), max(filter(None, (place_updated_at,
+                                                 review_updated_at)))
+
+    def get_review_data(self, review_id):
+        """Retrieve a review as a dictionary, served from the cache when possible."""
+        return cache.get_or_load(
+            f"review:{review_id}", lambda: self.get_review(review_id).to_dict())
+
     def get_all_reviews(self):
         """Retrieve all reviews."""
         return self.review_repo.get_all()
 
-    def get_reviews_by_place(self, place_id):
-        """Retrieve all reviews for a specific place."""
-        return [review for review in self.review_repo.get_all()
-                if review.place_id == place_id]
+    def get_reviews_by_place(self, place_id, limit=None, cursor=None,
+                             fields=None):
+        """Retrieve a page of reviews for a specific place."""
+        return self.review_repo.get_reviews_by_place(
+            place_id, limit=limit, cursor=cursor, fields=fields)
 
     def update_review(self, review_id, review_data):
-        """Update an existing review."""
-        review = self.get_review(review_id)  # Now raises error if not found
-        for key, value in review_data.items():
-            setattr(review, key, value)
-        db.session.commit()  # Asegurarnos de guardar los cambios
+        """Update an existing review and the rating aggregates of its place."""
+        # Read in the unit of work: the old rating must come from the
+        # primary, since the aggregates are adjusted relative to it
+        with unit_of_work():
+            review = self.get_review(review_id)  # Now raises error if not found
+            old_place_id, old_rating = review.place_id, review.rating
+            for key, value in review_data.items():
+                setattr(review, key, value)
+            if (review.place_id, review.rating) != (old_place_id, old_rating):
+                self.place_repo.apply_review_rating(
+                    old_place_id, old_rating, delta=-1)
+                self.place_repo.apply_review_rating(
+                    review.place_id, review.rating)
+            new_place_id = review.place_id
+            unit_of_work.on_commit(lambda: cache.invalidate(
+                f"review:{review_id}", f"place:{old_place_id}",
+                f"place:{new_place_id}"))
+            unit_of_work.on_commit(lambda: response_cache.invalidate_reviews(
+                review_id, old_place_id, new_place_id))
         return review.to_dict()  # Retornar el diccionario en lugar del objeto
 
     def delete_review(self, review_id):
-        """Delete an existing review."""
-        review = self.get_review(review_id)  # Now raises error if not found
-        self.review_repo.delete(review)
+        """Delete an existing review and remove it from its place's ratings."""
+        with unit_of_work():
+            review = self.get_review(review_id)  # Now raises error if not found
+            place_id = review.place_id
+            db.session.delete(review)
+            self.place_repo.apply_review_rating(
+                place_id, review.rating, delta=-1)
+            unit_of_work.on_commit(lambda: cache.invalidate(
+                f"review:{review_id}", f"place:{place_id}"))
+            unit_of_work.on_commit(lambda: response_cache.invalidate_reviews(
+                review_id, place_id))
         return True
 
+    def recompute_rating_aggregates(self):
+        """Rebuild the rating aggregates of every place from its reviews."""
+        with unit_of_work():
+            updated = self.place_repo.recompute_rating_aggregates()
+            # Reload the places loaded before the bulk UPDATEs
+            db.session.expire_all()
+            unit_of_work.on_commit(lambda: cache.invalidate_prefix("place:"))
+            unit_of_work.on_commit(response_cache.invalidate_places)
+        return updated
+
+    def rebuild_search_index(self):
+        """Rebuild the full-text index of the places and reviews."""
+        with unit_of_work():
+            rows = search.rebuild(db.session)
+            unit_of_work.on_commit(response_cache.invalidate_places)
+        return rows
+
+    def compact_database(self):
+        """
+        VACUUM the database, then rebuild the full-text index, which is keyed
+        by rowids that VACUUM may renumber (see app.search).
+        """
+        db.session.remove()
+        with db.engine.connect().execution_options(
+                isolation_level='AUTOCOMMIT') as connection:
+            connection.exec_driver_sql("VACUUM")
+        return self.rebuild_search_index()
+
     def get_review_by_user_and_place(self, user_id: str, place_id: str) -> Review:
         """
         Get a review by user and place IDs using the review repository.
         """
         return self.review_repo.get_by_user_and_place(user_id, place_id)
+
+    # --------------------------------------------
+    # BULK IMPORT
+    # --------------------------------------------
+
+    def _imported(self, kind):
+        """Drop what a committed batch of imported rows made stale."""
+        if kind == 'amenities':
+            self.amenity_catalog.bump()
+            response_cache.invalidate_amenities()
+        else:
+            cache.invalidate_prefix("place:")
+            response_cache.invalidate_places()
+
+    def bulk_import(self, kind, lines, fmt='ndjson', batch_size=BATCH_SIZE):
+        """
+        Import amenities, places or reviews from NDJSON or CSV lines.
+
+        Returns:
+            ImportReport with the imported count and the rejected rows.
+        """
+        importer = BulkImporter(kind, self.amenity_catalog,
+                                batch_size=batch_size, coerce=fmt == 'csv',
+                                on_commit=lambda: self._imported(kind))
+        report = importer.run(read_rows(lines, fmt))
+        if report.imported and kind == 'reviews':
+            self.recompute_rating_aggregates()
+        return report
@@ -0,0 +1,114 @@
+import unittest
+from contextlib import contextmanager
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.services import facade
+
+
+class AmenityCatalogTestCase(unittest.TestCase):
+    """Test cases for the in-memory amenity catalog"""
+
+    def setUp(self):
+        """Create an owner and two amenities through the facade"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.owner = User(first_name="Owner", last_name="Place",
+                          email="owner@example.com", password="Password123")
+        db.session.add(self.owner)
+        db.session.commit()
+        self.wifi = facade.create_amenity({"name": "WiFi"})
+        self.pool = facade.create_amenity({"name": "Pool"})
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    @contextmanager
+    def count_queries(self):
+        """Count the statements sent to the database inside the block."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute',
+                         before_cursor_execute)
+
+    def test_listing_does_not_query(self):
+        """Listing amenities is served from the catalog"""
+        facade.amenity_catalog.snapshot()
+        with self.count_queries() as statements:
+            response = self.client.get('/api/v1/amenities/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([a['name'] for a in response.json['data']],
+                         ["WiFi", "Pool"])
+        self.assertEqual(statements, [])
+
+    def test_place_amenities_are_validated_without_queries(self):
+        """Resolving amenity ids for a new place issues no SELECT"""
+        facade.amenity_catalog.snapshot()
+        with self.count_queries() as statements:
+            amenities = facade.amenity_catalog.instances(
+                [self.wifi.id, self.pool.id])
+        self.assertEqual(statements, [])
+
+        place = facade.create_place({
+            "title": "Cabin", "price": 80.0, "latitude": 10.0,
+            "longitude": 20.0, "owner_id": self.owner.id,
+            "amenities": [self.wifi.id, self.pool.id]})
+        self.assertEqual(sorted(a['name'] for a in place['amenities']),
+                         ["Pool", "WiFi"])
+        self.assertEqual(len(amenities), 2)
+
+    def test_unknown_amenity_is_rejected(self):
+        """A place referencing a missing amenity is refused"""
+        with self.assertRaises(ValueError):
+            facade.create_place({
+                "title": "Cabin", "price": 80.0, "latitude": 10.0,
+                "longitude": 20.0, "owner_id": self.owner.id,
+                "amenities": [self.wifi.id, "missing"]})
+
+    def test_amenity_created_elsewhere_is_found(self):
+        """An id missing from a stale snapshot is looked up before refusing"""
+        facade.amenity_catalog.snapshot()
+        # Written by another worker: this catalog's version is not bumped
+        db.session.execute(db.text(
+            "INSERT INTO amenities (id, name, created_at, updated_at) "
+            "VALUES ('sauna', 'Sauna', '2026-01-01 00:00:00', "
+            "'2026-01-01 00:00:00')"))
+        db.session.commit()
+
+        place = facade.create_place({
+            "title": "Cabin", "price": 80.0, "latitude": 10.0,
+            "longitude": 20.0, "owner_id": self.owner.id,
+            "amenities": [self.wifi.id, "sauna"]})
+        self.assertEqual(sorted(a['name'] for a in place['amenities']),
+                         ["Sauna", "WiFi"])
+        self.assertEqual(facade.get_amenity_data("sauna")['name'], "Sauna")
+
+    def test_writes_bump_the_version(self):
+        """Creating or renaming an amenity refreshes the snapshot"""
+        version = facade.amenity_catalog.version
+        facade.update_amenity(self.wifi.id, {"name": "Fast WiFi"})
+        self.assertGreater(facade.amenity_catalog.version, version)
+        self.assertEqual(facade.get_amenity_data(self.wifi.id)['name'],
+                         "Fast WiFi")
+        self.assertIsNone(facade.amenity_catalog.get_by_name("WiFi"))
+
+    def test_duplicate_name_is_rejected(self):
+        """An amenity name already in the catalog cannot be reused"""
+        with self.assertRaises(ValueError):
+            facade.create_amenity({"name": "WiFi"})
+
+
+if __name__ == '__main__':
+    unittest.main()
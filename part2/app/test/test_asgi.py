@@ -0,0 +1,181 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from app import db
+from app.asgi import async_database_uri, create_asgi_app
+from app.extensions import metrics
+from app.models.user import User
+from app.services import facade
+from config import TestingConfig
+
+
+class ASGITestCase(unittest.TestCase):
+    """Test cases for the ASGI serving mode"""
+
+    def setUp(self):
+        """Seed a file database shared by the sync and async engines"""
+        self.tmpdir = tempfile.mkdtemp()
+        path = os.path.join(self.tmpdir, 'asgi.db')
+
+        class FileConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+        self.asgi = create_asgi_app(FileConfig)
+        self.client = self.asgi.flask_app.test_client()
+        self.ctx = self.asgi.flask_app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.commit()
+        wifi = facade.create_amenity({"name": "WiFi"})
+        self.places = [facade.create_place({
+            "title": f"Place {i}", "price": 50.0 + i, "latitude": 0.0,
+            "longitude": 0.0, "owner_id": owner.id, "amenities": [wifi.id]})
+            for i in range(3)]
+
+    def tearDown(self):
+        asyncio.run(self.asgi.engine.dispose())
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        shutil.rmtree(self.tmpdir)
+
+    async def _exchange(self, path, query=b'', method='GET', headers=()):
+        """Send a request; return the status, headers and body."""
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+        async def send(message):
+            messages.append(message)
+
+        await self.asgi({
+            'type': 'http', 'method': method, 'path': path,
+            'query_string': query, 'headers': list(headers),
+            'http_version': '1.1', 'scheme': 'http',
+            'server': ('localhost', 80), 'root_path': ''
+        }, receive, send)
+        body = b''.join(m.get('body', b'') for m in messages[1:])
+        response_headers = {name.decode(): value.decode()
+                            for name, value in messages[0]['headers']}
+        return messages[0]['status'], response_headers, body
+
+    async def _request(self, path, query=b'', method='GET'):
+        status, _, body = await self._exchange(path, query, method)
+        return status, json.loads(body)
+
+    def test_async_routes_match_flask(self):
+        """Async handlers return the same responses as the Flask resources"""
+        place_id = self.places[0]['id']
+        for path, query in [('/api/v1/places/', b'limit=2&sort=-price'),
+                            (f'/api/v1/places/{place_id}', b''),
+                            (f'/api/v1/places/{place_id}/reviews', b''),
+                            ('/api/v1/amenities/', b''),
+                            ('/api/v1/amenities/', b'fields=id'),
+                            ('/api/v1/amenities/', b'fields=bogus'),
+                            ('/api/v1/places/missing', b''),
+                            ('/api/v1/places/', b'sort=title'),
+                            ('/api/v1/places/search', b'q=place+1'),
+                            ('/api/v1/places/search', b'q=+')]:
+            status, body = asyncio.run(self._request(path, query))
+            expected = self.client.get(f"{path}?{query.decode()}")
+            self.assertEqual((status, body),
+                             (expected.status_code, expected.json), path)
+
+    def test_urls_match_flask(self):
+        """Both serving modes answer the same URLs the same way"""
+        place_id = self.places[0]['id']
+        guest = User(first_name="Guest", last_name="User",
+                     email="guest@example.com", password="Password123")
+        db.session.add(guest)
+        db.session.commit()
+        review = facade.create_review({"text": "Great", "rating": 5,
+                                       "user_id": guest.id,
+                                       "place_id": place_id})
+        for path in (f'/api/v1/{review.id}', f'/api/v1/reviews/{review.id}',
+                     '/api/v1/places', f'/api/v1/places/{place_id}/reviews',
+                     '/api/v1/places/search', '/api/v1/amenities/place/x/amenities',
+                     '/api/v1/nowhere/at/all'):
+            status, headers, body = asyncio.run(self._exchange(path))
+            expected = self.client.get(path)
+            self.assertEqual((status, body), (expected.status_code, expected.data),
+                             path)
+
+    def test_conditional_get(self):
+        """Async handlers send the validators of Flask and answer 304"""
+        place_id = self.places[0]['id']
+        for path, query in [(f'/api/v1/places/{place_id}', b''),
+                            (f'/api/v1/places/{place_id}/reviews', b'limit=5'),
+                            ('/api/v1/amenities/', b'')]:
+            expected = self.client.get(f"{path}?{query.decode()}")
+            status, headers, _ = asyncio.run(self._exchange(path, query))
+            self.assertEqual(status, 200)
+            for name in ('etag', 'last-modified', 'cache-control',
+                         'x-next-cursor'):
+                self.assertEqual(headers.get(name), expected.headers.get(name),
+                                 (path, name))
+
+            status, headers, body = asyncio.run(self._exchange(
+                path, query, headers=[(b'if-none-match',
+                                       headers['etag'].encode())]))
+            self.assertEqual((status, body), (304, b''), path)
+            self.assertEqual(headers['etag'], expected.headers['etag'])
+            self.assertIn('cache-control', headers)
+
+        status, headers, _ = asyncio.run(self._exchange('/api/v1/places/missing'))
+        self.assertEqual(status, 404)
+        self.assertNotIn('etag', headers)
+
+    def test_concurrent_requests_are_isolated(self):
+        """Concurrent requests each get their own session"""
+        async def fetch_all():
+            return await asyncio.gather(*(
+                self._request(f"/api/v1/places/{place['id']}")
+                for place in self.places * 5))
+
+        results = asyncio.run(fetch_all())
+        self.assertEqual([body['title'] for _, body in results],
+                         [place['title'] for place in self.places * 5])
+
+    def test_other_routes_fall_back_to_flask(self):
+        """Routes without an async handler are served by the Flask app"""
+        status, body = asyncio.run(self._request('/api/v1/auth/protected'))
+        self.assertEqual(status, 401)
+
+    def test_async_routes_are_measured(self):
+        """Async handlers are recorded like the Flask routes"""
+        metrics.reset()
+        asyncio.run(self._request(f"/api/v1/places/{self.places[0]['id']}"))
+        asyncio.run(self._request('/api/v1/places/missing'))
+        values = metrics.local_values()
+        route = ('places', '/api/v1/places/<place_id>', 'GET')
+        self.assertEqual(values.counters[
+            ('hbnb_http_requests_total', route + ('200',))], 1)
+        self.assertEqual(values.counters[
+            ('hbnb_http_requests_total', route + ('404',))], 1)
+        self.assertEqual(sum(values.histograms[
+            ('hbnb_http_request_duration_seconds', route)][:-1]), 2)
+        self.assertEqual(values.gauges[('hbnb_http_requests_in_flight', ())], 0)
+
+    def test_async_engine_runs_the_pragmas(self):
+        """The async engine is configured like the Flask engines"""
+        for name in ('journal_mode', 'cache_size', 'busy_timeout'):
+            value = asyncio.run(self.asgi.run(lambda: db.session.execute(
+                db.text(f"PRAGMA {name}")).scalar()))
+            self.assertEqual(str(value).lower(),
+                             str(TestingConfig.SQLITE_PRAGMAS[name]).lower(), name)
+
+    def test_async_database_uri(self):
+        """SQLite URLs switch to the aiosqlite driver"""
+        self.assertEqual(async_database_uri('sqlite:////tmp/hbnb.db'),
+                         'sqlite+aiosqlite:////tmp/hbnb.db')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+from app import create_app, db
+from benchmarks.e2e import dataset, report, runner
+from benchmarks.e2e.__main__ import bench_config
+from benchmarks.e2e.scenarios import DEFAULT_MIX, parse_mix
+
+
+class BenchmarkSuiteTestCase(unittest.TestCase):
+    """Test cases for the end-to-end benchmark suite"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.mkdtemp()
+        cls.path = os.path.join(cls.tmpdir, 'bench.db')
+        cls.manifest = dataset.generate(cls.path, 200, seed=7, log=lambda _: None)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.tmpdir)
+
+    def test_dataset(self):
+        """Counts, aggregates and the skew of the reviews"""
+        conn = sqlite3.connect(self.path)
+        try:
+            count = lambda table: conn.execute(
+                f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            self.assertEqual(count('places'), 200)
+            self.assertEqual(count('users'), self.manifest['users'])
+            self.assertEqual(count('reviews'), self.manifest['reviews'])
+            mismatched = conn.execute(
+                "SELECT COUNT(*) FROM places p WHERE review_count != "
+                "(SELECT COUNT(*) FROM reviews r WHERE r.place_id = p.id)"
+            ).fetchone()[0]
+            self.assertEqual(mismatched, 0)
+            top = conn.execute("SELECT MAX(review_count) FROM places").fetchone()[0]
+            self.assertGreater(top, 10 * self.manifest['reviews'] / 200)
+        finally:
+            conn.close()
+        self.assertEqual(dataset.load_manifest(self.path)['seed'], 7)
+        with self.assertRaises(FileExistsError):
+            dataset.generate(self.path, 10)
+
+    def test_in_process_run(self):
+        """Every scenario runs without errors and statements are counted"""
+        app = create_app(bench_config(self.path))
+        client = runner.InProcessClient(app)
+        try:
+            result = runner.run(client, self.manifest, DEFAULT_MIX, 40,
+                                concurrency=2)
+        finally:
+            client.close()
+            with app.app_context():
+                db.engine.dispose()
+        summary = report.summarize(result)
+        self.assertEqual([s for s in result.samples if not s.ok], [])
+        self.assertIn('list_places', summary)
+        self.assertGreater(summary['list_places']['queries'], 0)
+        self.assertGreater(summary['total']['rps'], 0)
+        self.assertFalse(any(regressed for *_, regressed
+                             in report.compare(summary, summary)))
+
+    def test_report_helpers(self):
+        values = list(range(1, 101))
+        self.assertEqual(report.percentile(values, 0.5), 50)
+        self.assertEqual(report.percentile(values, 0.99), 99)
+        self.assertEqual(report.percentile([3.0], 0.95), 3.0)
+        baseline = {"get_place": {"p95": 10.0, "queries": 2.0}}
+        current = {"get_place": {"p95": 20.0, "queries": 4.0}}
+        self.assertEqual([r[-1] for r in report.compare(current, baseline)],
+                         [True, True])
+        self.assertEqual(parse_mix('browse=3'), {'browse': 3.0})
+        with self.assertRaises(ValueError):
+            parse_mix('checkout=1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+import io
+import json
+import unittest
+from unittest import mock
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app, db
+from app.extensions import unit_of_work
+from app.init_db import create_default_admin
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services import facade
+
+
+def ndjson(*rows):
+    return io.StringIO("\n".join(
+        row if isinstance(row, str) else json.dumps(row) for row in rows))
+
+
+class BulkImportTestCase(unittest.TestCase):
+    """Test cases for the bulk importer"""
+
+    def setUp(self):
+        """Create an admin and an amenity in a fresh database"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.admin = User(first_name="Admin", last_name="User",
+                          email="admin@example.com", password="Password123",
+                          is_admin=True)
+        db.session.add(self.admin)
+        db.session.commit()
+        self.wifi = facade.create_amenity({"name": "WiFi"})
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _place(self, **overrides):
+        row = {"title": "Cabin", "price": 80.0, "latitude": 10.0,
+               "longitude": 20.0, "owner_id": self.admin.id}
+        row.update(overrides)
+        return row
+
+    def test_invalid_rows_are_reported_without_aborting(self):
+        """Good rows are imported, bad rows are reported with their line"""
+        report = facade.bulk_import('places', ndjson(
+            self._place(title="One", amenities=["WiFi"]),
+            self._place(price=-5),
+            "not json",
+            self._place(owner_id="nobody"),
+            self._place(title="Two", amenities=[self.wifi.id]),
+        ), batch_size=2)
+
+        self.assertEqual((report.total, report.imported, report.failed),
+                         (5, 2, 3))
+        self.assertEqual([e.line for e in report.errors], [2, 3, 4])
+        places = Place.query.order_by(Place.title).all()
+        self.assertEqual([p.title for p in places], ["One", "Two"])
+        self.assertEqual([a.name for a in places[0].amenities], ["WiFi"])
+        self.assertIsNotNone(places[0].geo_cell)
+
+    def test_amenity_references_are_resolved_per_batch(self):
+        """Names and ids of a batch cost at most one query each"""
+        facade.create_amenity({"name": "Pool"})
+        facade.amenity_catalog.snapshot()
+        # Created by another worker: not in the snapshot
+        db.session.execute(db.text(
+            "INSERT INTO amenities (id, name, created_at, updated_at) "
+            "VALUES ('sauna', 'Sauna', '2026-01-01 00:00:00', "
+            "'2026-01-01 00:00:00')"))
+        db.session.commit()
+        rows = [self._place(title=f"Place {i}",
+                            amenities=["WiFi", "Pool", "Sauna", "sauna"])
+                for i in range(20)]
+        rows.append(self._place(title="Bad", amenities=["Jacuzzi"]))
+        statements = []
+
+        def count(conn, cursor, statement, *args):
+            if statement.lstrip().upper().startswith('SELECT'):
+                statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', count)
+        try:
+            report = facade.bulk_import('places', ndjson(*rows))
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count)
+
+        self.assertEqual((report.imported, report.failed), (20, 1))
+        self.assertEqual(report.errors[0].error, "Amenity not found: Jacuzzi")
+        # Amenities by id (then the reloaded catalog), by name, and the owners
+        self.assertLessEqual(len(statements), 4, statements)
+        place = Place.query.filter_by(title="Place 0").one()
+        self.assertEqual(sorted(a.name for a in place.amenities),
+                         ["Pool", "Sauna", "WiFi"])
+
+    def test_import_commits_with_the_unit_of_work(self):
+        """Inside a unit of work, batches commit with it, then invalidate"""
+        with mock.patch.object(facade, '_imported') as imported:
+            with unit_of_work():
+                report = facade.bulk_import(
+                    'places', ndjson(self._place(title="One"),
+                                     self._place(title="Two")), batch_size=1)
+                self.assertEqual(report.imported, 2)
+                imported.assert_not_called()
+            self.assertEqual(imported.call_args_list,
+                             [mock.call('places')] * 2)
+        db.session.rollback()
+        self.assertEqual(Place.query.count(), 2)
+
+    def test_duplicate_ids_only_reject_the_offending_row(self):
+        """A constraint violation inside a batch keeps the other rows"""
+        report = facade.bulk_import('places', ndjson(
+            self._place(id="p-1", title="One"),
+            self._place(id="p-1", title="Copy"),
+            self._place(id="p-2", title="Two"),
+        ))
+        self.assertEqual((report.imported, report.failed), (2, 1))
+        self.assertEqual(report.errors[0].line, 2)
+
+    def test_csv_reviews_update_rating_aggregates(self):
+        """CSV cells are typed by column and ratings are recomputed"""
+        place = Place(title="Cabin", price=80.0, latitude=10.0,
+                      longitude=20.0, owner_id=self.admin.id)
+        db.session.add(place)
+        db.session.commit()
+        create_default_admin()
+        default_admin = facade.get_user_by_email("admin@hbnb.com")
+        source = io.StringIO(
+            "text,rating,user_id,place_id\n"
+            f"Great,5,{self.admin.id},{place.id}\n"
+            f"Fine,3,{default_admin.id},{place.id}\n"
+            f"Broken,9,{self.admin.id},{place.id}\n")
+
+        report = facade.bulk_import('reviews', source, fmt='csv')
+
+        self.assertEqual((report.imported, report.failed), (2, 1))
+        self.assertEqual(Review.query.count(), 2)
+        db.session.refresh(place)
+        self.assertEqual(place.review_count, 2)
+        self.assertEqual(place.rating_average, 4.0)
+
+    def test_admin_endpoint_streams_the_body(self):
+        """The admin endpoint imports the request body and returns the report"""
+        token = create_access_token(identity=self.admin.id)
+        body = "name\nPool\nWiFi\n"
+        response = self.client.post(
+            '/api/v1/admin/import/amenities', data=body,
+            content_type='text/csv',
+            headers={"Authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json['data']['imported'], 1)
+        self.assertEqual(response.json['data']['failed'], 1)
+        self.assertIsNotNone(facade.amenity_catalog.get_by_name("Pool"))
+
+    def test_unknown_kind_is_rejected(self):
+        """Only amenities, places and reviews can be imported"""
+        token = create_access_token(identity=self.admin.id)
+        response = self.client.post(
+            '/api/v1/admin/import/users', data="{}",
+            headers={"Authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+import fnmatch
+import time
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.cache import LRUCache, RedisCache
+from app.extensions import cache
+from app.models.user import User
+from app.models.place import Place
+from app.services import facade
+
+
+class FakeRedis:
+    """Minimal stand-in for a Redis client"""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def scan_iter(self, match):
+        return [k for k in list(self.store) if fnmatch.fnmatch(k, match)]
+
+
+class CacheBackendTestCase(unittest.TestCase):
+    """Test cases for the cache backends"""
+
+    def test_lru_evicts_least_recently_used(self):
+        lru = LRUCache(max_entries=2)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual((lru.get("a"), lru.get("c")), (1, 3))
+
+    def test_lru_bounds_total_size(self):
+        lru = LRUCache(max_bytes=10, sizeof=len)
+        lru.set("a", "xxxx")
+        lru.set("b", "yyyy")
+        lru.set("c", "zzzz")
+        self.assertIsNone(lru.get("a"))
+        self.assertEqual(lru.total_bytes, 8)
+        lru.set("d", "too large for the cache")
+        self.assertIsNone(lru.get("d"))
+        self.assertEqual(lru.total_bytes, 8)
+
+    def test_lru_expires_entries(self):
+        lru = LRUCache(default_timeout=0.01)
+        lru.set("a", 1)
+        time.sleep(0.02)
+        self.assertIsNone(lru.get("a"))
+
+    def test_redis_backend_round_trip_and_prefix_delete(self):
+        redis = RedisCache(FakeRedis())
+        redis.set("place:1", {"id": "1"})
+        redis.set("user:1", {"id": "1"})
+        self.assertEqual(redis.get("place:1"), {"id": "1"})
+        redis.delete_prefix("place:")
+        self.assertIsNone(redis.get("place:1"))
+        self.assertEqual(redis.get("user:1"), {"id": "1"})
+
+
+class FacadeCacheTestCase(unittest.TestCase):
+    """Test cases for the read-through cache of the facade getters"""
+
+    def setUp(self):
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.owner = User(first_name="Owner", last_name="Place",
+                          email="owner@example.com", password="Password123")
+        self.guest = User(first_name="Guest", last_name="Guest",
+                          email="guest@example.com", password="Password123")
+        db.session.add_all([self.owner, self.guest])
+        db.session.flush()
+        self.place = Place(title="Cabin", price=80.0, latitude=0.0,
+                           longitude=0.0, owner_id=self.owner.id)
+        db.session.add(self.place)
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _queries(self, fn):
+        statements = []
+
+        def count(*args):
+            statements.append(args[2])
+
+        event.listen(db.engine, 'before_cursor_execute', count)
+        try:
+            fn()
+        finally:
+            event.remove(db.engine, 'before_cursor_execute', count)
+        return len(statements)
+
+    def test_second_read_is_served_from_cache(self):
+        """A cached entity is returned without touching the database"""
+        facade.get_user_data(self.owner.id)
+        db.session.expunge_all()
+        self.assertEqual(self._queries(
+            lambda: facade.get_user_data(self.owner.id)), 0)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_review_write_invalidates_place(self):
+        """Creating a review refreshes the cached place aggregates"""
+        self.assertEqual(facade.get_place_data(self.place.id)["review_count"], 0)
+        facade.create_review({'user_id': self.guest.id,
+                              'place_id': self.place.id,
+                              'text': 'Lovely', 'rating': 5})
+        self.assertEqual(facade.get_place_data(self.place.id)["review_count"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.services import facade
+
+
+class ConditionalGetTestCase(unittest.TestCase):
+    """Test cases for ETags, conditional GETs and Cache-Control"""
+
+    def setUp(self):
+        """Create a place with an amenity and a review"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        self.guest = User(first_name="Guest", last_name="User",
+                          email="guest@example.com", password="Password123")
+        db.session.add_all([owner, self.guest])
+        db.session.commit()
+        self.wifi = facade.create_amenity({"name": "Wifi"})
+        self.place = facade.create_place({
+            "title": "Cabin", "price": 80.0, "latitude": 10.0,
+            "longitude": 20.0, "owner_id": owner.id,
+            "amenities": [self.wifi.id]})
+        self.review = facade.create_review({
+            "text": "Great stay", "rating": 5, "user_id": self.guest.id,
+            "place_id": self.place["id"]})
+        self.place_url = f'/api/v1/places/{self.place["id"]}'
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _revalidate(self, url, etag):
+        return self.client.get(url, headers={"If-None-Match": etag})
+
+    def test_place_is_revalidated_without_loading_it(self):
+        """A matching ETag answers 304 after a single lookup"""
+        response = self.client.get(self.place_url)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+        self.assertIn("Last-Modified", response.headers)
+        self.assertEqual(response.headers["Cache-Control"], "public, no-cache")
+
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = self._revalidate(self.place_url, etag)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute',
+                         before_cursor_execute)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(len(statements), 1)
+
+    def test_if_modified_since(self):
+        """Last-Modified can be used as the validator too"""
+        response = self.client.get(self.place_url)
+        response = self.client.get(self.place_url, headers={
+            "If-Modified-Since": response.headers["Last-Modified"]})
+        self.assertEqual(response.status_code, 304)
+
+    def test_writes_change_the_etag(self):
+        """Updating the place or one of its amenities is a new version"""
+        etag = self.client.get(self.place_url).headers["ETag"]
+        facade.update_place(self.place["id"], {"price": 95.0})
+        response = self._revalidate(self.place_url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["price"], 95.0)
+
+        etag = response.headers["ETag"]
+        facade.update_amenity(self.wifi.id, {"name": "Fast Wifi"})
+        response = self._revalidate(self.place_url, etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json["amenities"][0]["name"], "Fast Wifi")
+
+    def test_review_listing_versions(self):
+        """Review listings change with their reviews and their query string"""
+        url = f'{self.place_url}/reviews'
+        etag = self.client.get(url).headers["ETag"]
+        self.assertEqual(self._revalidate(url, etag).status_code, 304)
+        self.assertNotEqual(self.client.get(f'{url}?limit=1').headers["ETag"],
+                            etag)
+
+        facade.update_review(self.review.id, {"text": "Even better"})
+        self.assertEqual(self._revalidate(url, etag).status_code, 200)
+
+    def test_amenities_are_revalidated(self):
+        """The amenity listing and amenities have ETags and a max-age"""
+        for url in ('/api/v1/amenities/', f'/api/v1/amenities/{self.wifi.id}'):
+            response = self.client.get(url)
+            self.assertEqual(response.headers["Cache-Control"],
+                             "public, max-age=60")
+            self.assertEqual(
+                self._revalidate(url, response.headers["ETag"]).status_code,
+                304)
+
+    def test_missing_place_is_not_found(self):
+        """Unknown resources still answer 404, without validators"""
+        response = self.client.get('/api/v1/places/unknown')
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("ETag", response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from app import create_app, db
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.persistence.index_advisor import full_scans
+from app.services import facade
+from config import TestingConfig
+
+ADVISOR_LOGGER = 'app.persistence.index_advisor'
+
+
+class IndexTestCase(unittest.TestCase):
+    """Test cases for the lookup indexes and the index advisor"""
+
+    def setUp(self):
+        """Create an app with the index advisor enabled"""
+        class AdvisorConfig(TestingConfig):
+            INDEX_ADVISOR = True
+
+        self.app = create_app(AdvisorConfig)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.owner = User(first_name="Owner", last_name="Place",
+                          email="owner@example.com", password="Password123")
+        self.guest = User(first_name="Guest", last_name="User",
+                          email="guest@example.com", password="Password123")
+        db.session.add_all([self.owner, self.guest])
+        db.session.flush()
+        self.wifi = Amenity(name="Wifi")
+        self.place = Place(title="Cabin", price=80.0, latitude=10.0,
+                           longitude=20.0, owner_id=self.owner.id,
+                           amenities=[self.wifi])
+        db.session.add(self.place)
+        db.session.flush()
+        db.session.add(Review(text="Great stay", rating=5,
+                              user_id=self.guest.id, place_id=self.place.id))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_lookups_use_indexes(self):
+        """Foreign key lookups of the repositories are not full scans"""
+        with self.assertNoLogs(ADVISOR_LOGGER, level='WARNING'):
+            facade.place_repo.get_places_by_owner(self.owner.id)
+            facade.place_repo.search_places(min_price=50, max_price=100)
+            facade.review_repo.get_reviews_by_user(self.guest.id)
+            facade.review_repo.get_by_user_and_place(
+                self.guest.id, self.place.id)
+            facade.review_repo.get_reviews_by_place(self.place.id)
+
+    def test_amenity_places_use_index(self):
+        """place_amenity is searchable by amenity"""
+        plan = db.session.execute(db.text(
+            "EXPLAIN QUERY PLAN SELECT place_id FROM place_amenity "
+            "WHERE amenity_id = :id"), {"id": self.wifi.id}).fetchall()
+        self.assertEqual(full_scans(plan), [])
+        self.assertIn('ix_place_amenity_amenity_id', plan[0][-1])
+
+    def test_advisor_reports_full_scans(self):
+        """A repository query reading a whole table is logged once"""
+        with self.assertLogs(ADVISOR_LOGGER, level='WARNING') as logs:
+            facade.place_repo.get_all()
+            facade.place_repo.get_all()
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn('Full table scan of places', logs.output[0])
+        self.assertIn('PlaceRepository.get_all', logs.output[0])
+
+    def test_review_is_unique_per_user_and_place(self):
+        """A second review of the same place by the same user is rejected"""
+        with self.assertRaises(ValueError):
+            facade.create_review({"text": "Again", "rating": 4,
+                                  "user_id": self.guest.id,
+                                  "place_id": self.place.id})
+        self.assertEqual(Review.query.count(), 1)
+        self.assertEqual(facade.get_place(self.place.id).review_count, 0)
+
+    def test_full_scans(self):
+        """Only plain SCAN steps count as full scans"""
+        plan = [(2, 0, 0, 'SCAN places'),
+                (3, 0, 0, 'SEARCH reviews USING INDEX ix (place_id=?)'),
+                (4, 0, 0, 'SCAN places USING INDEX ix_places_price_id'),
+                (5, 0, 0, 'SCAN CONSTANT ROW'),
+                (6, 0, 0, 'SCAN places_fts VIRTUAL TABLE INDEX 0:M1')]
+        self.assertEqual(full_scans(plan), ['places'])
+
+
+if __name__ == '__main__':
+    unittest.main()
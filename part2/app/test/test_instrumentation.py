@@ -0,0 +1,110 @@
+import unittest
+from flask import Flask
+from sqlalchemy import event
+from app import create_app, db
+from app.instrumentation import RequestProfiler, current_profile, measure
+from app.services import facade
+from config import TestingConfig
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    """Test cases for the per-request timings"""
+
+    config = TestingConfig
+
+    def setUp(self):
+        self.app = create_app(self.config)
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.user = facade.create_user({
+            "first_name": "Ada", "last_name": "Lovelace",
+            "email": "ada@example.com", "password": "Password123"})
+        facade.create_place({
+            "title": "Cabin", "price": 80.0, "latitude": 10.0,
+            "longitude": 20.0, "owner_id": self.user["id"], "amenities": []})
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _timings(self, response):
+        """Server-Timing entries by name: (duration, description)."""
+        timings = {}
+        for entry in response.headers['Server-Timing'].split(', '):
+            name, *params = entry.split(';')
+            params = dict(param.split('=', 1) for param in params)
+            timings[name] = (float(params['dur']), params.get('desc'))
+        return timings
+
+    def test_headers_report_the_statements(self):
+        """X-Query-Count matches the statements run by the request"""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = self.client.get('/api/v1/places/')
+        finally:
+            event.remove(db.engine, 'before_cursor_execute',
+                         before_cursor_execute)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Query-Count'], str(len(statements)))
+        timings = self._timings(response)
+        self.assertEqual(timings['db'][1], f'"{len(statements)} queries"')
+        self.assertIn('serialize', timings)
+        self.assertGreaterEqual(timings['total'][0], timings['db'][0])
+        self.assertIsNone(current_profile())
+
+    def test_auth_time(self):
+        """Password verification is reported as auth"""
+        response = self.client.post('/api/v1/auth/login', json={
+            "email": "ada@example.com", "password": "Password123"})
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(self._timings(response)['auth'][0], 0)
+
+    def test_slow_requests_are_logged_with_their_sql(self):
+        self.app.extensions['request_profiler']['slow_ms'] = 0.001
+        with self.assertLogs('app.instrumentation', level='WARNING') as logs:
+            self.client.get('/api/v1/places/?limit=5')
+        self.assertIn('Slow request GET /api/v1/places/?limit=5 200', logs.output[0])
+        self.assertIn('FROM places', logs.output[0])
+
+    def test_measure_outside_a_request(self):
+        with measure('serialize'):
+            pass
+        self.assertIsNone(current_profile())
+
+
+class HeadersOffConfig(TestingConfig):
+    SERVER_TIMING = False
+
+
+class HeadersOffTestCase(InstrumentationTestCase):
+    """SERVER_TIMING turns the headers off, not the slow request log"""
+
+    config = HeadersOffConfig
+
+    def test_headers_report_the_statements(self):
+        response = self.client.get('/api/v1/places/')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Server-Timing', response.headers)
+        self.assertNotIn('X-Query-Count', response.headers)
+
+    def test_auth_time(self):
+        pass
+
+    def test_headers_default_to_debug_and_testing_mode(self):
+        for debug, testing in ((False, False), (True, False), (False, True)):
+            app = Flask(__name__)
+            app.config.update(DEBUG=debug, TESTING=testing)
+            RequestProfiler().init_app(app)
+            self.assertEqual(app.extensions['request_profiler']['headers'],
+                             debug or testing)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from app import create_app, db
+from app.extensions import metrics
+from app.metrics import Metrics
+from config import TestingConfig
+
+
+def parse(text):
+    """Samples of an exposition: {series: value}."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith('#'):
+            series, value = line.rsplit(' ', 1)
+            samples[series] = float(value)
+    return samples
+
+
+class MetricsTestCase(unittest.TestCase):
+    """Test cases for the /metrics endpoint"""
+
+    config = TestingConfig
+
+    def setUp(self):
+        self.app = create_app(self.config)
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        metrics.reset()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _scrape(self):
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        return parse(response.get_data(as_text=True))
+
+    def test_requests_by_route(self):
+        """Requests are counted and timed by URL rule, not by path"""
+        for place_id in ('a', 'b', 'c'):
+            self.client.get(f'/api/v1/places/{place_id}')
+        self.client.get('/api/v1/places/')
+        samples = self._scrape()
+
+        labels = 'namespace="places",route="/api/v1/places/<place_id>",method="GET"'
+        self.assertEqual(
+            samples[f'hbnb_http_requests_total{{{labels},status="404"}}'], 3)
+        self.assertEqual(
+            samples[f'hbnb_http_request_duration_seconds_count{{{labels}}}'], 3)
+        self.assertEqual(samples[
+            f'hbnb_http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'], 3)
+        self.assertGreater(
+            samples[f'hbnb_http_request_duration_seconds_sum{{{labels}}}'], 0)
+        self.assertGreater(samples[
+            'hbnb_db_statements_total{namespace="places",route="/api/v1/places/"}'], 0)
+        # Only the scrape itself is in flight
+        self.assertEqual(samples['hbnb_http_requests_in_flight'], 1)
+
+    def test_collected_values(self):
+        samples = self._scrape()
+        for series in ('hbnb_cache_requests_total{cache="entity",result="hit"}',
+                       'hbnb_cache_hit_ratio{cache="response"}',
+                       'hbnb_password_hash_pending',
+                       'hbnb_password_hash_workers'):
+            self.assertIn(series, samples)
+
+    def test_counters_from_many_threads(self):
+        """Per-thread shards lose no increment"""
+        recorder = Metrics()
+
+        def work():
+            for _ in range(5000):
+                recorder.inc('hbnb_http_requests_total', ('x', '/', 'GET', '200'))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        key = ('hbnb_http_requests_total', ('x', '/', 'GET', '200'))
+        self.assertEqual(recorder.local_values().counters[key], 40000)
+
+    def test_shards_of_exited_threads_are_retired(self):
+        """A thread per request does not grow the shards"""
+        recorder = Metrics()
+
+        def request():
+            recorder.inc('hbnb_http_requests_total', ('x', '/', 'GET', '200'))
+            recorder.observe('hbnb_http_request_duration_seconds',
+                             ('x', '/', 'GET'), 0.2)
+
+        for _ in range(200):
+            thread = threading.Thread(target=request)
+            thread.start()
+            thread.join()
+        self.assertEqual(recorder._shards, [])
+        values = recorder.local_values()
+        self.assertEqual(values.counters[
+            ('hbnb_http_requests_total', ('x', '/', 'GET', '200'))], 200)
+        buckets = values.histograms[
+            ('hbnb_http_request_duration_seconds', ('x', '/', 'GET'))]
+        self.assertEqual(sum(buckets[:-1]), 200)
+        self.assertAlmostEqual(buckets[-1], 40.0)
+
+
+class PoolMetricsTestCase(unittest.TestCase):
+    """Connections of a pooled engine (file database)"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        path = os.path.join(self.directory, 'pool.db')
+        config = type('PoolConfig', (TestingConfig,),
+                      {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}'})
+        self.app = create_app(config)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        db.engine.dispose()
+        self.ctx.pop()
+        shutil.rmtree(self.directory)
+
+    def test_pool_connections(self):
+        samples = parse(self.app.test_client().get('/metrics').get_data(as_text=True))
+        for state in ('checked_out', 'idle', 'overflow'):
+            self.assertIn(
+                f'hbnb_db_pool_connections{{engine="primary",state="{state}"}}',
+                samples)
+
+
+class DisabledTestCase(unittest.TestCase):
+
+    def test_no_endpoint(self):
+        config = type('NoMetricsConfig', (TestingConfig,), {'METRICS': False})
+        app = create_app(config)
+        with app.app_context():
+            self.assertNotIn('metrics', app.extensions)
+            self.assertEqual(app.test_client().get('/metrics').status_code, 404)
+            db.drop_all()
+
+
+class MultiProcessTestCase(MetricsTestCase):
+    """Snapshots of other processes are added up"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.config = type('MultiProcessConfig', (TestingConfig,),
+                           {'METRICS_DIR': self.directory})
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        metrics.directory = None
+        shutil.rmtree(self.directory)
+
+    def _write_snapshot(self, pid):
+        with open(os.path.join(self.directory, f'{pid}.json'), 'w') as f:
+            json.dump({
+                "counters": [["hbnb_http_requests_total",
+                              ["places", "/api/v1/places/", "GET", "200"], 5]],
+                "gauges": [["hbnb_http_requests_in_flight", [], 2]],
+                "histograms": [],
+            }, f)
+
+    def test_snapshots_are_aggregated(self):
+        self.client.get('/api/v1/places/')
+        self._write_snapshot(os.getppid())  # A live process
+        self._write_snapshot(2 ** 22 + 1)   # Above pid_max: exited
+        samples = self._scrape()
+        self.assertEqual(samples[
+            'hbnb_http_requests_total{namespace="places",'
+            'route="/api/v1/places/",method="GET",status="200"}'], 11)
+        # Gauges of exited processes are dropped
+        self.assertEqual(samples['hbnb_http_requests_in_flight'], 3)
+        self.assertTrue(os.path.exists(
+            os.path.join(self.directory, f'{os.getpid()}.json')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+from flask import Flask
+from app import create_app, db
+from app.extensions import password_hasher
+from app.hashing import HashingOverloaded, PasswordHasher, hash_rounds
+from app.models.user import User
+
+
+class PasswordHasherTestCase(unittest.TestCase):
+    """Test cases for the bounded bcrypt pool"""
+
+    def test_pool_round_trip(self):
+        """Hashes computed in worker processes verify correctly"""
+        app = Flask(__name__)
+        app.config.update(BCRYPT_LOG_ROUNDS=4, PASSWORD_HASH_WORKERS=1)
+        hasher = PasswordHasher(app)
+        try:
+            password_hash = hasher.hash("Password123")
+            self.assertEqual(hash_rounds(password_hash), 4)
+            self.assertTrue(hasher.check(password_hash, "Password123"))
+            self.assertFalse(hasher.check(password_hash, "Wrong123"))
+            self.assertEqual(hasher.pending, 0)
+        finally:
+            hasher.shutdown()
+
+    def test_queue_limit(self):
+        """Work beyond the pending limit is refused instead of queued"""
+        app = Flask(__name__)
+        app.config.update(PASSWORD_HASH_WORKERS=1, PASSWORD_HASH_MAX_PENDING=1)
+        hasher = PasswordHasher(app)
+        hasher._pending = 1
+        with self.assertRaises(HashingOverloaded):
+            hasher.hash("Password123")
+
+
+class LoginHashingTestCase(unittest.TestCase):
+    """Test cases for password hashing in the login flow"""
+
+    def setUp(self):
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.user = User(first_name="Login", last_name="User",
+                         email="login@example.com", password="Password123")
+        db.session.add(self.user)
+        db.session.commit()
+
+    def tearDown(self):
+        password_hasher.init_app(self.app)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _login(self, password="Password123"):
+        return self.client.post('/api/v1/auth/login', json={
+            "email": "login@example.com", "password": password})
+
+    def test_login_rehashes_outdated_cost(self):
+        """A successful login upgrades a hash made with another cost"""
+        self.assertEqual(hash_rounds(self.user.password), 4)
+        password_hasher.rounds = 5
+
+        self.assertEqual(self._login().status_code, 200)
+        db.session.expire_all()
+        self.assertEqual(hash_rounds(db.session.get(User, self.user.id).password), 5)
+        self.assertEqual(self._login().status_code, 200)
+
+    def test_wrong_password_keeps_hash(self):
+        """A failed login neither authenticates nor rehashes"""
+        password_hasher.rounds = 5
+        self.assertEqual(self._login("Wrong1234").status_code, 401)
+        db.session.expire_all()
+        self.assertEqual(hash_rounds(db.session.get(User, self.user.id).password), 4)
+
+    def test_overload_returns_429(self):
+        """Logins are rejected with 429 while the pool is saturated"""
+        password_hasher.workers = 1
+        password_hasher.max_pending = 1
+        password_hasher._pending = 1
+        try:
+            response = self._login()
+        finally:
+            password_hasher._pending = 0
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers.get('Retry-After'), '1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+
+
+class PlaceFilterTestCase(unittest.TestCase):
+    """Test cases for the server-side place filters"""
+
+    def setUp(self):
+        """Create a small catalog of places in a fresh database"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.alice = User(first_name="Alice", last_name="Owner",
+                          email="alice@example.com", password="Password123")
+        bob = User(first_name="Bobby", last_name="Owner",
+                   email="bob@example.com", password="Password123")
+        self.wifi, self.pool = Amenity(name="WiFi"), Amenity(name="Pool")
+        db.session.add_all([self.alice, bob, self.wifi, self.pool])
+        db.session.flush()
+
+        db.session.add_all([
+            Place(title="Beach House", price=300.0, latitude=20.0,
+                  longitude=-87.0, owner_id=self.alice.id,
+                  amenities=[self.wifi, self.pool]),
+            Place(title="City Loft", price=120.0, latitude=40.7,
+                  longitude=-74.0, owner_id=self.alice.id,
+                  amenities=[self.wifi]),
+            Place(title="Mountain Cabin", price=80.0, latitude=39.5,
+                  longitude=-106.0, owner_id=bob.id, amenities=[]),
+        ])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _titles(self, query):
+        response = self.client.get(f'/api/v1/places/?{query}')
+        self.assertEqual(response.status_code, 200)
+        return sorted(p['title'] for p in response.json['data'])
+
+    def test_price_range_accepts_zero(self):
+        """A zero lower bound is applied instead of being ignored"""
+        self.assertEqual(self._titles('min_price=0&max_price=100'),
+                         ["Mountain Cabin"])
+
+    def test_amenities_all_of(self):
+        """Only places offering every requested amenity are returned"""
+        self.assertEqual(
+            self._titles(f'amenities={self.wifi.id},{self.pool.id}'),
+            ["Beach House"])
+        self.assertEqual(self._titles(f'amenities={self.wifi.id}'),
+                         ["Beach House", "City Loft"])
+
+    def test_bounding_box(self):
+        """Places outside the bounding box are excluded"""
+        self.assertEqual(
+            self._titles('min_lat=35&max_lat=45&min_lon=-110&max_lon=-100'),
+            ["Mountain Cabin"])
+
+    def test_title_and_owner(self):
+        """Title substring and owner filters combine"""
+        self.assertEqual(
+            self._titles(f'title=loft&owner_id={self.alice.id}'),
+            ["City Loft"])
+
+    def test_title_wildcards_are_literal(self):
+        """% and _ in the title filter match only themselves"""
+        self.assertEqual(self._titles('title=%25'), [])
+        self.assertEqual(self._titles('title=C_ty'), [])
+        self.assertEqual(self._titles('title=y%20L'), ["City Loft"])
+
+    def test_sort_by_price_descending_with_cursor(self):
+        """Sorting by -price pages from the most to the least expensive"""
+        response = self.client.get('/api/v1/places/?sort=-price&limit=2')
+        prices = [p['price'] for p in response.json['data']]
+        cursor = response.json['next_cursor']
+        response = self.client.get(
+            f'/api/v1/places/?sort=-price&limit=2&cursor={cursor}')
+        prices += [p['price'] for p in response.json['data']]
+        self.assertEqual(prices, [300.0, 120.0, 80.0])
+
+    def test_invalid_filters(self):
+        """Unknown sort options and inverted ranges are rejected"""
+        self.assertEqual(
+            self.client.get('/api/v1/places/?sort=title').status_code, 400)
+        self.assertEqual(self.client.get(
+            '/api/v1/places/?min_price=200&max_price=100').status_code, 400)
+
+    def test_malformed_numbers_are_rejected(self):
+        """Numeric filters that do not parse are reported, not ignored"""
+        for query in ('min_price=abc', 'max_price=', 'min_lat=nan',
+                      'min_rating=inf', 'near=0,0&radius_km=ten',
+                      'near=0,0&nearest=2.5'):
+            response = self.client.get(f'/api/v1/places/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
+
+if __name__ == '__main__':
+    unittest.main()
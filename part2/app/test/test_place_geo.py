@@ -0,0 +1,129 @@
+import unittest
+from app import create_app, db
+from app.geo import bounding_box, cells_in_box, grid_cell, haversine_km
+from app.models.user import User
+from app.models.place import Place
+
+
+class GeoHelpersTestCase(unittest.TestCase):
+    """Test cases for the geospatial helpers"""
+
+    def test_haversine(self):
+        """Paris to London is about 344 km"""
+        self.assertAlmostEqual(haversine_km(48.8566, 2.3522, 51.5074, -0.1278),
+                               343.5, delta=1.0)
+
+    def test_box_cells_contain_point_cell(self):
+        """The cells of a bounding box include the cell of its center"""
+        box = bounding_box(18.47, -69.89, 25)
+        self.assertIn(grid_cell(18.47, -69.89), cells_in_box(*box))
+
+    def test_box_wraps_at_antimeridian(self):
+        """A circle crossing the antimeridian wraps its longitude range"""
+        box = bounding_box(0.0, 179.9, 50)
+        self.assertGreater(box[2], 179.0)
+        self.assertLess(box[3], -179.0)
+        cells = cells_in_box(*box)
+        self.assertIn(grid_cell(0.0, 179.9), cells)
+        self.assertIn(grid_cell(0.0, -179.9), cells)
+        self.assertNotIn(grid_cell(0.0, 0.0), cells)
+
+    def test_box_reaching_a_pole_covers_every_longitude(self):
+        _, _, min_lon, max_lon = bounding_box(89.9, 10.0, 50)
+        self.assertEqual((min_lon, max_lon), (-180.0, 180.0))
+
+
+class PlaceGeoSearchTestCase(unittest.TestCase):
+    """Test cases for the radius and nearest-neighbour place searches"""
+
+    def setUp(self):
+        """Create places around Santo Domingo and one far away"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.flush()
+        for title, lat, lon in [("Zona Colonial", 18.4735, -69.8840),
+                                ("Piantini", 18.4720, -69.9390),
+                                ("Boca Chica", 18.4500, -69.6060),
+                                ("Madrid", 40.4168, -3.7038)]:
+            db.session.add(Place(title=title, price=100.0, latitude=lat,
+                                 longitude=lon, owner_id=owner.id))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_geo_cell_maintained_on_write(self):
+        """Moving a place updates its grid cell"""
+        place = Place.query.filter_by(title="Madrid").first()
+        self.assertEqual(place.geo_cell, grid_cell(40.4168, -3.7038))
+        place.latitude, place.longitude = 18.5, -69.9
+        db.session.commit()
+        self.assertEqual(place.geo_cell, grid_cell(18.5, -69.9))
+
+    def test_radius_search_ordered_by_distance(self):
+        """Places within the radius are returned closest first"""
+        response = self.client.get(
+            '/api/v1/places/?near=18.4735,-69.8850&radius_km=10')
+        self.assertEqual(response.status_code, 200)
+        data = response.json['data']
+        self.assertEqual([p['title'] for p in data], ["Zona Colonial", "Piantini"])
+        self.assertLess(data[0]['distance_km'], data[1]['distance_km'])
+
+    def test_radius_search_pagination(self):
+        """Following next_cursor continues by distance"""
+        url = '/api/v1/places/?near=18.4735,-69.8850&radius_km=100&limit=2'
+        response = self.client.get(url)
+        titles = [p['title'] for p in response.json['data']]
+        response = self.client.get(
+            f"{url}&cursor={response.json['next_cursor']}")
+        titles += [p['title'] for p in response.json['data']]
+        self.assertEqual(titles, ["Zona Colonial", "Piantini", "Boca Chica"])
+        self.assertIsNone(response.json['next_cursor'])
+
+    def test_nearest(self):
+        """nearest=k widens the search until k places are found"""
+        response = self.client.get('/api/v1/places/?near=18.0,-69.0&nearest=2')
+        self.assertEqual(response.status_code, 200)
+        titles = [p['title'] for p in response.json['data']]
+        self.assertEqual(titles, ["Boca Chica", "Zona Colonial"])
+
+    def test_nearest_stays_within_the_maximum_radius(self):
+        """nearest=k does not widen the search beyond MAX_SEARCH_RADIUS_KM"""
+        response = self.client.get('/api/v1/places/?near=40.0,-4.0&nearest=2')
+        self.assertEqual(response.status_code, 200)
+        titles = [p['title'] for p in response.json['data']]
+        self.assertEqual(titles, ["Madrid"])
+
+    def test_radius_search_across_the_antimeridian(self):
+        """Places on both sides of 180 degrees are found"""
+        owner_id = Place.query.first().owner_id
+        for title, lat, lon in [("Fiji", -17.75, 178.9), ("Tonga", -17.8, -179.8),
+                                ("Far", -17.7, 170.0)]:
+            db.session.add(Place(title=title, price=100.0, latitude=lat,
+                                 longitude=lon, owner_id=owner_id))
+        db.session.commit()
+        response = self.client.get(
+            '/api/v1/places/?near=-17.7,179.5&radius_km=300')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p['title'] for p in response.json['data']],
+                         ["Fiji", "Tonga"])
+
+    def test_invalid_near(self):
+        """near needs valid coordinates and a bounded radius or a count"""
+        for query in ('near=abc', 'near=100,0&radius_km=5', 'near=0,0',
+                      'near=0,0&radius_km=100000', 'near=89.9,0&radius_km=50',
+                      'near=89.95,0&nearest=1'):
+            response = self.client.get(f'/api/v1/places/?{query}')
+            self.assertEqual(response.status_code, 400, query)
+
+
+if __name__ == '__main__':
+    unittest.main()
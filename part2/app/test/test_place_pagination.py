@@ -0,0 +1,81 @@
+import unittest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.persistence.pagination import MAX_PAGE_SIZE, encode_cursor
+
+
+class PlacePaginationTestCase(unittest.TestCase):
+    """Test cases for the paginated place listing"""
+
+    def setUp(self):
+        """Create an owner in a fresh database"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.owner = User(first_name="Owner", last_name="Place",
+                          email="owner@example.com", password="Password123")
+        db.session.add(self.owner)
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _add_places(self, count):
+        start = datetime(2025, 1, 1)
+        for i in range(count):
+            db.session.add(Place(title=f"Place {i}", price=10.0 + i,
+                                 latitude=0.0, longitude=0.0,
+                                 owner_id=self.owner.id,
+                                 created_at=start + timedelta(minutes=i)))
+        db.session.commit()
+
+    def test_places_are_paginated_with_cursor(self):
+        """Following next_cursor returns every place exactly once"""
+        self._add_places(5)
+        response = self.client.get('/api/v1/places/?limit=2')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), 2)
+
+        titles = [p['title'] for p in response.json['data']]
+        cursor = response.json['next_cursor']
+        while cursor:
+            response = self.client.get(f'/api/v1/places/?limit=2&cursor={cursor}')
+            titles.extend(p['title'] for p in response.json['data'])
+            cursor = response.json['next_cursor']
+
+        self.assertEqual(titles, [f"Place {i}" for i in range(5)])
+
+    def test_page_size_is_bounded(self):
+        """A huge limit never returns more than MAX_PAGE_SIZE places"""
+        self._add_places(MAX_PAGE_SIZE + 5)
+        response = self.client.get('/api/v1/places/?limit=100000')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), MAX_PAGE_SIZE)
+        self.assertIsNotNone(response.json['next_cursor'])
+
+    def test_invalid_cursor(self):
+        """A malformed cursor is rejected with 400"""
+        response = self.client.get('/api/v1/places/?cursor=%%%')
+        self.assertEqual(response.status_code, 400)
+
+    def test_cursor_values_are_type_checked(self):
+        """A cursor whose values do not match the sort key is rejected"""
+        self._add_places(3)
+        for values in ([{"a": 1}, "x"], ["cheap", "x"], [True, "x"], [10.0, 1]):
+            cursor = encode_cursor(values)
+            response = self.client.get(
+                f'/api/v1/places/?sort=price&cursor={cursor}')
+            self.assertEqual(response.status_code, 400, values)
+        cursor = encode_cursor([10, "x"])
+        response = self.client.get(f'/api/v1/places/?sort=price&cursor={cursor}')
+        self.assertEqual(response.status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+from contextlib import contextmanager
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.amenity import Amenity
+
+
+class PlaceQueryCountTestCase(unittest.TestCase):
+    """Regression tests for the number of SQL statements per place listing"""
+
+    def setUp(self):
+        """Create places that each carry a couple of amenities"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        wifi, pool = Amenity(name="WiFi"), Amenity(name="Pool")
+        db.session.add_all([owner, wifi, pool])
+        db.session.flush()
+        for i in range(30):
+            db.session.add(Place(title=f"Place {i}", price=50.0,
+                                 latitude=0.0, longitude=0.0,
+                                 owner_id=owner.id, amenities=[wifi, pool]))
+        db.session.commit()
+        db.session.expunge_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    @contextmanager
+    def count_queries(self):
+        """Count the statements sent to the database inside the block."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute',
+                         before_cursor_execute)
+
+    def _listing_queries(self, limit):
+        db.session.expunge_all()
+        with self.count_queries() as statements:
+            response = self.client.get(f'/api/v1/places/?limit={limit}')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), limit)
+        self.assertEqual(len(response.json['data'][0]['amenities']), 2)
+        return len(statements)
+
+    def test_listing_query_count_is_constant(self):
+        """GET /api/v1/places/ issues the same number of queries for any page size"""
+        self.assertEqual(self._listing_queries(1), self._listing_queries(30))
+
+    def test_listing_loads_amenities_in_bulk(self):
+        """Places and their amenities are fetched with two statements"""
+        self.assertLessEqual(self._listing_queries(30), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
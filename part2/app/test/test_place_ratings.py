@@ -0,0 +1,100 @@
+import unittest
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+from app.services import facade
+
+
+class PlaceRatingAggregatesTestCase(unittest.TestCase):
+    """Test cases for the denormalized rating aggregates of places"""
+
+    def setUp(self):
+        """Create an owner, two guests and two places"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        self.guests = [User(first_name=f"Guest{i}", last_name="Guest",
+                            email=f"guest{i}@example.com",
+                            password="Password123") for i in range(2)]
+        db.session.add_all([owner] + self.guests)
+        db.session.flush()
+        self.cabin = Place(title="Cabin", price=80.0, latitude=0.0,
+                           longitude=0.0, owner_id=owner.id)
+        self.loft = Place(title="Loft", price=90.0, latitude=0.0,
+                          longitude=0.0, owner_id=owner.id)
+        db.session.add_all([self.cabin, self.loft])
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _review(self, guest, place, rating):
+        return facade.create_review({'user_id': guest.id, 'place_id': place.id,
+                                     'text': 'Nice', 'rating': rating})
+
+    def _ratings(self, place):
+        data = self.client.get(f'/api/v1/places/{place.id}').json
+        return (data['review_count'], data['rating_average'],
+                data['rating_histogram'])
+
+    def test_create_update_delete_keep_aggregates(self):
+        """Review writes update the count, average and histogram"""
+        first = self._review(self.guests[0], self.cabin, 5)
+        second = self._review(self.guests[1], self.cabin, 2)
+        self.assertEqual(self._ratings(self.cabin),
+                         (2, 3.5, {'1': 0, '2': 1, '3': 0, '4': 0, '5': 1}))
+
+        facade.update_review(second.id, {'rating': 4})
+        self.assertEqual(self._ratings(self.cabin),
+                         (2, 4.5, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 1}))
+
+        facade.delete_review(first.id)
+        self.assertEqual(self._ratings(self.cabin),
+                         (1, 4.0, {'1': 0, '2': 0, '3': 0, '4': 1, '5': 0}))
+
+    def test_sort_and_filter_by_rating(self):
+        """Places can be sorted and filtered by average rating"""
+        self._review(self.guests[0], self.cabin, 2)
+        self._review(self.guests[0], self.loft, 5)
+
+        response = self.client.get('/api/v1/places/?sort=-rating')
+        self.assertEqual([p['title'] for p in response.json['data']],
+                         ["Loft", "Cabin"])
+        response = self.client.get('/api/v1/places/?min_rating=4')
+        self.assertEqual([p['title'] for p in response.json['data']], ["Loft"])
+
+    def test_recompute_command_repairs_drift(self):
+        """flask recompute-ratings rebuilds the aggregates from the reviews"""
+        self._review(self.guests[0], self.cabin, 3)
+        db.session.add(Review(text="Imported", rating=5,
+                              user_id=self.guests[1].id, place_id=self.cabin.id))
+        self.loft.review_count = 7
+        db.session.commit()
+
+        result = self.app.test_cli_runner().invoke(args=['recompute-ratings'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(self._ratings(self.cabin),
+                         (2, 4.0, {'1': 0, '2': 0, '3': 1, '4': 0, '5': 1}))
+        self.assertEqual(self._ratings(self.loft)[0], 0)
+
+    def test_recompute_commits_in_the_facade(self):
+        """The repository leaves the commit to the facade's unit of work"""
+        self.loft.review_count = 7
+        db.session.commit()
+        facade.place_repo.recompute_rating_aggregates()
+        db.session.rollback()
+        self.assertEqual(self.loft.review_count, 7)
+
+        self.assertEqual(facade.recompute_rating_aggregates(), 0)
+        self.assertEqual(self.loft.review_count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import unittest
+from unittest.mock import patch
+from sqlalchemy import text
+from app import create_app, db
+from app.models.place import Place
+from app.models.review import Review
+from app.models.user import User
+from app.search import match_query, snippet, words
+
+
+class SearchHelpersTestCase(unittest.TestCase):
+    """Test cases for the query and snippet helpers"""
+
+    def test_words_are_quoted(self):
+        self.assertEqual(match_query(words('Cozy cabin')), '"Cozy" "cabin"')
+        self.assertEqual(match_query(words('sea OR "view" -(x*_y')),
+                         '"sea" "OR" "view" "x" "y"')
+
+    def test_no_words(self):
+        with self.assertRaises(ValueError):
+            words(' -"* ')
+
+    def test_snippet(self):
+        self.assertEqual(snippet('Café <b>au</b> lait', ['CAFE']),
+                         '<mark>Café</mark> &lt;b&gt;au&lt;/b&gt; lait')
+        text = ' '.join(f'w{i}' for i in range(40)) + ' sea view'
+        self.assertEqual(snippet(text, ['sea', 'view'], tokens=5),
+                         '…w37 w38 w39 <mark>sea</mark> <mark>view</mark>')
+        self.assertEqual(snippet(text, ['w1'], tokens=3), 'w0 <mark>w1</mark> w2…')
+
+
+class PlaceSearchTestCase(unittest.TestCase):
+    """Test cases for GET /api/v1/places/search"""
+
+    def setUp(self):
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        guest = User(first_name="Guest", last_name="Review",
+                     email="guest@example.com", password="Password123")
+        db.session.add_all([owner, guest])
+        db.session.flush()
+        self.places = {}
+        for title, description in [
+                ("Lakeside cabin", "Wooden house with a fireplace"),
+                ("Mountain lodge", "A cabin-like lodge near the slopes"),
+                ("City loft", "Modern flat downtown"),
+                ("Beach house", "Next to the sea <b>and</b> the port"),
+                ("Garden studio", "Quiet studio"),
+                ("Old mill", "Restored mill by the river")]:
+            place = Place(title=title, description=description, price=100.0,
+                          latitude=10.0, longitude=20.0, owner_id=owner.id)
+            db.session.add(place)
+            self.places[title] = place
+        db.session.flush()
+        db.session.add(Review(text="Felt like a cabin by the fireplace",
+                              rating=5, user_id=guest.id,
+                              place_id=self.places["City loft"].id))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _search(self, query_string):
+        response = self.client.get(f'/api/v1/places/search?{query_string}')
+        self.assertEqual(response.status_code, 200, response.get_json())
+        return response.get_json()
+
+    def _titles(self, query_string):
+        return [place['title'] for place in self._search(query_string)['data']]
+
+    def test_ranking(self):
+        """Title matches first, then description, then reviews"""
+        self.assertEqual(self._titles('q=cabin'),
+                         ["Lakeside cabin", "Mountain lodge", "City loft"])
+        data = self._search('q=cabin')['data']
+        self.assertGreater(data[0]['score'], data[1]['score'])
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self._titles('q=cabin+fireplace'),
+                         ["Lakeside cabin", "City loft"])
+        self.assertEqual(self._titles('q=cabin+sea'), [])
+
+    def test_snippets(self):
+        """Snippets are escaped HTML with the matches in <mark>"""
+        data = self._search('q=port')['data']
+        self.assertEqual(data[0]['snippet'],
+                         'Next to the sea &lt;b&gt;and&lt;/b&gt; the '
+                         '<mark>port</mark>')
+        loft = self._search('q=fireplace&fields=id')['data'][-1]
+        self.assertEqual(set(loft), {'id', 'score', 'snippet'})
+        self.assertEqual(loft['snippet'],
+                         'Felt like a cabin by the <mark>fireplace</mark>')
+
+    def test_pagination(self):
+        first = self._search('q=cabin&limit=2')
+        self.assertEqual(len(first['data']), 2)
+        second = self._search(f"q=cabin&limit=2&cursor={first['next_cursor']}")
+        self.assertIsNone(second['next_cursor'])
+        self.assertEqual([p['title'] for p in first['data'] + second['data']],
+                         self._titles('q=cabin'))
+
+    def test_every_match_is_ranked(self):
+        """Pages follow the rank over all the matches, oldest included"""
+        owner_id = self.places["City loft"].owner_id
+        db.session.add_all(Place(title=f"Flat {i}", price=100.0,
+                                 description="Near a cabin", latitude=10.0,
+                                 longitude=20.0, owner_id=owner_id)
+                           for i in range(25))
+        db.session.commit()
+        pages, cursor = [], ''
+        while cursor is not None:
+            body = self._search(f'q=cabin&limit=10&cursor={cursor}')
+            self.assertFalse(body['truncated'])
+            pages.append(body['data'])
+            cursor = body['next_cursor']
+        places = [place for page in pages for place in page]
+        self.assertEqual(len(pages), 3)
+        self.assertEqual(len({place['id'] for place in places}), 28)
+        self.assertEqual(places[0]['title'], "Lakeside cabin")
+        scores = [place['score'] for place in places]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_candidates_cap_ranks_the_newest_matches(self):
+        with patch.dict(self.app.config, SEARCH_CANDIDATES=1):
+            body = self._search('q=cabin')
+            self.assertEqual([place['title'] for place in body['data']],
+                             ["Mountain lodge", "City loft"])
+            self.assertIsNone(body['next_cursor'])
+            self.assertTrue(body['truncated'])
+            # One match in each table: nothing left out
+            self.assertFalse(self._search('q=fireplace+felt')['truncated'])
+
+    def test_invalid_requests(self):
+        for query_string in ('', 'q=+*+', 'q=cabin&cursor=nope'):
+            response = self.client.get(f'/api/v1/places/search?{query_string}')
+            self.assertEqual(response.status_code, 400, query_string)
+
+    def test_index_follows_writes(self):
+        """The triggers index every write, including raw inserts"""
+        place = self.places["Old mill"]
+        place.title = "Old windmill"
+        db.session.commit()
+        self.assertEqual(self._titles('q=windmill'), ["Old windmill"])
+        self.assertEqual(self._titles('q=river'), ["Old windmill"])
+
+        db.session.delete(Review.query.one())
+        db.session.execute(Place.__table__.insert(), [{
+            "id": "raw-place", "title": "Raw cabin", "price": 50.0,
+            "latitude": 0.0, "longitude": 0.0, "owner_id": place.owner_id}])
+        db.session.commit()
+        titles = self._titles('q=cabin')
+        self.assertEqual(sorted(titles[:2]), ["Lakeside cabin", "Raw cabin"])
+        self.assertEqual(titles[2:], ["Mountain lodge"])
+
+    def test_rebuild_command(self):
+        db.session.execute(text(
+            "INSERT INTO places_fts(places_fts) VALUES ('delete-all')"))
+        db.session.commit()
+        self.assertEqual(self._titles('q=cabin'), ["City loft"])
+
+        result = self.app.test_cli_runner().invoke(
+            args=['rebuild-search-index'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('6 places, 1 reviews', result.output)
+        self.assertEqual(len(self._titles('q=cabin')), 3)
+
+    def test_vacuum_command(self):
+        """The index is rebuilt after VACUUM, which may renumber rowids"""
+        db.session.execute(text(
+            "INSERT INTO places_fts(places_fts) VALUES ('delete-all')"))
+        db.session.commit()
+
+        result = self.app.test_cli_runner().invoke(args=['vacuum'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('6 places, 1 reviews', result.output)
+        self.assertEqual(len(self._titles('q=cabin')), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
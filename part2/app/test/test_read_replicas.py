@@ -0,0 +1,117 @@
+import os
+import shutil
+import tempfile
+import unittest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event, text
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.extensions import replica_router
+from app.services import facade
+from config import TestingConfig
+
+
+class ReadReplicaTestCase(unittest.TestCase):
+    """Test cases for read-replica routing in the repositories"""
+
+    def setUp(self):
+        """Seed the primary, then snapshot it as a lagging replica"""
+        self.tmpdir = tempfile.mkdtemp()
+        primary = os.path.join(self.tmpdir, 'primary.db')
+        replica = os.path.join(self.tmpdir, 'replica.db')
+
+        class ReplicaConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{primary}'
+            SQLALCHEMY_REPLICA_URIS = [f'sqlite:///{replica}']
+            SQLITE_PRAGMAS = {'journal_mode': 'DELETE'}
+
+        self.app = create_app(ReplicaConfig)
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                          email="owner@example.com", password="Password123")
+        other = User(first_name="Other", last_name="User",
+                          email="other@example.com", password="Password123")
+        db.session.add_all([owner, other])
+        db.session.flush()
+        place = Place(title="Original", price=80.0, latitude=10.0,
+                      longitude=20.0, owner_id=owner.id)
+        db.session.add(place)
+        db.session.commit()
+        self.place_id = place.id
+        self.owner_id, self.other_id = owner.id, other.id
+        db.session.remove()
+        db.engine.dispose()
+        shutil.copyfile(primary, replica)
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+        shutil.rmtree(self.tmpdir)
+
+    def _rename_on_primary(self, title):
+        with db.engine.begin() as conn:
+            conn.execute(text("UPDATE places SET title = :title WHERE id = :id"),
+                         {"title": title, "id": self.place_id})
+
+    def _read_title(self):
+        db.session.remove()
+        return facade.place_repo.get(self.place_id).title
+
+    def _as(self, user_id):
+        token = create_access_token(identity=user_id)
+        return self.app.test_request_context(
+            headers={"Authorization": f"Bearer {token}"})
+
+    def test_repository_reads_use_the_replica(self):
+        """Repository finders read the replica, other queries the primary"""
+        self._rename_on_primary("Renamed")
+        self.assertEqual(self._read_title(), "Original")
+        self.assertEqual(db.session.query(Place.title).scalar(), "Renamed")
+
+    def test_writer_reads_its_own_writes(self):
+        """After a write the same user reads from the primary"""
+        with self._as(self.owner_id):
+            facade.update_place(self.place_id, {"title": "Updated"})
+        with self._as(self.owner_id):
+            self.assertEqual(self._read_title(), "Updated")
+        with self._as(self.other_id):
+            self.assertEqual(self._read_title(), "Original")
+
+    def test_open_transaction_reads_the_primary(self):
+        """Reads after a flush see the transaction's own changes"""
+        place = facade.place_repo.get(self.place_id)
+        place.title = "Pending"
+        db.session.flush()
+        db.session.expire_all()
+        self.assertEqual(facade.place_repo.get(self.place_id).title, "Pending")
+        db.session.rollback()
+
+    def test_write_requests_read_the_primary(self):
+        """Every read of a write request goes to the primary"""
+        token = create_access_token(identity=self.owner_id)
+        replica_reads = []
+        replica = replica_router.engines()[0]
+
+        def record(conn, cursor, statement, *args):
+            replica_reads.append(statement)
+
+        event.listen(replica, 'before_cursor_execute', record)
+        self.addCleanup(event.remove, replica, 'before_cursor_execute', record)
+        client = self.app.test_client()
+        response = client.put(f'/api/v1/places/{self.place_id}',
+                              json={"title": "Updated"},
+                              headers={"Authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 200, response.get_json())
+        self.assertEqual(replica_reads, [])
+
+        # GETs still read the replica
+        client.get(f'/api/v1/places/{self.place_id}/reviews')
+        self.assertNotEqual(replica_reads, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import unittest
+from datetime import datetime, timedelta
+from app import create_app, db
+from app.models.user import User
+from app.models.place import Place
+from app.models.review import Review
+
+
+class ReviewPaginationTestCase(unittest.TestCase):
+    """Test cases for the paginated place reviews listing"""
+
+    def setUp(self):
+        """Create a place with a handful of reviews in a fresh database"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.flush()
+        self.place = Place(title="Cabin", price=80.0, latitude=10.0,
+                           longitude=20.0, owner_id=owner.id)
+        other = Place(title="Loft", price=90.0, latitude=11.0,
+                      longitude=21.0, owner_id=owner.id)
+        db.session.add_all([self.place, other])
+        db.session.flush()
+
+        # One review per user and place
+        guests = [User(first_name="Guest", last_name="User",
+                       email=f"guest{i}@example.com", password="Password123")
+                  for i in range(5)]
+        db.session.add_all(guests)
+        db.session.flush()
+
+        start = datetime(2025, 1, 1)
+        for i, guest in enumerate(guests):
+            db.session.add(Review(text=f"Review {i}", rating=4,
+                                  user_id=guest.id, place_id=self.place.id,
+                                  created_at=start + timedelta(days=i)))
+        db.session.add(Review(text="Other place", rating=3, user_id=owner.id,
+                              place_id=other.id, created_at=start))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def test_reviews_are_paginated_with_cursor(self):
+        """Following next_cursor walks every review of the place once"""
+        url = f'/api/v1/places/{self.place.id}/reviews'
+        response = self.client.get(f'{url}?limit=2')
+        self.assertEqual(response.status_code, 200)
+        data = response.json['data']
+        self.assertEqual([r['text'] for r in data['reviews']],
+                         ["Review 0", "Review 1"])
+
+        texts = [r['text'] for r in data['reviews']]
+        while data['next_cursor']:
+            self.assertEqual(response.headers['X-Next-Cursor'],
+                             data['next_cursor'])
+            response = self.client.get(
+                f"{url}?limit=2&cursor={data['next_cursor']}")
+            data = response.json['data']
+            texts.extend(r['text'] for r in data['reviews'])
+        self.assertNotIn('X-Next-Cursor', response.headers)
+
+        self.assertEqual(texts, [f"Review {i}" for i in range(5)])
+
+    def test_invalid_cursor(self):
+        """A malformed cursor is rejected with 400"""
+        response = self.client.get(
+            f'/api/v1/places/{self.place.id}/reviews?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
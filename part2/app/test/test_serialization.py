@@ -0,0 +1,104 @@
+import json
+import unittest
+import uuid
+from datetime import datetime
+from app import create_app, db
+from app.extensions import json_serializer
+from app.serialization import OrjsonEncoder, StdlibEncoder, get_encoder
+from config import TestingConfig
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+ENCODERS = [StdlibEncoder] + ([OrjsonEncoder] if orjson else [])
+
+
+class EncoderTestCase(unittest.TestCase):
+    """Test cases for the JSON encoders"""
+
+    payload = {
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "created_at": datetime(2024, 5, 1, 12, 30, 15, 123456),
+        "updated_at": datetime(2024, 5, 1, 12, 30, 15),
+        "tags": {"quiet"},
+        "title": "Cabaña",
+        "histogram": {"1": 0, "5": 2},
+    }
+
+    def test_encoders_agree(self):
+        """Every encoder writes the same document"""
+        expected = {
+            "id": "12345678-1234-5678-1234-567812345678",
+            "created_at": "2024-05-01T12:30:15.123456",
+            "updated_at": "2024-05-01T12:30:15",
+            "tags": ["quiet"],
+            "title": "Cabaña",
+            "histogram": {"1": 0, "5": 2},
+        }
+        for encoder in (cls() for cls in ENCODERS):
+            with self.subTest(encoder=encoder.name):
+                self.assertEqual(json.loads(encoder.dumps(self.payload)),
+                                 expected)
+                self.assertEqual(
+                    json.loads(encoder.dumps(self.payload, indent=True)),
+                    expected)
+
+    def test_unknown_types_are_rejected(self):
+        for encoder in (cls() for cls in ENCODERS):
+            with self.subTest(encoder=encoder.name):
+                with self.assertRaises(TypeError):
+                    encoder.dumps({"value": object()})
+
+    def test_get_encoder(self):
+        self.assertIsInstance(get_encoder(), ENCODERS[-1])
+        self.assertIsInstance(get_encoder('json'), StdlibEncoder)
+        with self.assertRaises(ValueError):
+            get_encoder('pickle')
+
+    @unittest.skipUnless(orjson, "orjson is not installed")
+    def test_auto_selects_orjson(self):
+        """orjson, listed in requirements.txt, is the default backend"""
+        self.assertIsInstance(get_encoder('auto'), OrjsonEncoder)
+        self.assertEqual(get_encoder().name, 'orjson')
+        app = create_app(TestingConfig)
+        with app.app_context():
+            self.assertEqual(json_serializer.encoder.name, 'orjson')
+
+
+class StdlibConfig(TestingConfig):
+    JSON_ENCODER = 'json'
+
+
+class ApiEncodingTestCase(unittest.TestCase):
+    """Test cases for the encoding of API responses"""
+
+    def _create_amenity(self, config):
+        app = create_app(config)
+        with app.app_context():
+            try:
+                response = app.test_client().post(
+                    '/api/v1/amenities/', json={"name": "Wifi"})
+                return response, json_serializer.encoder
+            finally:
+                db.session.remove()
+                db.drop_all()
+
+    def test_responses_format_datetimes(self):
+        """Native datetimes of to_dict() are sent as ISO 8601"""
+        for config, encoder in ((TestingConfig, ENCODERS[-1]),
+                                (StdlibConfig, StdlibEncoder)):
+            with self.subTest(encoder=encoder.name):
+                response, used = self._create_amenity(config)
+                self.assertIsInstance(used, encoder)
+                self.assertEqual(response.status_code, 201)
+                self.assertEqual(response.content_type, 'application/json')
+                created_at = response.json["created_at"]
+                self.assertIsInstance(created_at, str)
+                self.assertIsInstance(datetime.fromisoformat(created_at),
+                                      datetime)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+import unittest
+from sqlalchemy import event
+from app import create_app, db
+from app.models.user import User
+from app.services import facade
+
+
+class SparseFieldsTestCase(unittest.TestCase):
+    """Test cases for the fields= query parameter of the listings"""
+
+    def setUp(self):
+        """Create places with amenities and reviews"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+
+        self.admin = facade.create_user({
+            "first_name": "Ada", "last_name": "Admin", "is_admin": True,
+            "email": "ada@example.com", "password": "Password123"})
+        guest = User(first_name="Guest", last_name="User",
+                     email="guest@example.com", password="Password123")
+        db.session.add(guest)
+        db.session.commit()
+        wifi = facade.create_amenity({"name": "Wifi"})
+        self.places = [facade.create_place({
+            "title": f"Place {i}", "description": "A long description",
+            "price": 50.0 + i, "latitude": 10.0, "longitude": 20.0 + i / 100,
+            "owner_id": self.admin["id"], "amenities": [wifi.id]})
+            for i in range(3)]
+        facade.create_review({"text": "Great stay", "rating": 5,
+                              "user_id": guest.id,
+                              "place_id": self.places[0]["id"]})
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _get(self, url, **kwargs):
+        """GET url, returning the response and the SQL statements it ran."""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            return self.client.get(url, **kwargs), statements
+        finally:
+            event.remove(db.engine, 'before_cursor_execute',
+                         before_cursor_execute)
+
+    def test_places_load_only_requested_columns(self):
+        """Other columns are not selected and amenities are not loaded"""
+        response, statements = self._get(
+            '/api/v1/places/?fields=id,title,price')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([set(place) for place in response.json["data"]],
+                         [{"id", "title", "price"}] * 3)
+        self.assertEqual(len(statements), 1)
+        self.assertNotIn("description", statements[0])
+
+        response, statements = self._get('/api/v1/places/')
+        self.assertIn("description", response.json["data"][0])
+        self.assertEqual(len(statements), 2)
+
+    def test_places_with_derived_fields(self):
+        """Relationships and aggregates are loaded when requested"""
+        response, statements = self._get(
+            '/api/v1/places/?fields=amenities,rating_histogram&sort=-price')
+        place = response.json["data"][-1]
+        self.assertEqual(set(place), {"amenities", "rating_histogram"})
+        self.assertEqual(place["amenities"][0]["name"], "Wifi")
+        self.assertEqual(place["rating_histogram"]["5"], 1)
+        self.assertEqual(len(statements), 2)
+
+    def test_pages_and_nearby_search_keep_working(self):
+        """Sort keys are loaded for the cursor even when not requested"""
+        first = self.client.get('/api/v1/places/?fields=title&sort=price&limit=2')
+        cursor = first.json["next_cursor"]
+        self.assertIsNotNone(cursor)
+        second = self.client.get(
+            f'/api/v1/places/?fields=title&sort=price&limit=2&cursor={cursor}')
+        self.assertEqual([p["title"] for p in second.json["data"]], ["Place 2"])
+
+        response = self.client.get(
+            '/api/v1/places/?fields=title&near=10,20&nearest=1')
+        self.assertEqual(response.json["data"],
+                         [{"title": "Place 0", "distance_km": 0.0}])
+
+    def test_unknown_field_is_rejected(self):
+        for url in ('/api/v1/places/?fields=title,secret',
+                    '/api/v1/amenities/?fields=places',
+                    f'/api/v1/places/{self.places[0]["id"]}/reviews?fields=user'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 400)
+
+    def test_reviews_and_amenities(self):
+        response = self.client.get(
+            f'/api/v1/places/{self.places[0]["id"]}/reviews?fields=rating')
+        self.assertEqual(response.json["data"]["reviews"], [{"rating": 5}])
+        response = self.client.get('/api/v1/amenities/?fields=name')
+        self.assertEqual(response.json["data"], [{"name": "Wifi"}])
+
+    def test_admin_user_listing(self):
+        """Users are listed by email, never with their password"""
+        token = self.client.post('/api/v1/auth/login', json={
+            "email": "ada@example.com", "password": "Password123"
+        }).json["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        response = self.client.get('/api/v1/admin/users/?fields=email',
+                                   headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([u["email"] for u in response.json["data"]],
+                         ["ada@example.com", "guest@example.com"])
+        self.assertEqual(set(response.json["data"][0]), {"email"})
+
+        response = self.client.get('/api/v1/admin/users/?fields=password',
+                                   headers=headers)
+        self.assertEqual(response.status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from app import create_app, db
+from app.extensions import READONLY_ENGINE
+from app.models.user import User
+from app.models.place import Place
+from config import TestingConfig
+
+
+class SQLiteEngineTestCase(unittest.TestCase):
+    """Test cases for the SQLite pragmas and the read-only pool"""
+
+    def setUp(self):
+        """Use a file database so the read-only pool is enabled"""
+        self.tmpdir = tempfile.mkdtemp()
+        path = os.path.join(self.tmpdir, 'engine.db')
+
+        class FileConfig(TestingConfig):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+            SQLITE_READONLY_POOL = True
+
+        self.app = create_app(FileConfig)
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.readonly = self.app.extensions[READONLY_ENGINE]
+
+        owner = User(first_name="Owner", last_name="Place",
+                     email="owner@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.flush()
+        db.session.add(Place(title="Cabin", price=80.0, latitude=10.0,
+                             longitude=20.0, owner_id=owner.id))
+        db.session.commit()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.readonly.dispose()
+        self.ctx.pop()
+        shutil.rmtree(self.tmpdir)
+
+    def test_pragmas_are_applied(self):
+        """Every connection runs in WAL mode with the configured pragmas"""
+        with db.engine.connect() as conn:
+            self.assertEqual(conn.execute(text("PRAGMA journal_mode")).scalar(), 'wal')
+            self.assertEqual(conn.execute(text("PRAGMA synchronous")).scalar(), 1)
+            self.assertEqual(conn.execute(text("PRAGMA busy_timeout")).scalar(), 5000)
+
+    def test_get_requests_use_the_read_only_pool(self):
+        """Reads of a GET request go to the read-only engine"""
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(self.readonly, 'before_cursor_execute', before_cursor_execute)
+        try:
+            response = self.client.get('/api/v1/places/')
+        finally:
+            event.remove(self.readonly, 'before_cursor_execute',
+                         before_cursor_execute)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json['data']), 1)
+        self.assertTrue(any('FROM places' in s for s in statements))
+        self.assertNotIn('read_only', db.session.info)
+
+    def test_read_only_pool_rejects_writes(self):
+        """The read-only engine cannot modify the database"""
+        with self.readonly.connect() as conn:
+            with self.assertRaises(OperationalError):
+                conn.execute(text("DELETE FROM places"))
+
+    def test_in_memory_database_has_no_read_only_pool(self):
+        """The tests' in-memory database keeps a single engine"""
+        app = create_app("config.TestingConfig")
+        self.assertNotIn(READONLY_ENGINE, app.extensions)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+import flask_migrate
+from sqlalchemy import inspect
+from app import MIGRATIONS_DIR, create_app, db
+from app.api.v1 import NAMESPACES
+from app.models.user import User
+from app.schema import SchemaOutOfDate, head_revisions
+from config import TestingConfig
+
+PROJECT_DIR = os.path.dirname(MIGRATIONS_DIR)
+# Modules that importing the package must leave to create_app or to first
+# use: the API and its namespaces, the async engine, the password hashing
+# pool and metrics clients
+DEFERRED_MODULES = ('flask_restx', 'app.services', *(
+    module for module, _ in NAMESPACES), 'sqlalchemy.ext.asyncio',
+    'concurrent.futures.process', 'multiprocessing', 'prometheus_client')
+# Optional wall-clock budget of the imports of building the app, in
+# milliseconds: timings vary too much between machines to run by default
+IMPORT_TIME_BUDGET_MS = os.getenv('IMPORT_TIME_BUDGET_MS')
+
+
+def run_python(*args):
+    """Run a Python interpreter in the project directory."""
+    return subprocess.run([sys.executable, *args], cwd=PROJECT_DIR,
+                          capture_output=True, text=True, check=True)
+
+
+class StartupTestCase(unittest.TestCase):
+    """Test cases for building the application"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'startup.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def _config(self, **options):
+        options.setdefault('SQLALCHEMY_DATABASE_URI', f'sqlite:///{self.path}')
+        options.setdefault('SCHEMA_AUTO_CREATE', False)
+        return type('StartupConfig', (TestingConfig,), options)
+
+    def _tables(self, app):
+        with app.app_context():
+            tables = inspect(db.engine).get_table_names()
+            db.engine.dispose()
+        return tables
+
+    def _reviews(self):
+        return db.session.execute(db.text(
+            "SELECT id FROM reviews ORDER BY id")).scalars().all()
+
+    def test_import_does_not_load_the_api(self):
+        """Importing the package leaves the heavy modules out"""
+        result = run_python('-c', (
+            "import sys, app\n"
+            f"print(sorted(m for m in {DEFERRED_MODULES!r}"
+            " if m in sys.modules))"))
+        self.assertEqual(result.stdout.strip(), '[]')
+
+    @unittest.skipUnless(IMPORT_TIME_BUDGET_MS, "set IMPORT_TIME_BUDGET_MS")
+    def test_import_time_budget(self):
+        """Imports done by `create_app` fit the budget (-X importtime)"""
+        result = run_python('-X', 'importtime', '-c', (
+            "from app import create_app\n"
+            "create_app('config.TestingConfig')"))
+        # Top-level lines: "import time: self | cumulative | module"
+        total_us = sum(int(match.group(1)) for match in re.finditer(
+            r'^import time:\s+\d+ \|\s+(\d+) \| \S', result.stderr, re.M))
+        self.assertGreater(total_us, 0)
+        self.assertLess(total_us / 1000, float(IMPORT_TIME_BUDGET_MS))
+
+    def test_create_app_has_no_database_side_effects(self):
+        """No table is created and no admin is seeded"""
+        app = create_app(self._config(SCHEMA_CHECK='off'))
+        self.assertEqual(self._tables(app), [])
+
+    def test_schema_check(self):
+        """A database that was never migrated is reported"""
+        with self.assertRaises(SchemaOutOfDate):
+            create_app(self._config(SCHEMA_CHECK='error'))
+        with self.assertLogs('app.schema', level='WARNING') as logs:
+            app = create_app(self._config(SCHEMA_CHECK='warn'))
+        self.assertIn('flask db upgrade', logs.output[0])
+        self.assertNotIn('alembic_version', self._tables(app))
+
+    def test_schema_at_head_passes(self):
+        """A database built by `flask db upgrade` passes the check"""
+        migrated = create_app(self._config(SCHEMA_CHECK='off'))
+        with migrated.app_context():
+            flask_migrate.upgrade(directory=MIGRATIONS_DIR)
+            db.engine.dispose()
+        self.assertEqual(len(head_revisions(MIGRATIONS_DIR)), 1)
+        app = create_app(self._config(SCHEMA_CHECK='error'))
+        self.assertIn('places', self._tables(app))
+
+    def test_migrations_match_the_models(self):
+        """Autogenerate finds nothing to do at head, full-text index included"""
+        app = create_app(self._config(SCHEMA_CHECK='off'))
+        with app.app_context():
+            flask_migrate.upgrade(directory=MIGRATIONS_DIR)
+            try:
+                flask_migrate.check(directory=MIGRATIONS_DIR)
+            except SystemExit:
+                self.fail("autogenerate detected schema changes")
+            finally:
+                db.engine.dispose()
+
+    def test_duplicate_reviews_stop_the_upgrade(self):
+        """Several reviews of a place by a user are only dropped on request"""
+        app = create_app(self._config(SCHEMA_CHECK='off'))
+        with app.app_context():
+            flask_migrate.upgrade(directory=MIGRATIONS_DIR,
+                                  revision='1da30a75ae26')
+            now = '2026-01-01 00:00:00.000000'
+            with db.engine.begin() as connection:
+                connection.execute(db.text(
+                    "INSERT INTO users (id, first_name, last_name, email, "
+                    "password, created_at, updated_at) "
+                    "VALUES ('u1', 'A', 'B', 'a@b.com', 'x', :now, :now)"),
+                    {'now': now})
+                connection.execute(db.text(
+                    "INSERT INTO places (id, title, price, latitude, longitude, "
+                    "owner_id, created_at, updated_at) "
+                    "VALUES ('p1', 'Cabin', 80, 0, 0, 'u1', :now, :now)"),
+                    {'now': now})
+                for review_id, rating in (('r1', 5), ('r2', 1)):
+                    connection.execute(db.text(
+                        "INSERT INTO reviews (id, text, rating, user_id, "
+                        "place_id, created_at, updated_at) VALUES "
+                        "(:id, 'Stay', :rating, 'u1', 'p1', :now, :now)"),
+                        {'id': review_id, 'rating': rating, 'now': now})
+            try:
+                with self.assertRaises(SystemExit):
+                    flask_migrate.upgrade(directory=MIGRATIONS_DIR)
+                self.assertEqual(self._reviews(), ['r1', 'r2'])
+
+                flask_migrate.upgrade(directory=MIGRATIONS_DIR,
+                                      x_arg=['delete_duplicate_reviews=true'])
+                self.assertEqual(self._reviews(), ['r1'])
+                ratings = db.session.execute(db.text(
+                    "SELECT review_count, rating_sum FROM places")).one()
+                self.assertEqual(tuple(ratings), (1, 5))
+            finally:
+                db.session.remove()
+                db.engine.dispose()
+
+    def test_api_namespaces_restricts_the_routes(self):
+        app = create_app(self._config(SCHEMA_CHECK='off',
+                                      API_NAMESPACES=['amenities']))
+        rules = {rule.rule for rule in app.url_map.iter_rules()}
+        self.assertIn('/api/v1/amenities/', rules)
+        self.assertNotIn('/api/v1/places/', rules)
+
+    def test_create_admin_command(self):
+        app = create_app(self._config(SCHEMA_AUTO_CREATE=True))
+        result = app.test_cli_runner().invoke(args=['create-admin'])
+        self.assertEqual(result.exit_code, 0, result.output)
+        with app.app_context():
+            admin = User.query.filter_by(email="admin@hbnb.com").one()
+            self.assertTrue(admin.is_admin)
+            db.engine.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+from unittest import mock
+from flask import Flask
+from flask_jwt_extended import decode_token
+from sqlalchemy import event
+from app import create_app, db
+from app.services import facade
+from app.tokens import ExpiringStore, TokenRevocationList
+from config import Config
+
+
+class TokenTestCase(unittest.TestCase):
+    """Test cases for role claims, token refresh and revocation"""
+
+    def setUp(self):
+        """Create an admin and a regular user"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.admin = facade.create_user({
+            "first_name": "Ada", "last_name": "Admin", "is_admin": True,
+            "email": "ada@example.com", "password": "Password123"})
+        self.user = facade.create_user({
+            "first_name": "Bob", "last_name": "User",
+            "email": "bob@example.com", "password": "Password123"})
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _login(self, email):
+        response = self.client.post('/api/v1/auth/login', json={
+            "email": email, "password": "Password123"})
+        self.assertEqual(response.status_code, 200)
+        return response.json["access_token"], response.json["refresh_token"]
+
+    def _get_stats(self, token):
+        return self.client.get('/api/v1/admin/cache/stats',
+                               headers={"Authorization": f"Bearer {token}"})
+
+    def _refresh(self, token):
+        return self.client.post('/api/v1/auth/refresh',
+                                headers={"Authorization": f"Bearer {token}"})
+
+    def test_login_embeds_role_claims(self):
+        """Access tokens carry is_admin and roles"""
+        access, _ = self._login("ada@example.com")
+        claims = decode_token(access)
+        self.assertTrue(claims["is_admin"])
+        self.assertEqual(claims["roles"], ["admin", "user"])
+        access, _ = self._login("bob@example.com")
+        self.assertEqual(decode_token(access)["roles"], ["user"])
+
+    def test_admin_is_authorized_from_claims(self):
+        """Admin endpoints do not load the user from the database"""
+        admin_token, _ = self._login("ada@example.com")
+        user_token, _ = self._login("bob@example.com")
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(db.engine, 'before_cursor_execute', before_cursor_execute)
+        try:
+            self.assertEqual(self._get_stats(admin_token).status_code, 200)
+        finally:
+            event.remove(db.engine, 'before_cursor_execute',
+                         before_cursor_execute)
+        self.assertEqual(statements, [])
+        self.assertEqual(self._get_stats(user_token).status_code, 403)
+
+    def test_refresh_issues_an_access_token(self):
+        """A refresh token buys a new access token, an access token does not"""
+        access, refresh = self._login("ada@example.com")
+        response = self._refresh(refresh)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(decode_token(response.json["access_token"])["is_admin"])
+        self.assertEqual(self._refresh(access).status_code, 422)
+
+    def test_demotion_revokes_admin_tokens(self):
+        """Access tokens with stale roles stop working, refresh fixes them"""
+        access, refresh = self._login("ada@example.com")
+        facade.update_user(self.admin["id"], {"is_admin": False},
+                           admin_override=True)
+        self.assertEqual(self._get_stats(access).status_code, 401)
+
+        response = self._refresh(refresh)
+        self.assertEqual(response.status_code, 200)
+        demoted = response.json["access_token"]
+        self.assertFalse(decode_token(demoted)["is_admin"])
+        self.assertEqual(self._get_stats(demoted).status_code, 403)
+
+    def test_logout_revokes_the_token(self):
+        """A logged out token is rejected"""
+        access, _ = self._login("ada@example.com")
+        headers = {"Authorization": f"Bearer {access}"}
+        self.assertEqual(self.client.post('/api/v1/auth/logout',
+                                          headers=headers).status_code, 200)
+        self.assertEqual(self._get_stats(access).status_code, 401)
+
+    def test_deleted_user_cannot_refresh(self):
+        """Deleting a user revokes its refresh tokens"""
+        _, refresh = self._login("bob@example.com")
+        facade.delete_user(self.user["id"], self.user["id"])
+        self.assertEqual(self._refresh(refresh).status_code, 401)
+
+
+class RevocationStoreTestCase(unittest.TestCase):
+    """Test cases for the in-process revocation store"""
+
+    def _init(self, **config):
+        app = Flask(__name__)
+        app.config.from_object(Config)
+        app.config.update(config)
+        revocations = TokenRevocationList()
+        revocations.init_app(app)
+        return revocations
+
+    def test_entries_are_never_evicted(self):
+        """Every live revocation is kept, expired ones are purged"""
+        store = ExpiringStore(default_timeout=60)
+        with mock.patch('app.tokens.time.monotonic', return_value=0.0):
+            for i in range(1000):
+                store.set(f"jti:old{i}", True, timeout=10)
+        with mock.patch('app.tokens.time.monotonic', return_value=20.0):
+            for i in range(5000):
+                store.set(f"jti:{i}", True)
+            self.assertTrue(all(store.get(f"jti:{i}") for i in range(5000)))
+            self.assertIsNone(store.get("jti:old0"))
+        self.assertEqual(len(store), 5000)
+
+    def test_simple_store_needs_a_single_worker(self):
+        """Several processes cannot share the in-process list"""
+        with self.assertRaises(RuntimeError):
+            self._init(WEB_CONCURRENCY=None)
+        with self.assertRaises(RuntimeError):
+            self._init(WEB_CONCURRENCY=4)
+        for config in ({'WEB_CONCURRENCY': 1}, {'DEBUG': True},
+                       {'TESTING': True}):
+            self.assertIsInstance(self._init(**config).store, ExpiringStore)
+
+
+if __name__ == '__main__':
+    unittest.main()
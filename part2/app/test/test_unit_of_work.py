@@ -0,0 +1,112 @@
+import unittest
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app, db
+from app.extensions import unit_of_work
+from app.models.amenity import Amenity
+from app.models.user import User
+from app.services import facade
+
+
+class UnitOfWorkTestCase(unittest.TestCase):
+    """Test cases for the unit of work used by the facade and the requests"""
+
+    def setUp(self):
+        """Count the transactions committed on the engine"""
+        self.app = create_app("config.TestingConfig")
+        self.client = self.app.test_client()
+        self.ctx = self.app.app_context()
+        self.ctx.push()
+        self.commits = 0
+        event.listen(db.engine, 'commit', self._count_commit)
+
+    def tearDown(self):
+        event.remove(db.engine, 'commit', self._count_commit)
+        db.session.remove()
+        db.drop_all()
+        self.ctx.pop()
+
+    def _count_commit(self, conn):
+        self.commits += 1
+
+    def _user_data(self, email):
+        return {"first_name": "Jane", "last_name": "Doe",
+                "email": email, "password": "Password123"}
+
+    def test_facade_operation_commits_once(self):
+        """A facade write outside a request commits on its own"""
+        facade.create_user(self._user_data("jane@example.com"))
+        self.assertEqual(self.commits, 1)
+
+    def test_nested_operations_commit_once(self):
+        """Facade calls inside a unit of work share its single commit"""
+        with unit_of_work():
+            facade.create_user(self._user_data("jane@example.com"))
+            facade.create_amenity({"name": "Wifi"})
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(User.query.count(), 1)
+        self.assertEqual(facade.get_all_amenities_data()[0]["name"], "Wifi")
+
+    def test_error_rolls_back_the_whole_unit(self):
+        """An exception discards every write of the unit of work"""
+        with self.assertRaises(ValueError):
+            with unit_of_work():
+                facade.create_amenity({"name": "Wifi"})
+                facade.create_amenity({"name": "Pool"})
+                raise ValueError("boom")
+        self.assertEqual(self.commits, 0)
+        self.assertEqual(Amenity.query.count(), 0)
+
+    def test_on_commit_runs_after_commit_only(self):
+        """Callbacks run once the transaction commits, never on rollback"""
+        calls = []
+        with unit_of_work():
+            facade.create_amenity({"name": "Wifi"})
+            unit_of_work.on_commit(lambda: calls.append(self.commits))
+            self.assertEqual(calls, [])
+        self.assertEqual(calls, [1])
+
+        with self.assertRaises(RuntimeError):
+            with unit_of_work():
+                unit_of_work.on_commit(lambda: calls.append("rolled back"))
+                raise RuntimeError()
+        self.assertEqual(calls, [1])
+
+    def test_repository_defers_commit(self):
+        """commit=False only stages the entity in the session"""
+        facade.amenity_repo.add(Amenity(name="Wifi"), commit=False)
+        self.assertEqual(self.commits, 0)
+        db.session.rollback()
+        self.assertEqual(Amenity.query.count(), 0)
+
+    def test_write_request_commits_once(self):
+        """Creating a place with amenities is a single commit"""
+        owner = facade.create_user(self._user_data("owner@example.com"))
+        amenities = [facade.create_amenity({"name": name}).id
+                     for name in ("Wifi", "Pool", "Parking")]
+        token = create_access_token(identity=owner["id"])
+        self.commits = 0
+        response = self.client.post('/api/v1/places/', json={
+            "title": "Cabin", "price": 80.0, "latitude": 10.0,
+            "longitude": 20.0, "owner_id": owner["id"],
+            "amenities": amenities},
+            headers={"Authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(self.commits, 1)
+
+    def test_error_response_rolls_back_the_request(self):
+        """Writes of a request answered with an error are not committed"""
+        @self.app.route('/test/failing-write', methods=['POST'])
+        def failing_write():
+            facade.create_amenity({"name": "Wifi"})
+            return {"message": "rejected"}, 400
+
+        response = self.client.post('/test/failing-write')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.commits, 0)
+        self.assertEqual(Amenity.query.count(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+Token Module
+
+Authorization is decided from the JWT alone, without loading the user on
+every request: access tokens carry the user's privileges as claims
+(`is_admin` and `roles`), added by the `additional_claims_loader`
+registered in `init_jwt`, and endpoints check them with `roles_required` /
+`admin_required`.
+
+Claims cannot change once a token is issued, so access tokens are
+short-lived (JWT_ACCESS_TOKEN_EXPIRES) and clients renew them with a
+refresh token (POST /api/v1/auth/refresh), which re-reads the user. Until
+then a revocation list rejects tokens that must stop working early:
+    - a single token, on logout;
+    - access tokens whose claims no longer match the user's, after a
+      promotion or demotion (a refresh issues correct ones);
+    - every token of a user that was deleted or whose password changed.
+
+The list lives in a store with per-entry expiry, a RedisCache shared by
+every worker or an in-process ExpiringStore, and entries expire with the
+tokens they revoke. Checking a token costs two lookups. Neither store
+evicts an entry before it expires: a forgotten revocation would let the
+token work again. An in-process list is only seen by its own process, so
+outside debug and testing mode the 'simple' store is refused unless the
+app is served by a single worker process.
+
+Configuration (Flask config keys):
+    JWT_ACCESS_TOKEN_EXPIRES (timedelta): Lifetime of access tokens.
+    JWT_REFRESH_TOKEN_EXPIRES (timedelta): Lifetime of refresh tokens.
+    TOKEN_REVOCATION_STORE (str): 'simple' (default) or 'redis'
+        (uses CACHE_REDIS_URL).
+    WEB_CONCURRENCY (int): Number of worker processes; 'simple' needs 1.
+"""
+
+import functools
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, Optional
+
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+from werkzeug.exceptions import Forbidden
+
+from app.cache import RedisCache
+
+ADMIN_ROLE = 'admin'
+USER_ROLE = 'user'
+
+# Marks every token of a user as revoked
+_ALL_TOKENS = 'all'
+
+
+def token_claims(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Authorization claims of a user (as returned by `to_dict`)."""
+    is_admin = bool(user.get("is_admin"))
+    return {
+        "is_admin": is_admin,
+        "roles": [ADMIN_ROLE, USER_ROLE] if is_admin else [USER_ROLE],
+    }
+
+
+class ExpiringStore:
+    """
+    Thread-safe in-process store whose entries are only removed once they
+    have expired: it is never full. Expired entries are purged whenever the
+    number of entries doubles.
+    """
+
+    def __init__(self, default_timeout: int):
+        self.default_timeout = default_timeout
+        self._entries: Dict[str, tuple] = {}
+        self._purge_at = 1024
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
+        """Store a value for `timeout` seconds."""
+        timeout = self.default_timeout if timeout is None else timeout
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + timeout)
+            if len(self._entries) >= self._purge_at:
+                now = time.monotonic()
+                self._entries = {k: entry for k, entry in self._entries.items()
+                                 if entry[1] > now}
+                self._purge_at = max(1024, 2 * len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _seconds(lifetime) -> int:
+    if isinstance(lifetime, timedelta):
+        return max(1, int(lifetime.total_seconds()))
+    return max(1, int(lifetime))
+
+
+class TokenRevocationList:
+    """Revoked tokens and users, initialised like an extension."""
+
+    def __init__(self):
+        self.access_ttl = 15 * 60
+        self.refresh_ttl = 30 * 24 * 3600
+        self.store = ExpiringStore(self.refresh_ttl)
+
+    def init_app(self, app, store=None) -> None:
+        """
+        Choose the store and read the token lifetimes from the config.
+
+        Raises:
+            RuntimeError: If the 'simple' store would be one of several
+                per-process lists (not in debug or testing mode, and
+                WEB_CONCURRENCY is not 1).
+        """
+        self.access_ttl = _seconds(app.config['JWT_ACCESS_TOKEN_EXPIRES'])
+        self.refresh_ttl = _seconds(app.config['JWT_REFRESH_TOKEN_EXPIRES'])
+        if store is not None:
+            self.store = store
+        elif app.config.get('TOKEN_REVOCATION_STORE') == 'redis':
+            import redis  # Optional dependency, only needed for this backend
+            client = redis.Redis.from_url(app.config['CACHE_REDIS_URL'])
+            self.store = RedisCache(
+                client, self.refresh_ttl,
+                app.config.get('CACHE_KEY_PREFIX', 'hbnb:') + 'revoked:')
+        else:
+            if not (app.debug or app.testing
+                    or app.config.get('WEB_CONCURRENCY') == 1):
+                raise RuntimeError(
+                    "TOKEN_REVOCATION_STORE='simple' keeps revoked tokens in "
+                    "each worker process: use 'redis', or set "
+                    "WEB_CONCURRENCY=1 when a single worker serves the app.")
+            self.store = ExpiringStore(self.refresh_ttl)
+
+    def revoke(self, payload: Dict[str, Any]) -> None:
+        """Revoke one token until it expires."""
+        remaining = int(payload['exp'] - time.time())
+        if remaining > 0:
+            self.store.set(f"jti:{payload['jti']}", True, timeout=remaining)
+
+    def revoke_user(self, user_id: str) -> None:
+        """
+        Revoke every access and refresh token issued to a user so far
+        (up to the current second: `iat` has a one-second resolution).
+        """
+        self._update_user(user_id, {_ALL_TOKENS: int(time.time())})
+
+    def update_claims(self, user_id: str, claims: Dict[str, Any]) -> None:
+        """Revoke the access tokens of a user that carry other claims."""
+        self._update_user(user_id, claims)
+
+    def _update_user(self, user_id: str, changes: Dict[str, Any]) -> None:
+        state = dict(self.store.get(f"user:{user_id}") or {}, **changes)
+        timeout = self.refresh_ttl if _ALL_TOKENS in state else self.access_ttl
+        self.store.set(f"user:{user_id}", state, timeout=timeout)
+
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        """Whether a decoded token has been revoked."""
+        if self.store.get(f"jti:{payload['jti']}"):
+            return True
+        state = self.store.get(f"user:{payload['sub']}")
+        if not state:
+            return False
+        if payload['iat'] <= state.get(_ALL_TOKENS, -1):
+            return True
+        return payload.get('type') == 'access' and any(
+            payload.get(name) != value for name, value in state.items()
+            if name != _ALL_TOKENS)
+
+
+def init_jwt(jwt, revocations: TokenRevocationList,
+             load_user: Callable[[str], Optional[Dict[str, Any]]]) -> None:
+    """
+    Register the JWT callbacks: role claims on every issued token (from
+    `load_user(identity)`) and the revocation check on every request.
+    """
+    @jwt.additional_claims_loader
+    def add_role_claims(identity):
+        user = load_user(identity)
+        return token_claims(user) if user else {}
+
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        return revocations.is_revoked(jwt_payload)
+
+
+def roles_required(*roles: str):
+    """Require a valid access token whose `roles` claim has all of `roles`."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            verify_jwt_in_request()
+            if not set(roles).issubset(get_jwt().get('roles', ())):
+                raise Forbidden("Insufficient privileges")
+            return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def admin_required():
+    """Require a valid access token of an administrator."""
+    return roles_required(ADMIN_ROLE)
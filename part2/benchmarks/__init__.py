@@ -0,0 +1,12 @@
+"""
+Benchmarks for the HBnB API.
+
+Each module can be run on its own from the ``part2`` directory, e.g.::
+
+    python -m benchmarks.bench_review_listing
+
+The end-to-end suite (synthetic datasets, scenario mix, baselines) is the
+`benchmarks.e2e` package::
+
+    python -m benchmarks.e2e --help
+"""
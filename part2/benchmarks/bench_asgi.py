@@ -0,0 +1,177 @@
+"""
+Load benchmark comparing the WSGI and ASGI serving modes.
+
+Seeds a SQLite database, starts the Flask app on the threaded Werkzeug
+server and the ASGI app (`app.asgi`) on uvicorn, then drives both over HTTP
+with the same mix of public GET requests at a fixed concurrency, reporting
+requests/sec and p50/p99 latency.
+
+Usage:
+    python -m benchmarks.bench_asgi [--places 20000] [--concurrency 64]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from config import TestingConfig
+
+WSGI_PORT = 8765
+ASGI_PORT = 8766
+
+
+def _config(path):
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        CACHE_TYPE = 'null'
+    return BenchConfig
+
+
+def _seed(path, places, seed=42):
+    """Create places with reviews; return a sample of place ids."""
+    from app import create_app, db
+    from app.models.place import Place
+    from app.models.review import Review
+    from app.models.user import User
+
+    rng = random.Random(seed)
+    app = create_app(_config(path))
+    with app.app_context():
+        owner = User(first_name="Bench", last_name="Owner",
+                     email="bench@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.commit()
+        now = datetime.utcnow()
+        ids = [str(uuid.uuid4()) for _ in range(places)]
+        db.session.execute(Place.__table__.insert(), [{
+            "id": place_id, "title": f"Place {i}",
+            "price": round(rng.uniform(20, 500), 2),
+            "latitude": rng.uniform(-60, 60), "longitude": rng.uniform(-170, 170),
+            "owner_id": owner.id, "created_at": now, "updated_at": now,
+        } for i, place_id in enumerate(ids)])
+        db.session.execute(Review.__table__.insert(), [{
+            "id": str(uuid.uuid4()), "text": "Nice", "rating": rng.randint(1, 5),
+            "user_id": owner.id, "place_id": rng.choice(ids),
+            "created_at": now, "updated_at": now,
+        } for _ in range(places)])
+        db.session.commit()
+    return rng.sample(ids, min(200, len(ids)))
+
+
+def _serve(mode, path, port):
+    """Run one server in this process (used by the benchmark subprocesses)."""
+    if mode == 'wsgi':
+        from werkzeug.serving import run_simple
+        from app import create_app
+        run_simple('127.0.0.1', port, create_app(_config(path)),
+                   threaded=True)
+    else:
+        import uvicorn
+        from app.asgi import create_asgi_app
+        uvicorn.run(create_asgi_app(_config(path)), host='127.0.0.1',
+                    port=port, log_level='warning')
+
+
+def _wait_for(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+async def _get(port, path):
+    """Minimal HTTP/1.1 GET over a fresh connection; returns the status."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n"
+                 "Connection: close\r\n\r\n".encode('ascii'))
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b' ', 2)[1])
+
+
+async def _load(port, paths, requests, concurrency):
+    latencies = []
+    errors = 0
+    queue = iter(paths[i % len(paths)] for i in range(requests))
+
+    async def worker():
+        nonlocal errors
+        for path in queue:
+            start = time.perf_counter()
+            try:
+                status = await _get(port, path)
+            except OSError:
+                status = 0
+            latencies.append((time.perf_counter() - start) * 1000)
+            if status != 200:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return (len(latencies) / elapsed, statistics.median(latencies),
+            latencies[int(len(latencies) * 0.99) - 1], errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=20000)
+    parser.add_argument('--requests', type=int, default=3000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--serve', choices=['wsgi', 'asgi'], help=argparse.SUPPRESS)
+    parser.add_argument('--db', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        _serve(args.serve, args.db, args.port)
+        return
+
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    sample = _seed(path, args.places)
+    rng = random.Random(1)
+    paths = []
+    for _ in range(500):
+        place_id = rng.choice(sample)
+        paths.append(rng.choice([
+            '/api/v1/places/?limit=20',
+            f'/api/v1/places/?limit=20&min_price={rng.randint(20, 400)}&sort=price',
+            f'/api/v1/places/{place_id}',
+            f'/api/v1/places/{place_id}/reviews?limit=20',
+            '/api/v1/amenities/',
+        ]))
+
+    print(f"{'mode':<6} {'req/s':>8} {'p50 (ms)':>10} {'p99 (ms)':>10} {'errors':>7}")
+    for mode, port in (('wsgi', WSGI_PORT), ('asgi', ASGI_PORT)):
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'benchmarks.bench_asgi', '--serve', mode,
+             '--db', path, '--port', str(port)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(port)
+            asyncio.run(_load(port, paths, 200, 8))  # warm-up
+            rps, p50, p99, errors = asyncio.run(
+                _load(port, paths, args.requests, args.concurrency))
+            print(f"{mode:<6} {rps:>8.0f} {p50:>10.1f} {p99:>10.1f} {errors:>7}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark for the bulk place importer.
+
+Writes an NDJSON file of synthetic places, then times the bulk importer
+against the one-commit-per-place path used by POST /api/v1/places/
+(``--per-row``, run on a sample since it is orders of magnitude slower).
+
+Usage:
+    python -m benchmarks.bench_bulk_import [--places 1000000]
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from app import create_app, db
+from app.models.place import Place
+from app.models.user import User
+from app.services import facade
+from config import TestingConfig
+
+
+def _write_places(path, count, owner_id, amenities, seed=42):
+    """Write `count` random places as NDJSON."""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            f.write(json.dumps({
+                "title": f"Place {i}", "description": "Bulk imported place",
+                "price": round(rng.uniform(20, 500), 2),
+                "latitude": rng.uniform(-89, 89),
+                "longitude": rng.uniform(-179, 179),
+                "owner_id": owner_id,
+                "amenities": rng.sample(amenities, 2),
+            }) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=1000000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--per-row', type=int, default=0, metavar='N',
+                        help='also time N places inserted one commit at a time')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'bench.db')
+    source = os.path.join(workdir, 'places.ndjson')
+
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(BenchConfig)
+
+    with app.app_context():
+        owner = User(first_name="Bench", last_name="Owner",
+                     email="bench@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.commit()
+        amenities = ["WiFi", "Pool", "Parking", "Kitchen", "Gym"]
+        for name in amenities:
+            facade.create_amenity({"name": name})
+
+        _write_places(source, args.places, owner.id, amenities)
+        start = time.perf_counter()
+        with open(source, encoding='utf-8') as f:
+            report = facade.bulk_import('places', f, 'ndjson', args.batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"bulk import: {report.imported} places in {elapsed:.1f}s "
+              f"({report.imported / elapsed:,.0f} rows/s, "
+              f"{report.failed} rejected)")
+
+        if args.per_row:
+            amenity_ids = [a['id'] for a in facade.get_all_amenities_data()]
+            start = time.perf_counter()
+            for i in range(args.per_row):
+                facade.create_place({
+                    "title": f"Row {i}", "price": 100.0, "latitude": 0.0,
+                    "longitude": 0.0, "owner_id": owner.id,
+                    "amenities": amenity_ids[:2]})
+            elapsed = time.perf_counter() - start
+            print(f"per-row create_place: {args.per_row} places in "
+                  f"{elapsed:.1f}s ({args.per_row / elapsed:,.0f} rows/s)")
+        print(f"places in database: {Place.query.count()}")
+
+
+if __name__ == '__main__':
+    main()
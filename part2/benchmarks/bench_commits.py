@@ -0,0 +1,136 @@
+"""
+Commits per endpoint benchmark.
+
+Drives the write endpoints through the test client against a file database
+and counts the transactions committed on the engine for each request (the
+unit of work should keep every request at one commit at most), together with
+the median request latency.
+
+Usage:
+    python -m benchmarks.bench_commits [--requests 200]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+
+from app import create_app, db
+from app.init_db import create_default_admin
+from app.services import facade
+from config import TestingConfig
+
+
+def _make_app(path):
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        CACHE_TYPE = 'null'
+    return create_app(BenchConfig)
+
+
+def _scenarios(app, count):
+    """Yield (endpoint, request function) pairs, `count` of each endpoint."""
+    with app.app_context():
+        create_default_admin()
+        admin = facade.get_user_by_email("admin@hbnb.com")
+        admin_auth = {"Authorization":
+                      f"Bearer {create_access_token(identity=admin.id)}"}
+        owner = facade.create_user({
+            "first_name": "Bench", "last_name": "Owner",
+            "email": "owner@example.com", "password": "Password123"})
+        owner_auth = {"Authorization":
+                      f"Bearer {create_access_token(identity=owner['id'])}"}
+        reviewers = [create_access_token(identity=facade.create_user({
+            "first_name": "Bench", "last_name": "Reviewer",
+            "email": f"reviewer{i}@example.com",
+            "password": "Password123"})["id"]) for i in range(count)]
+    client = app.test_client()
+    amenities, places, reviews = [], [], []
+
+    def create_user(i):
+        return client.post('/api/v1/users/', json={
+            "first_name": "New", "last_name": "User",
+            "email": f"user{i}@example.com", "password": "Password123"})
+
+    def login(i):
+        return client.post('/api/v1/auth/login', json={
+            "email": "owner@example.com", "password": "Password123"})
+
+    def create_amenity(i):
+        response = client.post('/api/v1/amenities/', json={
+            "name": f"Amenity {i}"}, headers=admin_auth)
+        amenities.append(response.json["id"])
+        return response
+
+    def create_place(i):
+        response = client.post('/api/v1/places/', json={
+            "title": f"Place {i}", "price": 80.0, "latitude": 10.0,
+            "longitude": 20.0, "owner_id": owner["id"],
+            "amenities": amenities[i:i + 3]}, headers=owner_auth)
+        places.append(response.json["data"]["id"])
+        return response
+
+    def update_place(i):
+        return client.put(f'/api/v1/places/{places[i]}', json={
+            "price": 90.0, "amenities": amenities[i:i + 5]},
+            headers=owner_auth)
+
+    def create_review(i):
+        response = client.post(f'/api/v1/places/{places[0]}/reviews', json={
+            "text": "Great stay", "rating": 1 + i % 5},
+            headers={"Authorization": f"Bearer {reviewers[i]}"})
+        reviews.append((response.json["id"], reviewers[i]))
+        return response
+
+    def update_review(i):
+        review_id, token = reviews[i]
+        return client.put(f'/api/v1/{review_id}', json={
+            "text": "Changed my mind", "rating": 5},
+            headers={"Authorization": f"Bearer {token}"})
+
+    def delete_review(i):
+        review_id, token = reviews[i]
+        return client.delete(f'/api/v1/{review_id}',
+                             headers={"Authorization": f"Bearer {token}"})
+
+    for name, fn in (('POST /users', create_user), ('POST /auth/login', login),
+                     ('POST /amenities', create_amenity),
+                     ('POST /places', create_place),
+                     ('PUT /places/<id>', update_place),
+                     ('POST /places/<id>/reviews', create_review),
+                     ('PUT /<review_id>', update_review),
+                     ('DELETE /<review_id>', delete_review)):
+        yield name, fn
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--requests', type=int, default=200)
+    args = parser.parse_args()
+
+    app = _make_app(os.path.join(tempfile.mkdtemp(), 'bench.db'))
+    commits = []
+    with app.app_context():
+        event.listen(db.engine, 'commit', lambda conn: commits.append(1))
+
+    print(f"{'endpoint':<26} {'status':>7} {'commits/req':>12} "
+          f"{'max':>4} {'p50 (ms)':>9}")
+    for name, fn in _scenarios(app, args.requests):
+        per_request, latencies, statuses = [], [], set()
+        for i in range(args.requests):
+            before = len(commits)
+            start = time.perf_counter()
+            statuses.add(fn(i).status_code)
+            latencies.append((time.perf_counter() - start) * 1000)
+            per_request.append(len(commits) - before)
+        print(f"{name:<26} {','.join(map(str, sorted(statuses))):>7} "
+              f"{statistics.mean(per_request):>12.2f} {max(per_request):>4} "
+              f"{statistics.median(latencies):>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark for the radius and nearest-neighbour place searches.
+
+Loads places clustered around a set of cities, then times
+GET /api/v1/places/?near=...&radius_km=... and ?near=...&nearest=k against a
+full scan computing the haversine distance of every place (``--scan``).
+
+Usage:
+    python -m benchmarks.bench_geo_search [--places 1000000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime
+
+from app import create_app, db
+from app.geo import grid_cell, haversine_km
+from app.models.place import Place
+from app.models.user import User
+from config import TestingConfig
+
+CITIES = [
+    (18.4861, -69.9312), (40.7128, -74.0060), (48.8566, 2.3522),
+    (51.5074, -0.1278), (35.6762, 139.6503), (-33.8688, 151.2093),
+    (19.4326, -99.1332), (-23.5505, -46.6333), (41.9028, 12.4964),
+    (40.4168, -3.7038), (34.0522, -118.2437), (25.7617, -80.1918),
+]
+
+
+def _insert_places(count, owner_id, seed=42):
+    """Insert `count` places scattered around CITIES with executemany."""
+    rng = random.Random(seed)
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        lat, lon = rng.choice(CITIES)
+        lat = max(-90.0, min(90.0, rng.gauss(lat, 0.5)))
+        lon = max(-180.0, min(180.0, rng.gauss(lon, 0.5)))
+        rows.append({
+            "id": str(uuid.uuid4()), "title": f"Place {i}",
+            "price": round(rng.uniform(20, 500), 2),
+            "latitude": lat, "longitude": lon,
+            "geo_cell": grid_cell(lat, lon), "owner_id": owner_id,
+            "created_at": now, "updated_at": now,
+        })
+        if len(rows) == 20000:
+            db.session.execute(Place.__table__.insert(), rows)
+            rows = []
+    if rows:
+        db.session.execute(Place.__table__.insert(), rows)
+    db.session.commit()
+
+
+def _time(fn, repeat):
+    """Return the median wall time of `fn` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--scan', action='store_true',
+                        help='also time a full-scan haversine search')
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(BenchConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        owner = User(first_name="Bench", last_name="Owner",
+                     email="bench@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.commit()
+        start = time.perf_counter()
+        _insert_places(args.places, owner.id)
+        print(f"loaded {args.places} places in "
+              f"{time.perf_counter() - start:.1f}s")
+
+    lat, lon = CITIES[0]
+    scenarios = [
+        ("radius 2 km", f"near={lat},{lon}&radius_km=2&limit=20"),
+        ("radius 25 km", f"near={lat},{lon}&radius_km=25&limit=20"),
+        ("nearest 10", f"near={lat},{lon}&nearest=10"),
+        ("nearest 10 (remote)", "near=0,-30&nearest=10"),
+    ]
+    print(f"{'scenario':<22} {'p50 (ms)':>10}")
+    for name, query in scenarios:
+        url = f'/api/v1/places/?{query}'
+        assert client.get(url).status_code == 200
+        print(f"{name:<22} {_time(lambda: client.get(url), args.repeat):>10.2f}")
+
+    if args.scan:
+        def scan():
+            with app.app_context():
+                rows = db.session.query(
+                    Place.id, Place.latitude, Place.longitude).all()
+                return sorted((haversine_km(lat, lon, a, b), i)
+                              for i, a, b in rows)[:10]
+        print(f"{'full scan':<22} {_time(scan, 1):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Microbenchmark of the JSON encoding of place listings.
+
+Builds a payload of places (10,000 by default, each with a few amenities),
+as the listing endpoints return it, and times `to_dict()` and the encoding
+with every available encoder. The stdlib row is the encoding Flask-RESTx
+used before.
+
+Usage:
+    python -m benchmarks.bench_json [--places 10000] [--repeat 10]
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app import create_app
+from app.models.amenity import Amenity
+from app.models.place import Place
+from app.serialization import OrjsonEncoder, StdlibEncoder
+from config import TestingConfig
+
+
+def _places(count):
+    """Transient places sharing five amenities, with distinct dates."""
+    start = datetime(2020, 1, 1)
+    amenities = [Amenity(id=str(uuid.uuid4()), name=f"Amenity {i}",
+                         created_at=start, updated_at=start) for i in range(5)]
+    owner_id = str(uuid.uuid4())
+    places = []
+    for i in range(count):
+        created = start + timedelta(seconds=i, microseconds=i)
+        places.append(Place(
+            id=str(uuid.uuid4()), title=f"Place {i}", description="A place",
+            price=50.0 + i % 100, latitude=i % 90, longitude=i % 180,
+            owner_id=owner_id, amenities=amenities[:i % 5 + 1],
+            created_at=created, updated_at=created))
+    return places
+
+
+def _time(fn, repeat):
+    """Return the median wall time of `fn` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    encoders = [StdlibEncoder()]
+    try:
+        encoders.append(OrjsonEncoder())
+    except ImportError:
+        print("orjson is not installed: only the stdlib encoder is timed")
+
+    app = create_app(TestingConfig)
+    with app.app_context():
+        places = _places(args.places)
+        to_dict = _time(lambda: [p.to_dict() for p in places], args.repeat)
+        payload = {"status": "success",
+                   "data": [p.to_dict() for p in places]}
+        print(f"to_dict(): {to_dict:.2f} ms for {args.places} places\n")
+
+        print(f"{'encoder':>8} {'encode p50 (ms)':>16} {'size (KiB)':>11} "
+              f"{'speedup':>8}")
+        baseline = None
+        for encoder in encoders:
+            size = len(encoder.dumps(payload)) / 1024
+            encode = _time(lambda: encoder.dumps(payload), args.repeat)
+            baseline = baseline or encode
+            print(f"{encoder.name:>8} {encode:>16.2f} {size:>11.0f} "
+                  f"{baseline / encode:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Benchmark for GET /api/v1/places/<place_id>/reviews.
+
+Grows the reviews table in steps and measures the latency of the first page
+of reviews for one place at every step. With the (place_id, created_at) index
+and keyset pagination the latency should stay flat; the legacy full scan
+(``--legacy``) grows linearly with the table.
+
+Usage:
+    python -m benchmarks.bench_review_listing [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app import create_app, db
+from app.models.review import Review
+from config import TestingConfig
+
+
+def _insert_reviews(count, user_id, place_ids, start):
+    """Insert `count` reviews spread over `place_ids` with executemany."""
+    rows = []
+    for i in range(count):
+        created = start + timedelta(seconds=i)
+        rows.append({
+            "id": str(uuid.uuid4()), "text": f"Review {i}", "rating": i % 5 + 1,
+            "user_id": user_id, "place_id": place_ids[i % len(place_ids)],
+            "created_at": created, "updated_at": created,
+        })
+        if len(rows) == 10000:
+            db.session.execute(Review.__table__.insert(), rows)
+            rows = []
+    if rows:
+        db.session.execute(Review.__table__.insert(), rows)
+    db.session.commit()
+
+
+def _time(fn, repeat):
+    """Return the median wall time of `fn` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10000, 100000, 1000000])
+    parser.add_argument('--places', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--legacy', action='store_true',
+                        help='also time the previous full-table scan')
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+
+    app = create_app(BenchConfig)
+    client = app.test_client()
+
+    with app.app_context():
+        from app.models.user import User
+        from app.models.place import Place
+        owner = User(first_name="Bench", last_name="Owner",
+                     email="bench@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.flush()
+        places = [Place(title=f"Place {i}", price=50.0, latitude=0.0,
+                        longitude=0.0, owner_id=owner.id)
+                  for i in range(args.places)]
+        db.session.add_all(places)
+        db.session.commit()
+        owner_id, place_ids = owner.id, [p.id for p in places]
+
+    target = place_ids[0]
+    url = f'/api/v1/places/{target}/reviews?limit=20'
+    inserted = 0
+    start = datetime(2020, 1, 1)
+
+    print(f"{'reviews':>10} {'page p50 (ms)':>15}"
+          + (f" {'legacy (ms)':>12}" if args.legacy else ""))
+    for size in sorted(args.sizes):
+        with app.app_context():
+            _insert_reviews(size - inserted, owner_id, place_ids,
+                            start + timedelta(seconds=inserted))
+        inserted = size
+
+        paged = _time(lambda: client.get(url), args.repeat)
+        line = f"{size:>10} {paged:>15.2f}"
+        if args.legacy:
+            with app.app_context():
+                legacy = _time(lambda: [r for r in Review.query.all()
+                                        if r.place_id == target], 1)
+            line += f" {legacy:>12.2f}"
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
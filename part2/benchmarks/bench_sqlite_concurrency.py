@@ -0,0 +1,136 @@
+"""
+Concurrency benchmark for the SQLite engine configuration.
+
+Runs reader threads (GET place listings and place reviews through the test
+client) alongside writer threads (review creation through the facade, one
+commit each) for a fixed time, first with SQLite's defaults (rollback
+journal, synchronous=FULL, no busy timeout, no read-only pool) and then
+with the configured profile (WAL, synchronous=NORMAL, busy_timeout, mmap,
+read-only pool). Reports read latency percentiles, throughput and the
+number of failed requests ("database is locked").
+
+Usage:
+    python -m benchmarks.bench_sqlite_concurrency [--seconds 10]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+import uuid
+from datetime import datetime
+
+from app import create_app, db
+from app.models.place import Place
+from app.models.user import User
+from app.services import facade
+from config import TestingConfig
+
+DEFAULTS = {'journal_mode': 'DELETE', 'synchronous': 'FULL', 'busy_timeout': 0}
+
+
+def _make_app(path, tuned):
+    class BenchConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        CACHE_TYPE = 'null'
+        SQLITE_READONLY_POOL = tuned
+        if not tuned:
+            SQLITE_PRAGMAS = DEFAULTS
+    return create_app(BenchConfig)
+
+
+def _seed(app, places):
+    with app.app_context():
+        owner = User(first_name="Bench", last_name="Owner",
+                     email="bench@example.com", password="Password123")
+        db.session.add(owner)
+        db.session.commit()
+        now = datetime.utcnow()
+        ids = [str(uuid.uuid4()) for _ in range(places)]
+        db.session.execute(Place.__table__.insert(), [{
+            "id": place_id, "title": f"Place {i}", "price": 50.0 + i % 400,
+            "latitude": 0.0, "longitude": 0.0, "owner_id": owner.id,
+            "created_at": now, "updated_at": now,
+        } for i, place_id in enumerate(ids)])
+        db.session.commit()
+        return owner.id, ids
+
+
+def _run(app, owner_id, place_ids, seconds, readers, writers):
+    stop = time.perf_counter() + seconds
+    latencies, stats = [], {'reads': 0, 'writes': 0, 'failed': 0}
+    lock = threading.Lock()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        client = app.test_client()
+        while time.perf_counter() < stop:
+            url = rng.choice([
+                '/api/v1/places/?limit=20',
+                f'/api/v1/places/{rng.choice(place_ids)}/reviews?limit=20'])
+            start = time.perf_counter()
+            status = client.get(url).status_code
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                latencies.append(elapsed)
+                stats['reads'] += 1
+                if status != 200:
+                    stats['failed'] += 1
+
+    def writer(seed):
+        rng = random.Random(seed)
+        with app.app_context():
+            while time.perf_counter() < stop:
+                try:
+                    facade.create_review({
+                        "text": "Benchmark review", "rating": rng.randint(1, 5),
+                        "user_id": owner_id, "place_id": rng.choice(place_ids)})
+                    with lock:
+                        stats['writes'] += 1
+                except Exception as e:
+                    # create_review wraps the driver error
+                    if 'database is locked' not in str(e):
+                        raise
+                    db.session.rollback()
+                    with lock:
+                        stats['failed'] += 1
+
+    threads = ([threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+               + [threading.Thread(target=writer, args=(100 + i,))
+                  for i in range(writers)])
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    return (statistics.median(latencies),
+            latencies[int(len(latencies) * 0.99) - 1], latencies[-1],
+            stats['reads'] / seconds, stats['writes'] / seconds, stats['failed'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', type=int, default=20000)
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    args = parser.parse_args()
+
+    print(f"{'profile':<9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} "
+          f"{'reads/s':>8} {'writes/s':>9} {'failed':>7}")
+    for name, tuned in (('defaults', False), ('tuned', True)):
+        path = os.path.join(tempfile.mkdtemp(), 'bench.db')
+        app = _make_app(path, tuned)
+        owner_id, place_ids = _seed(app, args.places)
+        p50, p99, worst, reads, writes, failed = _run(
+            app, owner_id, place_ids, args.seconds, args.readers, args.writers)
+        print(f"{name:<9} {p50:>9.1f} {p99:>9.1f} {worst:>9.1f} "
+              f"{reads:>8.0f} {writes:>9.0f} {failed:>7}")
+
+
+if __name__ == '__main__':
+    main()
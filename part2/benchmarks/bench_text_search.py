@@ -0,0 +1,144 @@
+"""
+Benchmark for the full-text place search.
+
+Times GET /api/v1/places/search?q=... on a synthetic dataset (see
+benchmarks.e2e.dataset: clustered places, Zipf-skewed reviews) for queries
+of growing breadth, from a rare word to words found in a third of the
+places or reviews, and, with ``--like``, the substring title filter
+(GET /api/v1/places/?title=...). The dataset's vocabulary is small, so a
+few places with a rare word are added for the run (and deleted after it).
+
+The ranking query is also timed on its own (``rank``), and the number of
+places matching every word is reported. Set SEARCH_CANDIDATES to time the
+ranking capped to the newest matches.
+
+Usage:
+    python -m benchmarks.bench_text_search [--places 1m] [--db bench.db]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import bindparam, text
+
+from app import create_app, db
+from app.persistence import place_repository
+from app.search import match_query, words
+from benchmarks.e2e import dataset
+from benchmarks.e2e.__main__ import bench_config
+
+RARE_WORD = "Zanzibar"
+RARE_PLACES = 25
+
+# (name, query): the dataset's titles are "<adjective> <kind> in <city>"
+QUERIES = [
+    ("rare word", RARE_WORD),
+    ("rare + common", f"villa {RARE_WORD}"),
+    ("title words", "hidden penthouse reykjavik"),
+    ("title word", "penthouse"),
+    ("description", "remote work"),
+    ("review phrase", "host amazing"),
+    ("common word", "quiet"),
+]
+
+
+def _time(fn, repeat):
+    """Return the median wall time of `fn` in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def _add_rare_places(app):
+    """Add RARE_PLACES places mentioning RARE_WORD; return their ids."""
+    ids = [f"bench-search-{i}" for i in range(RARE_PLACES)]
+    with app.app_context():
+        owner_id = db.session.execute(text("SELECT id FROM users LIMIT 1")).scalar()
+        db.session.execute(text(
+            "INSERT INTO places (id, title, description, price, latitude, "
+            "longitude, owner_id, created_at, updated_at) VALUES (:id, :title, "
+            ":description, 100, 0, 0, :owner_id, :now, :now)"), [
+            dict(id=place_id, owner_id=owner_id, now=datetime.utcnow(),
+                 title=f"Villa {i} in {RARE_WORD}" if i % 2 else f"Hut {i}",
+                 description=f"A stay in {RARE_WORD}, {i}")
+            for i, place_id in enumerate(ids)])
+        db.session.commit()
+    return ids
+
+
+def _delete_places(app, ids):
+    with app.app_context():
+        db.session.execute(text("DELETE FROM places WHERE id IN :ids")
+                           .bindparams(bindparam('ids', expanding=True)),
+                           {'ids': ids})
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--places', default='1m',
+                        help='scale of a generated dataset (10k, 100k, 1m...)')
+    parser.add_argument('--db', help='existing dataset (generated if missing)')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--like', action='store_true',
+                        help='also time the ?title= substring filter')
+    args = parser.parse_args()
+
+    path = args.db or os.path.join(tempfile.mkdtemp(), 'bench.db')
+    if not os.path.exists(path):
+        dataset.generate(path, dataset.parse_scale(args.places))
+    app = create_app(bench_config(path))
+    client = app.test_client()
+
+    with app.app_context():
+        places = db.session.execute(text("SELECT COUNT(*) FROM places")).scalar()
+        reviews = db.session.execute(text("SELECT COUNT(*) FROM reviews")).scalar()
+    print(f"{places} places, {reviews} reviews")
+    rare_ids = _add_rare_places(app)
+    try:
+        _run(app, client, args)
+    finally:
+        _delete_places(app, rare_ids)
+
+
+def _run(app, client, args):
+    print(f"{'query':<16} {'matches':>8} {'rank (ms)':>10} {'p50 (ms)':>10}")
+    matching = text(
+        "SELECT COUNT(*) FROM (SELECT rowid FROM places_fts WHERE places_fts "
+        "MATCH :query UNION SELECT places.rowid FROM reviews_fts JOIN reviews "
+        "ON reviews.rowid = reviews_fts.rowid JOIN places ON places.id = "
+        "reviews.place_id WHERE reviews_fts MATCH :query)")
+    ranking = text(place_repository._TEXT_SEARCH.format(
+        after='', newest=(place_repository._NEWEST
+                          if app.config['SEARCH_CANDIDATES'] else '')))
+    for name, query in QUERIES:
+        params = dict(query=match_query(words(query)),
+                      title_weight=place_repository.TITLE_WEIGHT,
+                      description_weight=place_repository.DESCRIPTION_WEIGHT,
+                      review_weight=place_repository.REVIEW_WEIGHT,
+                      candidates=app.config['SEARCH_CANDIDATES'], limit=21)
+        with app.app_context():
+            matches = db.session.execute(matching, params).scalar()
+            rank_ms = _time(lambda: db.session.execute(ranking, params).all(),
+                            max(1, args.repeat // 4))
+        url = f'/api/v1/places/search?q={query}&limit=20'
+        assert client.get(url).status_code == 200
+        print(f"{name:<16} {matches:>8} {rank_ms:>10.2f} "
+              f"{_time(lambda: client.get(url), args.repeat):>10.2f}")
+
+    if args.like:
+        url = '/api/v1/places/?title=penthouse&limit=20'
+        assert client.get(url).status_code == 200
+        print(f"{'title LIKE':<16} {'':>8} {'':>10} "
+              f"{_time(lambda: client.get(url), args.repeat):>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
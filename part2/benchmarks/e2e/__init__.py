@@ -0,0 +1,18 @@
+"""
+End-to-end benchmark suite.
+
+Generates a synthetic HBnB dataset into SQLite (`dataset`), replays the
+user flows of the part4 frontend against the real endpoints (`scenarios`),
+in-process through the test client or over HTTP (`runner`), and reports
+throughput, p50/p95/p99 latency and SQL statements per request, optionally
+compared with a stored baseline (`report`).
+
+Usage, from the part2 directory::
+
+    python -m benchmarks.e2e generate --scale 10k --db /tmp/hbnb-10k.db
+    python -m benchmarks.e2e run --db /tmp/hbnb-10k.db --flows 2000
+    python -m benchmarks.e2e run --db /tmp/hbnb-10k.db --mode http \\
+        --concurrency 16 --baseline local-http
+    python -m benchmarks.e2e run --db /tmp/hbnb-10k.db \\
+        --mix browse=70,view_place=30 --save-baseline local
+"""
@@ -0,0 +1,166 @@
+"""Command line of the end-to-end benchmark suite (see benchmarks.e2e)."""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.e2e import dataset, report, runner
+from benchmarks.e2e.scenarios import parse_mix
+
+
+def bench_config(path, overrides=()):
+    """Configuration of an app serving the dataset at path."""
+    from config import TestingConfig
+
+    options = {'SQLALCHEMY_DATABASE_URI': f'sqlite:///{path}'}
+    for item in overrides:
+        key, _, value = item.partition('=')
+        try:
+            options[key] = json.loads(value)
+        except ValueError:
+            options[key] = value
+    return type('BenchConfig', (TestingConfig,), options)
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(port, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"server on port {port} did not start")
+
+
+def cmd_generate(args):
+    dataset.generate(args.db, dataset.parse_scale(args.scale), seed=args.seed)
+
+
+def cmd_serve(args):
+    from werkzeug.serving import run_simple
+    from app import create_app
+    run_simple('127.0.0.1', args.port, create_app(bench_config(args.db, args.set)),
+               threaded=True)
+
+
+def _working_copy(path):
+    """Copy of the dataset, so that every run starts from the same data."""
+    copy = os.path.join(tempfile.mkdtemp(), os.path.basename(path))
+    for suffix in ('', '-wal'):
+        if os.path.exists(path + suffix):
+            shutil.copyfile(path + suffix, copy + suffix)
+    return copy
+
+
+def cmd_run(args):
+    manifest = dataset.load_manifest(args.db)
+    mix = parse_mix(args.mix)
+    # A server given by --url runs on its own database
+    db = args.db if args.in_place or args.url else _working_copy(args.db)
+    server = None
+    if args.mode == 'inprocess':
+        from app import create_app
+        client = runner.InProcessClient(create_app(bench_config(db, args.set)))
+    else:
+        url = args.url
+        if not url:
+            port = _free_port()
+            server = subprocess.Popen(
+                [sys.executable, '-m', 'benchmarks.e2e', 'serve', '--db', db,
+                 '--port', str(port),
+                 *(f'--set={item}' for item in args.set)],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            _wait_for(port)
+            url = f'http://127.0.0.1:{port}'
+        client = runner.HTTPClient(url)
+    try:
+        result = runner.run(client, manifest, mix, args.flows,
+                            concurrency=args.concurrency, seed=args.seed,
+                            warmup=args.warmup)
+    finally:
+        client.close()
+        if server:
+            server.terminate()
+            server.wait()
+        if db != args.db:
+            shutil.rmtree(os.path.dirname(db))
+
+    summary = report.summarize(result)
+    print(f"{manifest['places']} places, {args.mode}, concurrency "
+          f"{args.concurrency}, mix {mix}")
+    print(report.format_summary(summary))
+    if args.save_baseline:
+        path = report.save_baseline(args.save_baseline, summary, {
+            "places": manifest['places'], "seed": manifest['seed'],
+            "mode": args.mode, "concurrency": args.concurrency,
+            "flows": args.flows, "mix": mix, "set": args.set})
+        print(f"baseline written to {path}")
+    if args.baseline:
+        rows = report.compare(summary, report.load_baseline(args.baseline)
+                              ["summary"], args.tolerance)
+        print()
+        print(report.format_comparison(rows))
+        if any(regressed for *_, regressed in rows):
+            sys.exit(1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.e2e',
+                                     description=__doc__)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    generate = commands.add_parser('generate', help="write a dataset")
+    generate.add_argument('--scale', default='10k',
+                          help="places: 10k, 100k, 1m or a number")
+    generate.add_argument('--db', required=True, help="new SQLite file")
+    generate.add_argument('--seed', type=int, default=42)
+    generate.set_defaults(func=cmd_generate)
+
+    run = commands.add_parser('run', help="run the scenarios")
+    run.add_argument('--db', required=True, help="generated SQLite file")
+    run.add_argument('--mode', choices=['inprocess', 'http'],
+                     default='inprocess')
+    run.add_argument('--url', help="server to drive in http mode "
+                     "(by default one is started on the dataset)")
+    run.add_argument('--flows', type=int, default=1000,
+                     help="number of scenarios to run")
+    run.add_argument('--warmup', type=int, default=100)
+    run.add_argument('--concurrency', type=int, default=1)
+    run.add_argument('--mix', help="weights, e.g. browse=50,view_place=50")
+    run.add_argument('--seed', type=int, default=1)
+    run.add_argument('--in-place', action='store_true',
+                     help="write to the dataset instead of a copy of it")
+    run.add_argument('--set', action='append', default=[], metavar='KEY=VALUE',
+                     help="configuration override, e.g. RESPONSE_CACHE=true")
+    run.add_argument('--baseline', help="baseline to compare with "
+                     "(name under benchmarks/baselines or .json path)")
+    run.add_argument('--save-baseline', metavar='NAME')
+    run.add_argument('--tolerance', type=float, default=0.25,
+                     help="allowed p95 growth before a regression")
+    run.set_defaults(func=cmd_run)
+
+    serve = commands.add_parser('serve', help=argparse.SUPPRESS)
+    serve.add_argument('--db', required=True)
+    serve.add_argument('--port', type=int, required=True)
+    serve.add_argument('--set', action='append', default=[])
+    serve.set_defaults(func=cmd_serve)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
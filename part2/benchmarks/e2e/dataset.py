@@ -0,0 +1,280 @@
+"""
+Synthetic HBnB dataset generator.
+
+Writes users, amenities, places and reviews straight into a SQLite file
+with `executemany` (the models' validation and hashing are skipped, so a
+million places take minutes, not hours). The data is shaped like real
+traffic:
+
+- places are clustered around a few cities, with log-normal prices and
+  zero to eight amenities, popular amenities being more frequent;
+- reviews follow a Zipf distribution over places (a few places get most
+  of them) and over users, with ratings skewed towards 4 and 5, at most
+  one per user and place;
+- the rating aggregates of the places are filled in, as the facade would.
+
+Every user has the password BENCH_PASSWORD. A manifest (`<db>.json`) records
+the scale, the seed and samples of ids for the scenarios.
+"""
+
+import bisect
+import itertools
+import json
+import os
+import random
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from app.geo import grid_cell
+
+BENCH_PASSWORD = "Password123"
+SCALES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+BATCH = 10_000
+
+CITIES = [
+    ("Paris", 48.86, 2.35), ("New York", 40.71, -74.01),
+    ("Tokyo", 35.68, 139.69), ("Bogota", 4.71, -74.07),
+    ("Sydney", -33.87, 151.21), ("Cape Town", -33.92, 18.42),
+    ("Lisbon", 38.72, -9.14), ("Mexico City", 19.43, -99.13),
+    ("Montevideo", -34.90, -56.16), ("Reykjavik", 64.15, -21.94),
+    ("Bangkok", 13.76, 100.50), ("Vancouver", 49.28, -123.12),
+]
+AMENITIES = [
+    "WiFi", "Kitchen", "Air Conditioning", "Heating", "Washer", "Dryer",
+    "Free Parking", "Pool", "Hot Tub", "Gym", "TV", "Workspace",
+    "Fireplace", "BBQ", "Balcony", "Garden", "Sea View", "Mountain View",
+    "Pet Friendly", "Crib", "EV Charger", "Sauna", "Elevator", "Breakfast",
+    "Bicycles", "Kayak", "Beach Access", "Ski-in/Ski-out", "Piano",
+    "Game Console", "Coffee Maker", "Dishwasher", "Iron", "Hair Dryer",
+    "Smoke Alarm", "First Aid Kit", "Lockbox", "Patio", "Hammock", "Library",
+]
+KINDS = ["Apartment", "Loft", "Cabin", "Villa", "Studio", "Cottage",
+         "Townhouse", "Bungalow", "Room", "Penthouse"]
+ADJECTIVES = ["Cozy", "Sunny", "Quiet", "Modern", "Rustic", "Charming",
+              "Spacious", "Bright", "Elegant", "Hidden", "Historic", "Tiny"]
+PHRASES = [
+    "close to the old town", "with a view over the river",
+    "a short walk from the metro", "next to the beach",
+    "surrounded by gardens", "in a lively neighbourhood",
+    "with a fully equipped kitchen", "ideal for families",
+    "perfect for remote work", "with fast internet",
+    "on a quiet street", "near great restaurants",
+]
+REVIEW_PHRASES = {
+    1: ["Very disappointing", "Dirty and noisy", "Nothing like the photos"],
+    2: ["Not great", "The bed was uncomfortable", "Hard to find"],
+    3: ["It was fine", "Decent for the price", "Average stay"],
+    4: ["Nice place", "Good location", "Would come back"],
+    5: ["Wonderful stay", "The host was amazing", "Perfect in every way"],
+}
+RATING_WEIGHTS = list(itertools.accumulate([5, 7, 13, 30, 45]))
+
+
+def parse_scale(scale):
+    """Number of places of a scale name ('10k', '100k', '1m') or number."""
+    return SCALES.get(str(scale).lower()) or int(scale)
+
+
+def manifest_path(path):
+    return f"{os.path.splitext(path)[0]}.json"
+
+
+def load_manifest(path):
+    """Manifest written next to a generated database."""
+    with open(manifest_path(path)) as f:
+        return json.load(f)
+
+
+def _zipf_cumulative(count, exponent):
+    """Cumulative weights of a Zipf distribution over `count` ranks."""
+    return list(itertools.accumulate(1 / (rank ** exponent)
+                                     for rank in range(1, count + 1)))
+
+
+def _timestamps(rng, count, start, span_seconds):
+    """`count` increasing timestamps in SQLAlchemy's SQLite format."""
+    offsets = sorted(rng.random() * span_seconds for _ in range(count))
+    return [(start + timedelta(seconds=offset)).strftime('%Y-%m-%d %H:%M:%S.%f')
+            for offset in offsets]
+
+
+def _insert(conn, table, columns, rows):
+    sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+           f"VALUES ({', '.join('?' * len(columns))})")
+    rows = iter(rows)
+    while True:
+        batch = list(itertools.islice(rows, BATCH))
+        if not batch:
+            return
+        conn.executemany(sql, batch)
+
+
+def _create_schema(path):
+    """Create the tables through the app; return the password hash."""
+    from app import create_app, db
+    from app.extensions import password_hasher
+    from config import TestingConfig
+
+    class DatasetConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = f'sqlite:///{path}'
+        SQLITE_READONLY_POOL = False
+
+    app = create_app(DatasetConfig)
+    with app.app_context():
+        password = password_hasher.hash(BENCH_PASSWORD)
+        db.engine.dispose()
+    return password
+
+
+def generate(path, places, seed=42, users=None, reviews=None, log=print):
+    """
+    Write a dataset of `places` places into a new SQLite file at path.
+
+    Args:
+        path: Database file; it must not exist.
+        places: Number of places.
+        seed: Random seed; the same seed writes the same data.
+        users: Number of users (places / 5 by default, at least 20).
+        reviews: Number of reviews (twice the places by default).
+        log: Progress callback.
+
+    Returns:
+        dict: The manifest, also written to `<db>.json`.
+    """
+    if os.path.exists(path):
+        raise FileExistsError(path)
+    rng = random.Random(seed)
+    users = users or max(20, places // 5)
+    reviews = min(reviews if reviews is not None else places * 2,
+                  users * places // 2)
+    started = time.perf_counter()
+    password = _create_schema(path)
+    start = datetime(2023, 1, 1)
+    span = 3 * 365 * 86400
+
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=MEMORY")
+    conn.execute("PRAGMA synchronous=OFF")
+
+    user_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                for _ in range(users)]
+    user_dates = _timestamps(rng, users, start, span)
+    _insert(conn, 'users', (
+        'id', 'first_name', 'last_name', 'email', 'password', 'is_admin',
+        'created_at', 'updated_at'), (
+        (user_id, "Bench", f"User{i}", f"user{i}@bench.example", password,
+         1 if i == 0 else 0, user_dates[i], user_dates[i])
+        for i, user_id in enumerate(user_ids)))
+    log(f"users: {users}")
+
+    amenity_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                   for _ in AMENITIES]
+    _insert(conn, 'amenities', ('id', 'name', 'created_at', 'updated_at'), (
+        (amenity_id, name, user_dates[0], user_dates[0])
+        for amenity_id, name in zip(amenity_ids, AMENITIES)))
+    amenity_weights = _zipf_cumulative(len(AMENITIES), 0.8)
+
+    # Reviews first: the place rows carry their aggregates
+    place_ids = [str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                 for _ in range(places)]
+    owners = [rng.randrange(users) for _ in range(places)]
+    place_weights = _zipf_cumulative(places, 1.1)
+    user_weights = _zipf_cumulative(users, 0.9)
+    # Popularity is not tied to the creation order
+    popularity = list(range(places))
+    rng.shuffle(popularity)
+    histograms = [[0] * 5 for _ in range(places)]
+    pairs = set()
+    review_rows = []
+    attempts = 0
+    while len(review_rows) < reviews and attempts < reviews * 3:
+        attempts += 1
+        place = popularity[bisect.bisect(place_weights,
+                                         rng.random() * place_weights[-1])]
+        user = bisect.bisect(user_weights, rng.random() * user_weights[-1])
+        if user == owners[place] or (user, place) in pairs:
+            continue
+        pairs.add((user, place))
+        rating = rng.choices(range(1, 6), cum_weights=RATING_WEIGHTS)[0]
+        histograms[place][rating - 1] += 1
+        review_rows.append([
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            f"{rng.choice(REVIEW_PHRASES[rating])}, "
+            f"{rng.choice(PHRASES)}.",
+            rating, user_ids[user], place_ids[place]])
+    del pairs
+
+    place_dates = _timestamps(rng, places, start, span)
+
+    def place_rows():
+        for i, place_id in enumerate(place_ids):
+            city, lat, lon = rng.choice(CITIES)
+            latitude = max(-90.0, min(90.0, rng.gauss(lat, 0.3)))
+            longitude = max(-180.0, min(180.0, rng.gauss(lon, 0.3)))
+            price = round(min(2000.0, max(10.0, rng.lognormvariate(4.7, 0.6))), 2)
+            histogram = histograms[i]
+            count = sum(histogram)
+            total = sum(r * n for r, n in zip(range(1, 6), histogram))
+            yield (place_id,
+                   f"{rng.choice(ADJECTIVES)} {rng.choice(KINDS)} in {city}",
+                   f"{rng.choice(ADJECTIVES)} place {rng.choice(PHRASES)}, "
+                   f"{rng.choice(PHRASES)}.",
+                   price, latitude, longitude, user_ids[owners[i]],
+                   grid_cell(latitude, longitude), count, total,
+                   round(total / count, 2) if count else 0.0, *histogram,
+                   place_dates[i], place_dates[i])
+
+    _insert(conn, 'places', (
+        'id', 'title', 'description', 'price', 'latitude', 'longitude',
+        'owner_id', 'geo_cell', 'review_count', 'rating_sum',
+        'rating_average', 'rating_count_1', 'rating_count_2',
+        'rating_count_3', 'rating_count_4', 'rating_count_5', 'created_at',
+        'updated_at'), place_rows())
+    log(f"places: {places}")
+
+    def place_amenity_rows():
+        for place_id in place_ids:
+            chosen = {bisect.bisect(amenity_weights,
+                                    rng.random() * amenity_weights[-1])
+                      for _ in range(rng.randint(0, 8))}
+            for index in chosen:
+                yield place_id, amenity_ids[index]
+
+    _insert(conn, 'place_amenity', ('place_id', 'amenity_id'),
+            place_amenity_rows())
+
+    review_dates = _timestamps(rng, len(review_rows), start, span)
+    _insert(conn, 'reviews', (
+        'id', 'text', 'rating', 'user_id', 'place_id', 'created_at',
+        'updated_at'), (
+        (*row, review_dates[i], review_dates[i])
+        for i, row in enumerate(review_rows)))
+    log(f"reviews: {len(review_rows)}")
+    conn.commit()
+    conn.execute("ANALYZE")
+    conn.close()
+
+    sample = random.Random(seed + 1)
+    manifest = {
+        "seed": seed,
+        "places": places,
+        "users": users,
+        "reviews": len(review_rows),
+        "amenities": len(AMENITIES),
+        "password": BENCH_PASSWORD,
+        "place_ids": sample.sample(place_ids, min(1000, places)),
+        # The most reviewed places, for the hot paths
+        "popular_place_ids": [place_ids[popularity[rank]]
+                              for rank in range(min(50, places))],
+        "user_emails": [f"user{i}@bench.example"
+                        for i in sample.sample(range(users), min(500, users))],
+        "max_prices": [50, 100, 150, 200, 300, 500],
+        "cities": [[city, lat, lon] for city, lat, lon in CITIES],
+        "seconds": round(time.perf_counter() - started, 1),
+    }
+    with open(manifest_path(path), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    log(f"written in {manifest['seconds']} s")
+    return manifest
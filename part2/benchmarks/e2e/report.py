@@ -0,0 +1,129 @@
+"""
+Summaries of a run and comparison with stored baselines.
+
+A summary has one row per request label (count, errors, p50/p95/p99 and
+mean latency in milliseconds, mean SQL statements) and a `total` row with
+the throughput. Baselines are summaries saved as JSON under
+`benchmarks/baselines/<name>.json`; a label regresses when its p95 grows
+by more than the tolerance or it runs more statements than before.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+from datetime import datetime, timezone
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'baselines')
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return 0.0
+    return values[max(1, math.ceil(fraction * len(values))) - 1]
+
+
+def _row(samples):
+    latencies = sorted(s.ms for s in samples)
+    queries = [s.queries for s in samples if s.queries is not None]
+    return {
+        "count": len(samples),
+        "errors": sum(not s.ok for s in samples),
+        "p50": round(percentile(latencies, 0.50), 2),
+        "p95": round(percentile(latencies, 0.95), 2),
+        "p99": round(percentile(latencies, 0.99), 2),
+        "mean": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+        "queries": round(statistics.fmean(queries), 2) if queries else None,
+    }
+
+
+def summarize(result):
+    """Summary of a runner.Run, by label."""
+    labels = {}
+    for sample in result.samples:
+        labels.setdefault(sample.label, []).append(sample)
+    summary = {label: _row(samples) for label, samples in sorted(labels.items())}
+    total = _row(result.samples)
+    total["rps"] = round(len(result.samples) / result.seconds, 1)
+    total["flows_per_s"] = round(result.flows / result.seconds, 1)
+    summary["total"] = total
+    return summary
+
+
+def format_summary(summary):
+    lines = [f"{'request':<18} {'count':>6} {'errors':>6} {'p50':>8} "
+             f"{'p95':>8} {'p99':>8} {'queries':>8}"]
+    for label, row in summary.items():
+        queries = '-' if row["queries"] is None else f'{row["queries"]:.1f}'
+        lines.append(f"{label:<18} {row['count']:>6} {row['errors']:>6} "
+                     f"{row['p50']:>8.1f} {row['p95']:>8.1f} "
+                     f"{row['p99']:>8.1f} {queries:>8}")
+    total = summary["total"]
+    lines.append(f"{total['rps']} requests/s, {total['flows_per_s']} "
+                 "scenarios/s (latencies in ms)")
+    return "\n".join(lines)
+
+
+def baseline_path(name):
+    return name if name.endswith('.json') else os.path.join(
+        BASELINE_DIR, f"{name}.json")
+
+
+def save_baseline(name, summary, meta):
+    """Store a summary with the settings of its run; return the path."""
+    path = baseline_path(name)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    document = {
+        "meta": dict(meta, python=platform.python_version(),
+                     machine=platform.machine(),
+                     recorded_at=datetime.now(timezone.utc).isoformat(
+                         timespec='seconds')),
+        "summary": summary,
+    }
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2)
+        f.write("\n")
+    return path
+
+
+def load_baseline(name):
+    with open(baseline_path(name)) as f:
+        return json.load(f)
+
+
+def compare(summary, baseline, tolerance=0.25):
+    """
+    Compare a summary with a baseline summary.
+
+    Returns:
+        list: (label, metric, baseline, current, regressed) for the p95
+        latency and the statement count of every label in both.
+    """
+    rows = []
+    for label, before in baseline.items():
+        after = summary.get(label)
+        if after is None or label == "total":
+            continue
+        rows.append((label, 'p95', before["p95"], after["p95"],
+                     after["p95"] > before["p95"] * (1 + tolerance)))
+        if before.get("queries") is not None and after["queries"] is not None:
+            rows.append((label, 'queries', before["queries"], after["queries"],
+                         after["queries"] > before["queries"] + 0.5))
+    if "total" in baseline:
+        before, after = baseline["total"]["rps"], summary["total"]["rps"]
+        rows.append(("total", 'rps', before, after,
+                     after < before / (1 + tolerance)))
+    return rows
+
+
+def format_comparison(rows):
+    lines = [f"{'request':<18} {'metric':<8} {'baseline':>9} {'current':>9} "
+             f"{'change':>8}"]
+    for label, metric, before, after, regressed in rows:
+        change = (after - before) / before * 100 if before else 0.0
+        lines.append(f"{label:<18} {metric:<8} {before:>9.1f} {after:>9.1f} "
+                     f"{change:>+7.0f}%{'  REGRESSION' if regressed else ''}")
+    return "\n".join(lines)
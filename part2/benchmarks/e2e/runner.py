@@ -0,0 +1,185 @@
+"""
+Scenario runner.
+
+Runs a weighted mix of scenarios from a pool of worker threads, each with
+its own session (and its own test client or HTTP connection), and records
+one sample per request: label, status, latency and SQL statement count.
+
+Two clients drive the API:
+    InProcessClient  Flask's test client on an app built in this process;
+                     statements are counted on every SQLAlchemy engine.
+    HTTPClient       keep-alive HTTP connections to a running server; the
+                     count comes from the X-Query-Count response header
+                     when the server sends one.
+"""
+
+import http.client
+import json
+import random
+import threading
+import time
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from benchmarks.e2e.scenarios import SCENARIOS
+
+
+class Sample(NamedTuple):
+    label: str
+    status: int
+    ms: float
+    queries: Optional[int]
+    ok: bool
+
+
+class Response(NamedTuple):
+    status: int
+    body: bytes
+
+    def json(self):
+        return json.loads(self.body) if self.body else None
+
+
+class InProcessClient:
+    """Sends requests to an application through its test client."""
+
+    name = 'inprocess'
+
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+        event.listen(Engine, 'before_cursor_execute', self._count)
+
+    def _count(self, *args):
+        self._local.queries = getattr(self._local, 'queries', 0) + 1
+
+    def transport(self):
+        """Send function of one session."""
+        client = self.app.test_client()
+
+        def send(method, path, body, headers):
+            self._local.queries = 0
+            response = client.open(path, method=method, data=body,
+                                   headers=headers)
+            return response.status_code, response.get_data(), self._local.queries
+        return send
+
+    def close(self):
+        event.remove(Engine, 'before_cursor_execute', self._count)
+
+
+class HTTPClient:
+    """Sends requests to a server over keep-alive HTTP connections."""
+
+    name = 'http'
+
+    def __init__(self, base_url):
+        url = urlsplit(base_url)
+        self.host, self.port = url.hostname, url.port or 80
+        self.prefix = url.path.rstrip('/')
+
+    def transport(self):
+        connection = http.client.HTTPConnection(self.host, self.port,
+                                                timeout=30)
+
+        def send(method, path, body, headers):
+            connection.request(method, self.prefix + path, body=body,
+                               headers=headers)
+            response = connection.getresponse()
+            data = response.read()
+            queries = response.getheader('X-Query-Count')
+            return (response.status, data,
+                    int(queries) if queries is not None else None)
+        return send
+
+    def close(self):
+        pass
+
+
+class Session:
+    """State of one simulated browser."""
+
+    def __init__(self, send, manifest, samples):
+        self.send = send
+        self.manifest = manifest
+        self.samples = samples
+        self.token = None
+
+    def request(self, label, method, path, json=None, expected=(200,)):
+        headers = {}
+        body = None
+        if json is not None:
+            body = _json_dumps(json)
+            headers['Content-Type'] = 'application/json'
+        if self.token:
+            headers['Authorization'] = f'Bearer {self.token}'
+        start = time.perf_counter()
+        status, data, queries = self.send(method, path, body, headers)
+        ms = (time.perf_counter() - start) * 1000
+        self.samples.append(Sample(label, status, ms, queries,
+                                   status in expected))
+        return Response(status, data)
+
+
+def _json_dumps(value):
+    return json.dumps(value).encode()
+
+
+class Run(NamedTuple):
+    samples: list
+    flows: int
+    seconds: float
+
+
+def run(client, manifest, mix, flows, concurrency=1, seed=1, warmup=0):
+    """
+    Run `flows` scenarios picked from mix on `concurrency` threads.
+
+    Args:
+        client: InProcessClient or HTTPClient.
+        manifest: Manifest of the dataset (ids and credentials).
+        mix: Weights by scenario name.
+        flows: Number of scenarios to run.
+        concurrency: Number of worker threads.
+        seed: Seed of the scenario choices.
+        warmup: Scenarios run first and left out of the samples.
+
+    Returns:
+        Run: The samples and the wall time of the measured scenarios.
+    """
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    if warmup:
+        run(client, manifest, mix, warmup, concurrency, seed + 1000)
+
+    remaining = iter(range(flows))
+    lock = threading.Lock()
+    results = []
+
+    def worker(index):
+        rng = random.Random(seed * 1000 + index)
+        samples = []
+        session = Session(client.transport(), manifest, samples)
+        while True:
+            with lock:
+                if next(remaining, None) is None:
+                    break
+            try:
+                SCENARIOS[rng.choices(names, weights)[0]](session, rng)
+            except (OSError, http.client.HTTPException):
+                samples.append(Sample('connection_error', 0, 0.0, None, False))
+                session.send = client.transport()
+        results.append(samples)
+
+    threads = [threading.Thread(target=worker, args=(i,))
+               for i in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+    return Run([s for samples in results for s in samples], flows, seconds)
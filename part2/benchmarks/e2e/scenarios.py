@@ -0,0 +1,110 @@
+"""
+Scenarios replaying the flows of the part4 frontend.
+
+Each scenario is a function `(session, rng)` issuing the requests of one
+user flow through `session.request(label, method, path, ...)`; the label
+groups the samples in the report. The session keeps the state a browser
+would (the token of the signed-in user).
+
+    browse      index.html: first page of places, optionally filtered by
+                maximum price, then "Load more" with the cursor
+    view_place  place.html: a place (popular ones more often) and its
+                reviews
+    login       login.html: sign in, then the protected endpoint
+    add_review  add_review.html: the place, then a new review (signs in
+                first when needed)
+    register    register.html: create an account
+"""
+
+import uuid
+
+DEFAULT_MIX = {'browse': 40, 'view_place': 35, 'login': 10, 'add_review': 10,
+               'register': 5}
+
+
+def parse_mix(value):
+    """Parse 'browse=50,view_place=50' into weights by scenario name."""
+    if not value:
+        return dict(DEFAULT_MIX)
+    mix = {}
+    for item in value.split(','):
+        name, _, weight = item.partition('=')
+        name = name.strip()
+        if name not in SCENARIOS:
+            raise ValueError(f"Unknown scenario: {name} "
+                             f"(available: {', '.join(SCENARIOS)})")
+        mix[name] = float(weight) if weight else 1.0
+    return mix
+
+
+def _place_id(session, rng):
+    """A place id, popular places being picked half of the time."""
+    manifest = session.manifest
+    if rng.random() < 0.5:
+        return rng.choice(manifest['popular_place_ids'])
+    return rng.choice(manifest['place_ids'])
+
+
+def _sign_in(session, rng):
+    email = rng.choice(session.manifest['user_emails'])
+    response = session.request('login', 'POST', '/api/v1/auth/login', json={
+        "email": email, "password": session.manifest['password']})
+    if response.status == 200:
+        session.token = response.json()['access_token']
+    return response
+
+
+def browse(session, rng):
+    query = ''
+    if rng.random() < 0.4:
+        query = f"?max_price={rng.choice(session.manifest['max_prices'])}"
+    response = session.request('list_places', 'GET', f'/api/v1/places/{query}')
+    pages = rng.choice((0, 0, 1, 2))
+    for _ in range(pages):
+        cursor = response.json().get('next_cursor') if response.status == 200 else None
+        if not cursor:
+            break
+        separator = '&' if query else '?'
+        response = session.request(
+            'list_places_next', 'GET',
+            f'/api/v1/places/{query}{separator}cursor={cursor}')
+
+
+def view_place(session, rng):
+    place_id = _place_id(session, rng)
+    session.request('get_place', 'GET', f'/api/v1/places/{place_id}')
+    session.request('place_reviews', 'GET', f'/api/v1/places/{place_id}/reviews')
+
+
+def login(session, rng):
+    if _sign_in(session, rng).status == 200:
+        session.request('protected', 'GET', '/api/v1/auth/protected')
+
+
+def add_review(session, rng):
+    if not session.token and _sign_in(session, rng).status != 200:
+        return
+    place_id = rng.choice(session.manifest['place_ids'])
+    session.request('get_place', 'GET', f'/api/v1/places/{place_id}')
+    # Reviewing one's own place or twice the same place is refused (400)
+    session.request('create_review', 'POST',
+                    f'/api/v1/places/{place_id}/reviews',
+                    json={"text": "Lovely place, would stay again.",
+                          "rating": rng.randint(1, 5)},
+                    expected=(201, 400))
+
+
+def register(session, rng):
+    session.request('register', 'POST', '/api/v1/users/', json={
+        "first_name": "New", "last_name": "Visitor",
+        "email": f"visitor-{uuid.uuid4().hex}@bench.example",
+        "password": session.manifest['password']}, expected=(201,))
+
+
+SCENARIOS = {
+    'browse': browse,
+    'view_place': view_place,
+    'login': login,
+    'add_review': add_review,
+    'register': register,
+}
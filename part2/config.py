@@ -1,15 +1,151 @@
 import os
+from datetime import timedelta
 
 class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'default_secret_key')
+
+    # Access tokens carry the user's roles, so they are short-lived and
+    # renewed with a refresh token; revoked tokens are kept in a store
+    # ('simple', in process, or 'redis'). Outside debug and testing mode
+    # 'simple' requires WEB_CONCURRENCY=1 (one worker process)
+    JWT_ACCESS_TOKEN_EXPIRES = timedelta(
+        minutes=int(os.getenv('JWT_ACCESS_TOKEN_MINUTES', 15)))
+    JWT_REFRESH_TOKEN_EXPIRES = timedelta(
+        days=int(os.getenv('JWT_REFRESH_TOKEN_DAYS', 30)))
+    TOKEN_REVOCATION_STORE = os.getenv('TOKEN_REVOCATION_STORE', 'simple')
+    WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 0)) or None
     DEBUG = False
 
+    # Entity cache in front of the facade getters ('simple', 'redis' or 'null')
+    CACHE_TYPE = os.getenv('CACHE_TYPE', 'simple')
+    CACHE_DEFAULT_TIMEOUT = int(os.getenv('CACHE_DEFAULT_TIMEOUT', 300))
+    CACHE_MAX_ENTRIES = int(os.getenv('CACHE_MAX_ENTRIES', 10000))
+    CACHE_REDIS_URL = os.getenv('CACHE_REDIS_URL', 'redis://localhost:6379/0')
+
+    # Seconds before the in-memory amenity catalog is reloaded even without
+    # a local write (bounds staleness across worker processes)
+    AMENITY_CATALOG_TTL = float(os.getenv('AMENITY_CATALOG_TTL', 60))
+
+    # Password hashing: bcrypt cost and the process pool running it
+    # (PASSWORD_HASH_WORKERS=0 hashes in the request thread)
+    BCRYPT_LOG_ROUNDS = int(os.getenv('BCRYPT_LOG_ROUNDS', 12))
+    PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', os.cpu_count() or 1))
+    PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 64))
+    PASSWORD_HASH_TIMEOUT = float(os.getenv('PASSWORD_HASH_TIMEOUT', 10))
+
+    # SQLite connection settings, run on every new connection. WAL lets
+    # readers proceed while a write is committing; busy_timeout makes
+    # writers wait for the lock instead of failing with "database is locked"
+    SQLITE_PRAGMAS = {
+        'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+        'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+        'busy_timeout': int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+        'mmap_size': int(os.getenv('SQLITE_MMAP_SIZE', 256 * 1024 * 1024)),
+        'cache_size': -int(os.getenv('SQLITE_CACHE_SIZE_KIB', 64 * 1024)),
+        'temp_store': 'MEMORY',
+    }
+
+    # Connection pools of file-backed databases
+    SQLALCHEMY_POOL_SIZE = int(os.getenv('SQLALCHEMY_POOL_SIZE', 5))
+    SQLALCHEMY_MAX_OVERFLOW = int(os.getenv('SQLALCHEMY_MAX_OVERFLOW', 10))
+    SQLALCHEMY_POOL_TIMEOUT = float(os.getenv('SQLALCHEMY_POOL_TIMEOUT', 10))
+    # Separate read-only pool serving GET requests
+    SQLITE_READONLY_POOL = os.getenv('SQLITE_READONLY_POOL', '1') == '1'
+    SQLITE_READONLY_POOL_SIZE = int(os.getenv('SQLITE_READONLY_POOL_SIZE', 10))
+
+    # Read replicas for repository reads (comma-separated URLs), and how long
+    # a user's reads stay on the primary after they write
+    SQLALCHEMY_REPLICA_URIS = [
+        uri for uri in os.getenv('SQLALCHEMY_REPLICA_URIS', '').split(',') if uri]
+    REPLICA_STICKY_SECONDS = float(os.getenv('REPLICA_STICKY_SECONDS', 5))
+
+    # Cache-Control of GET responses by API namespace: public data is
+    # revalidated with its ETag on every use, the amenity catalog may be
+    # reused for a minute, personal data is never stored
+    HTTP_CACHE_CONTROL = {
+        'places': 'public, no-cache',
+        'reviews': 'public, no-cache',
+        'amenities': 'public, max-age=60',
+        'users': 'private, no-store',
+        'auth': 'no-store',
+        'admin': 'no-store',
+    }
+
+    # JSON encoder of API responses: 'auto' uses orjson when installed,
+    # 'json' the standard library
+    JSON_ENCODER = os.getenv('JSON_ENCODER', 'auto')
+
+    # Cache of whole responses to anonymous GETs of public data (opt-in):
+    # fresh for RESPONSE_CACHE_TTL seconds, then served stale for up to
+    # RESPONSE_CACHE_STALE_TTL more while it is refreshed in the background
+    RESPONSE_CACHE = os.getenv('RESPONSE_CACHE', '0') == '1'
+    RESPONSE_CACHE_TYPE = os.getenv('RESPONSE_CACHE_TYPE', 'simple')
+    RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES',
+                                             32 * 1024 * 1024))
+    RESPONSE_CACHE_TTL = int(os.getenv('RESPONSE_CACHE_TTL', 30))
+    RESPONSE_CACHE_STALE_TTL = int(os.getenv('RESPONSE_CACHE_STALE_TTL', 300))
+    RESPONSE_CACHE_ENDPOINTS = (
+        'places_place_list',
+        'places_place_search',
+        'places_place_resource',
+        'places_place_reviews',
+        'reviews_place_reviews',
+        'reviews_review_resource',
+        'amenities_amenity_list',
+        'amenities_amenity_resource',
+    )
+
+    # What create_app checks about the database: its Alembic revision
+    # ('warn', 'error' or 'off'), unless the schema is created from the
+    # models (in-memory databases, which have no migrations)
+    SCHEMA_CHECK = os.getenv('SCHEMA_CHECK', 'warn')
+    SCHEMA_AUTO_CREATE = False
+
+    # Full-text search ranks every match by default; a positive value caps
+    # the ranked matches to the newest of each table, for tables where a
+    # common word matches too many rows to rank them all per request
+    SEARCH_CANDIDATES = int(os.getenv('SEARCH_CANDIDATES', 0))
+
+    # API namespaces to register (comma-separated), all by default
+    API_NAMESPACES = [name for name in os.getenv('API_NAMESPACES', '').split(',')
+                      if name] or None
+
+    # Per-request statement count and DB, serialization and auth time.
+    # SERVER_TIMING sends them as Server-Timing/X-Query-Count headers (by
+    # default in debug and testing mode only); requests slower than
+    # SLOW_REQUEST_MS are logged with their SQL (0 disables the log)
+    REQUEST_PROFILING = os.getenv('REQUEST_PROFILING', '1') == '1'
+    SERVER_TIMING = (None if os.getenv('SERVER_TIMING') is None
+                     else os.getenv('SERVER_TIMING') == '1')
+    SLOW_REQUEST_MS = float(os.getenv('SLOW_REQUEST_MS', 500))
+    SLOW_REQUEST_MAX_STATEMENTS = int(os.getenv('SLOW_REQUEST_MAX_STATEMENTS', 50))
+
+    # Prometheus metrics at /metrics; with several worker processes, each
+    # one writes its values to METRICS_DIR (shared, emptied at startup)
+    # every METRICS_FLUSH_SECONDS and the scrape adds them up
+    METRICS = os.getenv('METRICS', '1') == '1'
+    METRICS_DIR = os.getenv('METRICS_DIR') or None
+    METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', 5))
+
+    # Log EXPLAIN QUERY PLAN of repository queries doing full table scans
+    INDEX_ADVISOR = False
+
 class DevelopmentConfig(Config):
     DEBUG = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///development.db'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    INDEX_ADVISOR = os.getenv('INDEX_ADVISOR', '1') == '1'
+
+class TestingConfig(Config):
+    TESTING = True
+    BCRYPT_LOG_ROUNDS = 4
+    PASSWORD_HASH_WORKERS = 0
+    SQLALCHEMY_DATABASE_URI = os.getenv('TEST_DATABASE_URL', 'sqlite://')
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SCHEMA_AUTO_CREATE = True
 
 config = {
     'development': DevelopmentConfig,
+    'testing': TestingConfig,
     'default': DevelopmentConfig
-}
\ No newline at end of file
+}
@@ -0,0 +1,28 @@
+"""index places for price and bounding box filters
+
+Revision ID: 047d77798f0e
+Revises: 14ebb66fb802
+Create Date: 2026-10-17 10:47:19.603821
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '047d77798f0e'
+down_revision = '14ebb66fb802'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.create_index('ix_places_price_id', ['price', 'id'], unique=False)
+        batch_op.create_index('ix_places_latitude_longitude', ['latitude', 'longitude'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.drop_index('ix_places_latitude_longitude')
+        batch_op.drop_index('ix_places_price_id')
@@ -0,0 +1,26 @@
+"""index places by creation date
+
+Revision ID: 14ebb66fb802
+Revises: b5cbe9ea7870
+Create Date: 2026-10-17 10:04:52.114378
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '14ebb66fb802'
+down_revision = 'b5cbe9ea7870'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.create_index('ix_places_created_at_id', ['created_at', 'id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.drop_index('ix_places_created_at_id')
@@ -0,0 +1,49 @@
+"""add rating aggregates to places
+
+Revision ID: 1da30a75ae26
+Revises: 6880f83e25d4
+Create Date: 2026-10-17 12:21:45.902716
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1da30a75ae26'
+down_revision = '6880f83e25d4'
+branch_labels = None
+depends_on = None
+
+COUNTERS = ['review_count', 'rating_sum'] + [f'rating_count_{r}' for r in range(1, 6)]
+
+
+def upgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        for name in COUNTERS:
+            batch_op.add_column(sa.Column(name, sa.Integer(), nullable=False, server_default='0'))
+        batch_op.add_column(sa.Column('rating_average', sa.Float(), nullable=False, server_default='0'))
+        batch_op.create_index('ix_places_rating_average_id', ['rating_average', 'id'], unique=False)
+
+    histogram = ', '.join(
+        f'rating_count_{r} = (SELECT COUNT(*) FROM reviews '
+        f'WHERE reviews.place_id = places.id AND reviews.rating = {r})'
+        for r in range(1, 6))
+    op.execute(
+        'UPDATE places SET '
+        'review_count = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id), '
+        'rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM reviews WHERE reviews.place_id = places.id), '
+        f'{histogram}'
+    )
+    op.execute(
+        'UPDATE places SET rating_average = '
+        'CASE WHEN review_count > 0 THEN CAST(rating_sum AS FLOAT) / review_count ELSE 0 END'
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.drop_index('ix_places_rating_average_id')
+        batch_op.drop_column('rating_average')
+        for name in reversed(COUNTERS):
+            batch_op.drop_column(name)
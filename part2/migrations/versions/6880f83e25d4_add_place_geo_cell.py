@@ -0,0 +1,39 @@
+"""add grid cell column to places
+
+Revision ID: 6880f83e25d4
+Revises: 047d77798f0e
+Create Date: 2026-10-17 11:36:02.287419
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6880f83e25d4'
+down_revision = '047d77798f0e'
+branch_labels = None
+depends_on = None
+
+# Must match app.geo
+GRID_CELL_DEGREES = 0.5
+GRID_ROWS = 360
+GRID_COLUMNS = 720
+
+
+def upgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('geo_cell', sa.Integer(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_places_geo_cell'), ['geo_cell'], unique=False)
+
+    op.execute(
+        "UPDATE places SET geo_cell = "
+        f"MIN(CAST((latitude + 90) / {GRID_CELL_DEGREES} AS INTEGER), {GRID_ROWS - 1}) * {GRID_COLUMNS} + "
+        f"MIN(CAST((longitude + 180) / {GRID_CELL_DEGREES} AS INTEGER), {GRID_COLUMNS - 1})"
+    )
+
+
+def downgrade():
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_places_geo_cell'))
+        batch_op.drop_column('geo_cell')
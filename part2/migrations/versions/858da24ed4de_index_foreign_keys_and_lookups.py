@@ -0,0 +1,108 @@
+"""index foreign keys and lookup columns
+
+Revision ID: 858da24ed4de
+Revises: 1da30a75ae26
+Create Date: 2026-10-17 15:02:11.284730
+
+A user may review a place only once: the upgrade stops, listing the
+(user_id, place_id) pairs, when the database has several reviews of a place
+by the same user. Remove the extra reviews first, or upgrade with
+`flask db upgrade -x delete_duplicate_reviews=true` to keep the oldest
+review of each pair; every deleted review is logged in full, and the
+downgrade does not restore them.
+
+"""
+import json
+import logging
+
+from alembic import context, op
+from alembic.util import CommandError
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '858da24ed4de'
+down_revision = '1da30a75ae26'
+branch_labels = None
+depends_on = None
+
+logger = logging.getLogger('alembic.env')
+
+DUPLICATE_REVIEW_PAIRS = (
+    'SELECT user_id, place_id, COUNT(*) AS reviews FROM reviews '
+    'GROUP BY user_id, place_id HAVING COUNT(*) > 1 '
+    'ORDER BY user_id, place_id'
+)
+
+# Every review of a (user, place) pair but the oldest
+NEWER_DUPLICATES = (
+    'EXISTS (SELECT 1 FROM reviews AS older '
+    'WHERE older.user_id = reviews.user_id AND older.place_id = reviews.place_id '
+    'AND (older.created_at < reviews.created_at '
+    'OR (older.created_at = reviews.created_at AND older.id < reviews.id)))'
+)
+
+
+def _recompute_rating_aggregates():
+    histogram = ', '.join(
+        f'rating_count_{r} = (SELECT COUNT(*) FROM reviews '
+        f'WHERE reviews.place_id = places.id AND reviews.rating = {r})'
+        for r in range(1, 6))
+    op.execute(
+        'UPDATE places SET '
+        'review_count = (SELECT COUNT(*) FROM reviews WHERE reviews.place_id = places.id), '
+        'rating_sum = (SELECT COALESCE(SUM(rating), 0) FROM reviews WHERE reviews.place_id = places.id), '
+        f'{histogram}'
+    )
+    op.execute(
+        'UPDATE places SET rating_average = '
+        'CASE WHEN review_count > 0 THEN CAST(rating_sum AS FLOAT) / review_count ELSE 0 END'
+    )
+
+
+def _delete_duplicate_reviews():
+    bind = op.get_bind()
+    pairs = bind.execute(sa.text(DUPLICATE_REVIEW_PAIRS)).all()
+    if not pairs:
+        return
+    if context.get_x_argument(as_dictionary=True).get(
+            'delete_duplicate_reviews') != 'true':
+        raise CommandError(
+            'Cannot add uq_reviews_user_id_place_id: some users reviewed a '
+            'place more than once (user_id, place_id, reviews):\n'
+            + '\n'.join(f'    {user_id}, {place_id}, {count}'
+                        for user_id, place_id, count in pairs)
+            + '\nDelete the extra reviews, or upgrade with '
+            '`-x delete_duplicate_reviews=true` to keep the oldest of each.')
+
+    duplicates = bind.execute(sa.text(
+        f'SELECT * FROM reviews WHERE {NEWER_DUPLICATES}')).mappings().all()
+    for review in duplicates:
+        logger.warning('Deleting duplicate review %s',
+                       json.dumps(dict(review), default=str))
+    bind.execute(sa.text(f'DELETE FROM reviews WHERE {NEWER_DUPLICATES}'))
+    _recompute_rating_aggregates()
+
+
+def upgrade():
+    _delete_duplicate_reviews()
+
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.create_index('ix_places_owner_id', ['owner_id'], unique=False)
+
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.create_index('uq_reviews_user_id_place_id', ['user_id', 'place_id'], unique=True)
+
+    with op.batch_alter_table('place_amenity', schema=None) as batch_op:
+        batch_op.create_index('ix_place_amenity_amenity_id', ['amenity_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('place_amenity', schema=None) as batch_op:
+        batch_op.drop_index('ix_place_amenity_amenity_id')
+
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.drop_index('uq_reviews_user_id_place_id')
+
+    with op.batch_alter_table('places', schema=None) as batch_op:
+        batch_op.drop_index('ix_places_owner_id')
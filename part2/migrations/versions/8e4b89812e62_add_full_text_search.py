@@ -0,0 +1,51 @@
+"""add full-text indexes of places and reviews
+
+Revision ID: 8e4b89812e62
+Revises: 858da24ed4de
+Create Date: 2026-10-17 17:40:12.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e4b89812e62'
+down_revision = '858da24ed4de'
+branch_labels = None
+depends_on = None
+
+# Must match app.search
+TOKENIZER = 'unicode61 remove_diacritics 2'
+INDEXES = {'places': ('title', 'description'), 'reviews': ('text',)}
+
+
+def _create_index(table, columns):
+    fts = f'{table}_fts'
+    names = ', '.join(columns)
+    new = ', '.join(f'new.{name}' for name in columns)
+    old = ', '.join(f'old.{name}' for name in columns)
+    delete = (f"INSERT INTO {fts}({fts}, rowid, {names}) "
+              f"VALUES ('delete', old.rowid, {old});")
+    insert = f"INSERT INTO {fts}(rowid, {names}) VALUES (new.rowid, {new});"
+    op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({names}, content='{table}', "
+               f"content_rowid='rowid', tokenize='{TOKENIZER}')")
+    op.execute(f"CREATE TRIGGER {fts}_insert AFTER INSERT ON {table} "
+               f"BEGIN {insert} END")
+    op.execute(f"CREATE TRIGGER {fts}_delete AFTER DELETE ON {table} "
+               f"BEGIN {delete} END")
+    op.execute(f"CREATE TRIGGER {fts}_update AFTER UPDATE OF {names} ON {table} "
+               f"BEGIN {delete} {insert} END")
+    op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+
+def upgrade():
+    for table, columns in INDEXES.items():
+        _create_index(table, columns)
+
+
+def downgrade():
+    for table in INDEXES:
+        for trigger in ('insert', 'delete', 'update'):
+            op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{trigger}")
+        op.execute(f"DROP TABLE IF EXISTS {table}_fts")
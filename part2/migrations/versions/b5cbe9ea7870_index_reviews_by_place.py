@@ -0,0 +1,26 @@
+"""index reviews by place and creation date
+
+Revision ID: b5cbe9ea7870
+Revises: d843faaa9ab9
+Create Date: 2026-10-17 09:31:07.550912
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b5cbe9ea7870'
+down_revision = 'd843faaa9ab9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.create_index('ix_reviews_place_id_created_at', ['place_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('reviews', schema=None) as batch_op:
+        batch_op.drop_index('ix_reviews_place_id_created_at')
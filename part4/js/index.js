@@ -95,27 +95,31 @@ function displayPlaces(places) {
     }
 
     container.innerHTML = places.map(place => createPlaceCard(place)).join('');
-    applyPriceFilter();
 }
 
 /**
- * Filter places by maximum price
+ * Build the query string of the places listing from the active filters
+ * @param {string|null} cursor - Cursor of the page to load
+ * @returns {string} Query string, including the leading '?' when not empty
  */
-function applyPriceFilter() {
+function buildPlacesQuery(cursor) {
+    const params = new URLSearchParams();
     const maxPrice = document.getElementById('max-price');
-    if (!maxPrice) return;
-
-    const value = maxPrice.value;
-    const cards = document.querySelectorAll('.place-card');
+    if (maxPrice && maxPrice.value !== 'all') {
+        params.set('max_price', maxPrice.value);
+    }
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    const query = params.toString();
+    return query ? `?${query}` : '';
+}
 
-    cards.forEach(card => {
-        const price = parseFloat(card.getAttribute('data-price'));
-        if (value === 'all' || price <= parseFloat(value)) {
-            card.style.display = 'block';
-        } else {
-            card.style.display = 'none';
-        }
-    });
+/**
+ * Filter places by maximum price (the filtering is done by the backend)
+ */
+function applyPriceFilter() {
+    fetchPlaces();
 }
 
 /**
@@ -137,12 +141,14 @@ function extractErrorMessage(data) {
 }
 
 /**
- * Load and display places from the backend
+ * Load and display a page of places from the backend
+ * @param {string|null} cursor - Cursor of the page to load, null for the first one
  */
-async function fetchPlaces() {
+async function fetchPlaces(cursor = null) {
     try {
         const token = window.auth.getCookie('token');
-        const response = await fetch(`${API_URL}/places/`, {
+        const url = `${API_URL}/places/${buildPlacesQuery(cursor)}`;
+        const response = await fetch(url, {
             headers: {
                 'Authorization': token ? `Bearer ${token}` : ''
             }
@@ -156,10 +162,17 @@ async function fetchPlaces() {
         const result = await response.json();
         
         // Store places in global variable for filtering
-        window.places = result.data;
+        window.places = cursor ? (window.places || []).concat(result.data) : result.data;
         
         // Display places
-        displayPlaces(result.data);
+        displayPlaces(window.places);
+
+        // Show the "Load more" button while there are more pages
+        window.nextCursor = result.next_cursor;
+        const loadMore = document.getElementById('load-more');
+        if (loadMore) {
+            loadMore.style.display = window.nextCursor ? 'block' : 'none';
+        }
         
         // Show admin actions if user is admin
         const isAdmin = checkAdminAccess();
@@ -192,4 +205,9 @@ document.addEventListener('DOMContentLoaded', () => {
     if (maxPrice) {
         maxPrice.addEventListener('change', applyPriceFilter);
     }
+
+    const loadMore = document.getElementById('load-more');
+    if (loadMore) {
+        loadMore.addEventListener('click', () => fetchPlaces(window.nextCursor));
+    }
 });
@@ -225,9 +225,10 @@ async function loadPlaceDetails() {
 }
 
 /**
- * Load reviews from the backend
+ * Load and display a page of reviews from the backend
+ * @param {string|null} cursor - Cursor of the page to load, null for the first one
  */
-async function loadReviews() {
+async function loadReviews(cursor = null) {
     const token = window.auth.getCookie('token');
     const headers = {
         'Content-Type': 'application/json'
@@ -238,7 +239,8 @@ async function loadReviews() {
     }
 
     try {
-        const response = await fetch(`${API_URL}/places/${placeId}/reviews`);
+        const query = cursor ? `?cursor=${encodeURIComponent(cursor)}` : '';
+        const response = await fetch(`${API_URL}/places/${placeId}/reviews${query}`);
         const data = await response.json();
 
         if (!response.ok) {
@@ -247,8 +249,16 @@ async function loadReviews() {
 
         // Acceder correctamente a las reviews en la estructura de datos
         const reviews = data.data?.reviews || [];
-        
-        displayReviews(reviews);
+        window.reviews = cursor ? (window.reviews || []).concat(reviews) : reviews;
+
+        displayReviews(window.reviews);
+
+        // Show the "Load more" button while there are more pages
+        window.nextReviewsCursor = data.data?.next_cursor;
+        const loadMore = document.getElementById('load-more-reviews');
+        if (loadMore) {
+            loadMore.style.display = window.nextReviewsCursor ? 'block' : 'none';
+        }
     } catch (error) {
         console.error('Error loading reviews:', error);
         showError('Error loading reviews.', 'reviews-container');
@@ -262,5 +272,10 @@ document.addEventListener('DOMContentLoaded', () => {
 
     // Load data
     loadPlaceDetails();
+
+    const loadMore = document.getElementById('load-more-reviews');
+    if (loadMore) {
+        loadMore.addEventListener('click', () => loadReviews(window.nextReviewsCursor));
+    }
 });
   
\ No newline at end of file